@@ -0,0 +1,118 @@
+import logging
+import math
+import threading
+from collections import OrderedDict, deque
+
+import cv2
+import numpy as np
+
+__all__ = ["AdaptiveScaler"]
+
+logger = logging.getLogger(__name__)
+
+# Scales are rounded up to multiples of this step, so small changes in the measured
+# text height do not change the input size (and defeat caching) on every pass
+SCALE_STEP = 0.125
+MIN_SCALE = SCALE_STEP
+# OCR passes whose median text height is remembered per key
+HEIGHT_WINDOW = 8
+# Keys kept before the least recently used one is dropped, guards against
+# unbounded topic names and ROI job keys
+MAX_CACHED_KEYS = 4096
+
+
+class _KeyState:
+    __slots__ = ("medians", "passes", "probe")
+
+    def __init__(self):
+        self.medians: deque = deque(maxlen=HEIGHT_WINDOW)
+        # Passes at reduced scale since the last full resolution pass
+        self.passes = 0
+        # Whether the next pass runs at full resolution
+        self.probe = True
+
+
+class AdaptiveScaler:
+    """
+    Chooses the input scale of each OCR job from the text height seen in recent passes.
+
+    For every topic or ROI key the median text height of the last passes is
+    kept, in pixels of the image before scaling, and images are downscaled so
+    that text stays at least ``min_text_height`` pixels tall. Keys start at full
+    resolution and return to it every ``probe_interval`` passes at reduced
+    scale, and after a reduced pass that found no text, so smaller text
+    appearing later is still measured. Used from the processing thread and the
+    OCR thread, so state is guarded by a lock.
+    """
+
+    def __init__(self, min_text_height: int, probe_interval: int):
+        self.min_text_height = min_text_height
+        self.probe_interval = probe_interval
+        self.probes = 0
+        self.reduced = 0
+        self._states: "OrderedDict[str, _KeyState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def scale(self, key: str) -> float:
+        """Scale the next image of a key is recognized at, 1.0 for full resolution."""
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or state.probe or not state.medians:
+                return 1.0
+            height = float(np.median(state.medians))
+        if height <= 0:
+            return 1.0
+        scale = math.ceil(self.min_text_height / height / SCALE_STEP) * SCALE_STEP
+        return min(1.0, max(MIN_SCALE, scale))
+
+    def resize(self, key: str, image: np.ndarray) -> tuple[np.ndarray, float]:
+        """
+        Downscale an image of a key to its current scale.
+
+        Returns:
+            tuple[np.ndarray, float]: The image, untouched at full resolution, and its scale
+        """
+        scale = self.scale(key)
+        if scale >= 1.0:
+            return image, 1.0
+        height, width = image.shape[:2]
+        size = (max(1, int(round(width * scale))), max(1, int(round(height * scale))))
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA), scale
+
+    def observe(self, key: str, heights: list[float], scale: float):
+        """
+        Record the text heights found in one pass of a key.
+
+        Args:
+            key (str): Topic name or roi_job_key() of the job
+            heights (list[float]): Pixel heights of the text found in the recognized image
+            scale (float): Scale the image was recognized at, as returned by resize()
+        """
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                if len(self._states) >= MAX_CACHED_KEYS:
+                    self._states.popitem(last=False)
+                state = self._states[key] = _KeyState()
+            else:
+                self._states.move_to_end(key)
+            if scale >= 1.0:
+                self.probes += 1
+                state.probe = False
+                state.passes = 0
+            else:
+                self.reduced += 1
+                state.passes += 1
+                # Text may have shrunk below what this scale can read
+                state.probe = not heights or state.passes >= self.probe_interval
+            if heights:
+                state.medians.append(float(np.median(heights)) / scale)
+
+    def stats(self) -> dict:
+        """Counters for logging and metrics."""
+        with self._lock:
+            return {
+                "full_resolution_passes": self.probes,
+                "reduced_passes": self.reduced,
+                "keys": len(self._states),
+            }
@@ -0,0 +1,116 @@
+import logging
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+__all__ = ["AsyncResult", "LatestFrameWorker"]
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResult(NamedTuple):
+    """A completed background OCR task."""
+
+    seq: int
+    frame_id: object
+    value: object
+    submitted_at: float
+    completed_at: float
+
+    def age_ms(self, now: Optional[float] = None) -> float:
+        """Milliseconds since the source frame was submitted."""
+        now = time.monotonic() if now is None else now
+        return round((now - self.submitted_at) * 1000.0, 2)
+
+
+class LatestFrameWorker:
+    """
+    Background thread that always works on the newest submitted frame.
+
+    At most one task waits behind the running one. Submitting while a task is
+    waiting replaces it, so a slow engine falls behind by dropping frames rather
+    than queueing them. The result of the last task that completed is available
+    from latest() without blocking.
+    """
+
+    def __init__(self, name: str = "ocr-async"):
+        self.name = name
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.failed = 0
+        self._cond = threading.Condition()
+        self._pending = None
+        self._latest: Optional[AsyncResult] = None
+        self._closed = False
+        self._thread = None
+
+    def start(self):
+        """Start the worker thread."""
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def submit(self, frame_id, task: Callable[[], object]):
+        """
+        Queue a task for the newest frame, dropping the task still waiting if any.
+
+        Args:
+            frame_id: Identifier of the source frame, reported with the result
+            task (Callable[[], object]): Work to run on the worker thread
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("LatestFrameWorker is closed")
+            if self._pending is not None:
+                self.dropped += 1
+            self.submitted += 1
+            self._pending = (self.submitted, frame_id, task, time.monotonic())
+            self._cond.notify()
+
+    def latest(self) -> Optional[AsyncResult]:
+        """The most recently completed result, None until the first task completes."""
+        with self._cond:
+            return self._latest
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                seq, frame_id, task, submitted_at = self._pending
+                self._pending = None
+
+            try:
+                value = task()
+            except Exception:
+                logger.exception(f"Background OCR failed for frame {frame_id}")
+                with self._cond:
+                    self.failed += 1
+                continue
+
+            with self._cond:
+                self._latest = AsyncResult(
+                    seq, frame_id, value, submitted_at, time.monotonic()
+                )
+                self.completed += 1
+
+    def close(self, timeout: Optional[float] = None):
+        """Finish the running and waiting tasks, then stop the thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict:
+        """Counters for logging and metrics."""
+        with self._cond:
+            return {
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "dropped": self.dropped,
+                "failed": self.failed,
+            }
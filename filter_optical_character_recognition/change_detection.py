@@ -0,0 +1,111 @@
+import logging
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from filter_optical_character_recognition.result_cache import grayscale_thumbnail
+
+__all__ = ["TopicChangeGate"]
+
+logger = logging.getLogger(__name__)
+
+# Keys kept before the least recently used one is dropped, guards against
+# unbounded topic names and ROI job keys
+MAX_CACHED_KEYS = 4096
+
+
+class _TopicState:
+    """Gating state of a single topic."""
+
+    __slots__ = ("frames", "frames_since_ocr", "thumbnail", "candidate", "result")
+
+    def __init__(self):
+        self.frames = 0
+        self.frames_since_ocr = 0
+        self.thumbnail = None
+        self.candidate = None
+        self.result = None
+
+
+class TopicChangeGate:
+    """
+    Decides per topic whether a frame needs OCR or can reuse the topic's last result.
+
+    A topic is recognized when it has no result yet, and otherwise only on every
+    ``frame_skip``-th frame of that topic. With a ``threshold`` above zero those
+    frames are further limited to the ones whose downscaled grayscale copy differs
+    from the copy last recognized by at least ``threshold`` (mean absolute
+    difference in [0, 1]), or that come ``max_staleness`` frames after the last
+    recognition.
+    """
+
+    def __init__(
+        self,
+        frame_skip: int = 1,
+        threshold: float = 0.0,
+        max_staleness: int = 0,
+        thumbnail_size: int = 32,
+    ):
+        self.frame_skip = frame_skip
+        self.threshold = threshold
+        self.max_staleness = max_staleness
+        self.thumbnail_size = thumbnail_size
+        self.runs = 0
+        self.skips = 0
+        self._topics: "OrderedDict[str, _TopicState]" = OrderedDict()
+
+    def should_run(self, topic: str, image: np.ndarray) -> bool:
+        """
+        Count a frame of ``topic`` and decide whether it must be recognized.
+
+        Args:
+            topic (str): Topic name
+            image (np.ndarray): Image of the topic in this frame
+
+        Returns:
+            bool: True if OCR must run, False if last_result() can be reused
+        """
+        state = self._topics.get(topic)
+        if state is None:
+            if len(self._topics) >= MAX_CACHED_KEYS:
+                self._topics.popitem(last=False)
+            state = self._topics[topic] = _TopicState()
+        else:
+            self._topics.move_to_end(topic)
+        state.frames += 1
+        state.frames_since_ocr += 1
+
+        run = self._decide(state, image)
+        if run:
+            self.runs += 1
+        else:
+            self.skips += 1
+            logger.debug(f"Reusing last OCR result for unchanged topic {topic}")
+        return run
+
+    def _decide(self, state: _TopicState, image: np.ndarray) -> bool:
+        if state.result is not None and state.frames % self.frame_skip != 0:
+            return False
+        if self.threshold <= 0:
+            return True
+
+        state.candidate = grayscale_thumbnail(image, self.thumbnail_size)
+        if state.result is None:
+            return True
+        if self.max_staleness and state.frames_since_ocr >= self.max_staleness:
+            return True
+        difference = float(np.mean(cv2.absdiff(state.candidate, state.thumbnail)))
+        return difference / 255.0 >= self.threshold
+
+    def update(self, topic: str, result):
+        """Store the result of a topic that should_run() sent to OCR."""
+        state = self._topics[topic]
+        state.result = result
+        state.frames_since_ocr = 0
+        state.thumbnail = state.candidate
+        state.candidate = None
+
+    def last_result(self, topic: str):
+        """Most recent OCR result of a topic."""
+        return self._topics[topic].result
@@ -0,0 +1,465 @@
+import logging
+import math
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from filter_optical_character_recognition.hybrid import EASYOCR, TESSERACT
+from filter_optical_character_recognition.profiles import EngineProfile
+from filter_optical_character_recognition.tesseract_pool import TesseractWorkerPool
+
+__all__ = [
+    "TesseractEngine",
+    "EasyOCREngine",
+    "HybridEngine",
+    "group_tesseract_lines",
+    "box_height",
+    "warmup_image",
+]
+
+logger = logging.getLogger(__name__)
+
+# Height every crop is resized to before the EasyOCR recognizer
+EASYOCR_RECOGNIZER_HEIGHT = 64
+
+
+def warmup_image() -> np.ndarray:
+    """Small synthetic image with a line of text, used to warm up an engine."""
+    image = np.full((64, 256, 3), 255, dtype=np.uint8)
+    cv2.putText(image, "OCR 123", (10, 45), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+    return image
+
+
+def group_tesseract_lines(
+    data: dict[str, list], heights: Optional[list] = None
+) -> tuple[list[str], list[float]]:
+    """
+    Group word level Tesseract output into text lines.
+
+    Args:
+        data (dict[str, list]): Output of image_to_data in Output.DICT layout
+        heights (list | None): If given, receives the pixel height of every line
+
+    Returns:
+        tuple[list[str], list[float]]: Line texts and per-line confidences in [0, 1]
+    """
+    texts: list[str] = []
+    confidences: list[float] = []
+    lines: dict[int, dict[str, list]] = {}
+    for i, word in enumerate(data["text"]):
+        txt = word.strip()
+        if not txt:
+            continue
+        ln = data["line_num"][i]
+        try:
+            conf = int(data["conf"][i])
+        except Exception:
+            conf = 0
+
+        if ln not in lines:
+            lines[ln] = {"words": [], "confs": [], "heights": []}
+        lines[ln]["words"].append(txt)
+        lines[ln]["confs"].append(conf)
+        lines[ln]["heights"].append(data["height"][i])
+
+    for ln in sorted(lines):
+        words = lines[ln]["words"]
+        confs = lines[ln]["confs"]
+        texts.append(" ".join(words))
+        # confidence per line
+        line_conf = sum(confs) / len(confs)
+        confidences.append(line_conf / 100.0)
+        if heights is not None:
+            heights.append(max(lines[ln]["heights"]))
+
+    return texts, confidences
+
+
+def box_height(box) -> float:
+    """Height of an EasyOCR box given as corner points."""
+    ys = [point[1] for point in box]
+    return float(max(ys) - min(ys))
+
+
+class TesseractEngine:
+    """
+    Tesseract backend.
+
+    Recognizes through a persistent TesseractWorkerPool when ``workers`` is above
+    zero, otherwise through pytesseract which runs ``tesseract_cmd`` per image.
+    pytesseract is only imported by start(). Instances are picklable until started.
+    """
+
+    def __init__(
+        self,
+        language: list[str],
+        tesseract_cmd: str,
+        workers: int = 0,
+        tessdata_dir: Optional[str] = None,
+    ):
+        self.lang = "+".join(language)
+        self.tesseract_cmd = tesseract_cmd
+        self.workers = workers
+        self.tessdata_dir = tessdata_dir
+        self.pool = None
+
+    def start(self):
+        """Point pytesseract at the executable and start the worker pool if configured."""
+        import pytesseract
+
+        pytesseract.pytesseract.tesseract_cmd = self.tesseract_cmd
+        if self.workers > 0:
+            self.pool = TesseractWorkerPool(self.workers, self.lang, self.tessdata_dir)
+            self.pool.start()
+
+    def recognize(
+        self, image, profile: Optional[EngineProfile] = None
+    ) -> tuple[list[str], list[float]]:
+        """
+        Recognize text lines in an image.
+
+        Args:
+            image: BGR or grayscale image
+            profile (EngineProfile | None): Page segmentation mode, engine mode and
+                allowlist to use instead of Tesseract's defaults
+
+        Returns:
+            tuple[list[str], list[float]]: Line texts and confidences
+        """
+        return group_tesseract_lines(self._image_to_data(image, profile))
+
+    def recognize_detail(
+        self, image, profile: Optional[EngineProfile] = None
+    ) -> tuple[list[str], list[float], list[float]]:
+        """Like recognize(), also returning the pixel height of every line."""
+        heights: list = []
+        texts, confidences = group_tesseract_lines(
+            self._image_to_data(image, profile), heights
+        )
+        return texts, confidences, heights
+
+    def _image_to_data(
+        self, image, profile: Optional[EngineProfile] = None
+    ) -> dict[str, list]:
+        if self.pool:
+            # The engine mode is fixed when the workers load their language data
+            if profile:
+                return self.pool.image_to_data(image, profile.psm, profile.allowlist)
+            return self.pool.image_to_data(image)
+        import pytesseract
+
+        return pytesseract.image_to_data(
+            image,
+            lang=self.lang,
+            config=profile.tesseract_config() if profile else "",
+            output_type=pytesseract.Output.DICT,
+        )
+
+    def warm_up(self):
+        """Recognize a synthetic image, so the first frame does not pay start-up costs."""
+        self.recognize(warmup_image())
+
+    def close(self):
+        """Stop the worker pool if one was started."""
+        if self.pool:
+            self.pool.close()
+            self.pool = None
+            logger.info("Stopped Tesseract worker pool.")
+
+
+class EasyOCREngine:
+    """
+    EasyOCR backend.
+
+    easyocr (and torch) is only imported, and the Reader with its models only
+    created, in start(), so instances are cheap to create and picklable until then.
+    """
+
+    def __init__(
+        self,
+        language: list[str],
+        gpu: bool,
+        optimize_params: bool,
+        confidence_threshold: float,
+        batch_size: int = 0,
+    ):
+        self.language = language
+        self.gpu = gpu
+        self.optimize_params = optimize_params
+        self.confidence_threshold = confidence_threshold
+        self.batch_size = batch_size
+        self.reader = None
+
+    def start(self):
+        """Load the EasyOCR detection and recognition models."""
+        import easyocr
+
+        logger.info(
+            f"Initializing EasyOCR with languages: {self.language}, GPU: {self.gpu}"
+        )
+        self.reader = easyocr.Reader(self.language, gpu=self.gpu)
+
+    def warm_up(self):
+        """
+        Run detection and recognition on a synthetic image.
+
+        The first inference initializes the torch kernels, which would otherwise
+        be paid by the first frame.
+        """
+        if self.batch_size:
+            self.recognize_batch([warmup_image()])
+        else:
+            self.recognize(warmup_image())
+
+    def collect(
+        self, results: list, heights: Optional[list] = None
+    ) -> tuple[list[str], list[float]]:
+        """
+        Turn (bbox, text, conf) results into texts and confidences.
+
+        Args:
+            results (list): readtext() style results
+            heights (list | None): If given, receives the pixel height of every kept box
+        """
+        if self.optimize_params:
+            results = [r for r in results if r[2] >= self.confidence_threshold]
+        if heights is not None:
+            heights.extend(box_height(bbox) for bbox, _, _ in results)
+        return [t for _, t, _ in results], [c for _, _, c in results]
+
+    def _detect_params(self) -> dict:
+        """Detector arguments, matching what recognize() passes to readtext."""
+        if self.optimize_params:
+            return {"min_size": 3, "text_threshold": self.confidence_threshold}
+        return {}
+
+    def recognize(
+        self, image, profile: Optional[EngineProfile] = None
+    ) -> tuple[list[str], list[float]]:
+        """
+        Recognize text in an image.
+
+        Args:
+            image: BGR or grayscale image
+            profile (EngineProfile | None): Allowlist, minimum box size and canvas size
+                overriding the readtext() arguments
+
+        Returns:
+            tuple[list[str], list[float]]: Texts and confidences
+        """
+        return self.collect(self._readtext(image, profile))
+
+    def recognize_detail(
+        self, image, profile: Optional[EngineProfile] = None
+    ) -> tuple[list[str], list[float], list[float]]:
+        """Like recognize(), also returning the pixel height of every text box."""
+        heights: list = []
+        texts, confidences = self.collect(self._readtext(image, profile), heights)
+        return texts, confidences, heights
+
+    def _readtext(self, image, profile: Optional[EngineProfile] = None) -> list:
+        kwargs = {}
+        # Use optimized parameters if configured
+        if self.optimize_params:
+            # optimized branch: still ask for (bbox, text, conf)
+            kwargs = {
+                "paragraph": False,
+                "contrast_ths": 0.1,
+                "adjust_contrast": 0.5,
+                **self._detect_params(),
+            }
+        if profile:
+            kwargs.update(profile.easyocr_kwargs())
+        return self.reader.readtext(image, detail=1, **kwargs)
+
+    def detect(self, image) -> tuple:
+        """
+        Run the text detector on an image.
+
+        Args:
+            image: BGR or grayscale image
+
+        Returns:
+            tuple: Grayscale copy of the image, horizontal boxes as
+            [x_min, x_max, y_min, y_max] and free-form boxes as 4-point polygons
+        """
+        from easyocr.utils import reformat_input
+
+        img, img_cv_grey = reformat_input(image)
+        horizontal_list, free_list = self.reader.detect(
+            img, reformat=False, **self._detect_params()
+        )
+        # detect() returns one list per image
+        return img_cv_grey, horizontal_list[0], free_list[0]
+
+    def crop_boxes(self, img_cv_grey, horizontal_list: list, free_list: list) -> list:
+        """
+        Cut detected boxes out of a grayscale image, resized for the recognizer.
+
+        Horizontal boxes come first, then free-form boxes, each in detection order,
+        as readtext() recognizes them. Boxes too thin to recognize are dropped.
+
+        Returns:
+            list: (box, crop) pairs
+        """
+        from easyocr.utils import get_image_list
+
+        crops: list = []
+        if horizontal_list:
+            crops += get_image_list(
+                horizontal_list,
+                [],
+                img_cv_grey,
+                model_height=EASYOCR_RECOGNIZER_HEIGHT,
+                sort_output=False,
+            )[0]
+        if free_list:
+            crops += get_image_list(
+                [],
+                free_list,
+                img_cv_grey,
+                model_height=EASYOCR_RECOGNIZER_HEIGHT,
+                sort_output=False,
+            )[0]
+        return crops
+
+    def recognize_crops(self, crops: list, batch_size: int = 0) -> list:
+        """
+        Recognize (box, crop) pairs produced by crop_boxes().
+
+        Crops are sorted by width and sent to the recognizer ``batch_size`` at a
+        time (all at once when 0), so crops of similar width are padded together.
+
+        Returns:
+            list: (box, text, confidence) per crop, in input order
+        """
+        from easyocr.recognition import get_text
+
+        height = EASYOCR_RECOGNIZER_HEIGHT
+        reader = self.reader
+        # Same character filtering readtext() applies without an allowlist
+        ignore_char = "".join(set(reader.character) - set(reader.lang_char))
+        batch_size = batch_size or max(len(crops), 1)
+
+        predictions: list = [None] * len(crops)
+        order = sorted(range(len(crops)), key=lambda i: crops[i][1].shape[1])
+        for start in range(0, len(order), batch_size):
+            chunk = order[start : start + batch_size]
+            image_list = [crops[i] for i in chunk]
+            max_width = (
+                math.ceil(max(crop.shape[1] for _, crop in image_list) / height)
+                * height
+            )
+            results = get_text(
+                reader.character,
+                height,
+                int(max_width),
+                reader.recognizer,
+                reader.converter,
+                image_list,
+                ignore_char,
+                "greedy",
+                5,
+                len(image_list),
+                0.1,
+                0.5,
+                0.003,
+                0,
+                reader.device,
+            )
+            for i, result in zip(chunk, results):
+                predictions[i] = result
+        return predictions
+
+    def recognize_batch(self, images: list) -> list[tuple[list[str], list[float]]]:
+        """
+        Recognize several images, sharing recognizer batches between them.
+
+        The detector runs on each image, then the text boxes found in all images
+        are recognized together ``batch_size`` at a time. Results are split back
+        per image in the order readtext() would return them.
+
+        Args:
+            images (list): BGR or grayscale images
+
+        Returns:
+            list[tuple[list[str], list[float]]]: Texts and confidences per image
+        """
+        owners: list[int] = []
+        crops: list = []
+        for index, image in enumerate(images):
+            image_crops = self.crop_boxes(*self.detect(image))
+            crops.extend(image_crops)
+            owners.extend([index] * len(image_crops))
+
+        predictions = self.recognize_crops(crops, self.batch_size)
+
+        per_image: list[list] = [[] for _ in images]
+        for owner, result in zip(owners, predictions):
+            per_image[owner].append(result)
+        return [self.collect(results) for results in per_image]
+
+    def close(self):
+        """Release the reader."""
+        self.reader = None
+
+
+class HybridEngine:
+    """
+    Tesseract and EasyOCR side by side, each image recognized by the engine it is routed to.
+
+    Both engines are loaded by start(), so topics that suit either engine share
+    one filter instance. Instances are picklable until started.
+    """
+
+    def __init__(self, tesseract: TesseractEngine, easyocr: EasyOCREngine):
+        self.engines = {TESSERACT: tesseract, EASYOCR: easyocr}
+
+    @property
+    def reader(self):
+        """The EasyOCR reader, None until started."""
+        return self.engines[EASYOCR].reader
+
+    def start(self):
+        """Start both engines."""
+        for engine in self.engines.values():
+            engine.start()
+
+    def warm_up(self):
+        """Warm up both engines."""
+        for engine in self.engines.values():
+            engine.warm_up()
+
+    def recognize(
+        self,
+        image,
+        profile: Optional[EngineProfile] = None,
+        engine: str = EASYOCR,
+    ) -> tuple[list[str], list[float]]:
+        """
+        Recognize text in an image.
+
+        Args:
+            image: BGR or grayscale image
+            profile (EngineProfile | None): Settings passed on to the engine
+            engine (str): "tesseract" or "easyocr", as chosen by an EngineRouter
+
+        Returns:
+            tuple[list[str], list[float]]: Texts and confidences
+        """
+        return self.engines[engine].recognize(image, profile)
+
+    def recognize_detail(
+        self,
+        image,
+        profile: Optional[EngineProfile] = None,
+        engine: str = EASYOCR,
+    ) -> tuple[list[str], list[float], list[float]]:
+        """Like recognize(), also returning the pixel height of every text line or box."""
+        return self.engines[engine].recognize_detail(image, profile)
+
+    def close(self):
+        """Close both engines."""
+        for engine in self.engines.values():
+            engine.close()
@@ -1,15 +1,63 @@
 import logging
+import multiprocessing
 import os
 import json
 import re
-import easyocr
-import pytesseract
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import partial
 from openfilter.filter_runtime.filter import FilterConfig, Filter, Frame
 from dotenv import load_dotenv
 from typing import Optional
-import cv2
-from pytesseract import Output
+
+from filter_optical_character_recognition.adaptive import AdaptiveScaler
+from filter_optical_character_recognition.async_ocr import LatestFrameWorker
+from filter_optical_character_recognition.change_detection import (
+    MAX_CACHED_KEYS,
+    TopicChangeGate,
+)
+from filter_optical_character_recognition.engines import (
+    EasyOCREngine,
+    HybridEngine,
+    TesseractEngine,
+)
+from filter_optical_character_recognition.hybrid import (
+    EngineRouter,
+    parse_engine_routes,
+)
+from filter_optical_character_recognition.metrics import (
+    PrometheusFileExporter,
+    RollingStats,
+    StageTimer,
+)
+from filter_optical_character_recognition.preprocessing import PreprocessPipeline
+from filter_optical_character_recognition.profiles import ProfileRouter, parse_profiles
+from filter_optical_character_recognition.result_cache import (
+    FingerprintMode,
+    OCRResultCache,
+)
+from filter_optical_character_recognition.rois import parse_rois, roi_job_key
+from filter_optical_character_recognition.routing import TopicRouter
+from filter_optical_character_recognition.segments import (
+    SegmentCompression,
+    SegmentedResultWriter,
+)
+from filter_optical_character_recognition.sqlite_sink import SQLiteResultSink
+from filter_optical_character_recognition.text_presence import TextPresenceFilter
+from filter_optical_character_recognition.tracking import TextTracker
+from filter_optical_character_recognition.visualization import (
+    VisualizationRenderer,
+    draw_texts,
+)
+from filter_optical_character_recognition.worker_farm import OCRWorkerFarm
+from filter_optical_character_recognition.writers import (
+    BackgroundWriter,
+    FsyncPolicy,
+    SubjectDataFormat,
+    SubjectDataWriter,
+)
 
 load_dotenv()
 
@@ -23,6 +71,35 @@ logger = logging.getLogger(__name__)
 SKIP_OCR_FLAG = "skip_ocr"
 
 
+def readonly_bgr(frame: Frame):
+    """
+    BGR image of a frame as a read-only view.
+
+    ro_bgr and rw_bgr copy BGR images that do not already have the requested
+    writability; this only converts other formats, and otherwise returns the
+    frame's own buffer, made read-only through a view if it is writable.
+    """
+    image = frame.bgr.image
+    if image.flags.writeable:
+        image = image.view()
+        image.flags.writeable = False
+    return image
+
+
+def average_confidence(confidences: list[float]) -> float:
+    """Mean confidence rounded to 4 decimals, 0.0 when nothing was recognized."""
+    if not confidences:
+        return 0.0
+    return round(sum(confidences) / len(confidences), 4)
+
+
+def _timed_call(fn, *args):
+    """Call fn(*args), returning its result and the seconds it took."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
 class OCREngine(Enum):
     """
     Enumeration of supported OCR engines.
@@ -30,10 +107,12 @@ class OCREngine(Enum):
     Attributes:
         TESSERACT: Uses Tesseract OCR engine
         EASYOCR: Uses EasyOCR engine
+        HYBRID: Loads both engines and routes each topic to one of them
     """
 
     TESSERACT = "tesseract"
     EASYOCR = "easyocr"
+    HYBRID = "hybrid"
 
     @classmethod
     def from_str(cls, value: str) -> "OCREngine":
@@ -57,29 +136,181 @@ class OCREngine(Enum):
             )
 
 
+class OCRExecutor(Enum):
+    """
+    Enumeration of the ways OCR is run across the selected topics of a frame.
+
+    Attributes:
+        NONE: Recognize topics one after another in the filter process
+        THREAD: Recognize topics concurrently on a thread pool sharing the filter's engine
+        PROCESS: Recognize topics concurrently on a farm of worker processes, each with its own
+            engine, fed through shared memory
+    """
+
+    NONE = "none"
+    THREAD = "thread"
+    PROCESS = "process"
+
+    @classmethod
+    def from_str(cls, value: str) -> "OCRExecutor":
+        """
+        Convert a string to an OCRExecutor enum value.
+
+        Args:
+            value (str): String representation of the executor
+
+        Returns:
+            OCRExecutor: Corresponding enum value
+
+        Raises:
+            ValueError: If the string doesn't match any enum value
+        """
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            raise ValueError(
+                f"Invalid mode: {value!r}. Expected one of: {[s.value for s in cls]}"
+            )
+
+
 class FilterOpticalCharacterRecognitionConfig(FilterConfig):
     """
     Configuration for the OCR filter.
 
     Attributes:
         debug (bool): Enable debug logging (default: False)
-        ocr_engine (OCREngine): OCR engine to use (default: EASYOCR)
+        ocr_engine (OCREngine): OCR engine to use, "tesseract", "easyocr" or "hybrid", which
+            loads both and routes each topic to one of them (default: EASYOCR)
         output_json_path (str): Path to save OCR results (default: './output/ocr_results.json')
         ocr_language (list[str]): List of languages for OCR (default: ['en'])
         tesseract_cmd (str): Path to Tesseract executable
+        tesseract_workers (int): Number of persistent Tesseract worker processes (requires tesserocr).
+            0 spawns the Tesseract executable for every image (default: 0)
+        tessdata_dir (str | None): Directory containing Tesseract language data for the
+            worker processes (default: None, use the tesserocr built-in path)
+        tesseract_language (list[str]): Tesseract languages with ocr_engine "hybrid", where
+            ocr_language applies to EasyOCR. Empty uses ocr_language, with ["en"] mapped to
+            ["eng"] (default: [])
+        engine_routes (dict[str, str]): With ocr_engine "hybrid", regex patterns searched in the
+            topic name (or "topic[roi_id]" for ROIs) mapped to the engine recognizing the
+            matching topics, "tesseract" or "easyocr". The first matching pattern applies, other
+            topics are routed by hybrid_contrast_threshold (default: {})
+        hybrid_contrast_threshold (float): With ocr_engine "hybrid", topics matching no
+            engine_routes pattern go to Tesseract when the Otsu separability (0 to 1) of a
+            downscaled grayscale copy of their image reaches this value, as clean high-contrast
+            crops do, and to EasyOCR otherwise (default: 0.8)
         forward_ocr_texts (bool): Forward OCR results in frame metadata (default: True)
         write_output_file (bool): Write results to output file (default: True)
+        subject_data_format (SubjectDataFormat): Layout of the subject data file written next to
+            the output file as frames are processed: "json" (subject_data.json, an indented
+            JSON array) or "jsonl" (subject_data.jsonl, one record per line) (default: "json")
+        output_segments (bool): Write results into rotating segments next to output_json_path
+            (<name>.000001.jsonl, ...) with a sidecar block index each, instead of appending to
+            output_json_path (default: False)
+        output_segment_bytes (int): Start a new segment once the current one reaches this many
+            bytes, 0 disables size rotation (default: 0)
+        output_segment_seconds (float): Start a new segment once the current one is this many
+            seconds old, 0 disables time rotation (default: 0.0)
+        output_compression (SegmentCompression): Compression of each indexed block of a
+            segment: "none", "gzip" or "zstd" (requires zstandard) (default: "none")
+        output_index_block (int): Records per indexed and compressed block (default: 100)
+        output_sqlite_path (str | None): SQLite database that also receives every fresh OCR
+            result of every topic, with a full-text index over the recognized text. Written by
+            a background thread in batched transactions (default: None, disabled)
+        output_queue_size (int): Write the output and subject data files on a background
+            thread fed by a bounded queue of this many records, dropping records when it is
+            full. 0 writes and flushes on the processing thread (default: 0)
+        output_batch_size (int): Maximum records written per batch by the background
+            writer (default: 100)
+        output_flush_interval (float): Seconds between flushes of the background writer,
+            0 flushes after every batch (default: 1.0)
+        output_fsync (FsyncPolicy): When the background writer fsyncs: "never", on every
+            periodic flush ("interval") or after every batch ("always") (default: "never")
         topic_pattern (str | None): Regex pattern to match topic names (default: None)
         exclude_topics (list[str]): List of topics to exclude from OCR processing.
             Can be exact topic names or regex patterns (default: [])
+        roi_meta_key (str): Frame metadata key holding regions of interest. When a selected
+            topic supplies ROIs, only those crops are recognized and results are keyed by
+            ROI id (default: "ocr_rois")
+        preprocess (list[str]): Preprocessing steps applied in order to every topic or ROI image
+            before change detection, caching and OCR: "grayscale", "resize=<factor>",
+            "max_side=<pixels>", "clahe" or "clahe=<clip limit>", and "otsu" (default: [])
+        engine_profiles (dict[str, dict]): Engine settings per topic, as regex patterns searched in
+            the topic name (or "topic[roi_id]" for ROIs) mapped to settings. The first matching
+            pattern applies: "psm" and "oem" for Tesseract, "allowlist" for both engines, and
+            "min_size" and "canvas_size" for EasyOCR, e.g. {"^score": {"psm": 7, "allowlist":
+            "0123456789:"}}. Not supported with easyocr_batch_size or detect_interval (default: {})
         draw_visualization (bool): Enable visualization of OCR text in their bounding boxes (default: False)
         visualization_topic (str): Topic name for the visualization output (default: "viz")
         visualization_resize_factor (float): Factor to resize the visualization by (default: 0.5)
         text_scale_factor (float): Factor to scale text size independently (default: 1.0)
-        frame_skip (int): Process OCR only every N frames to improve performance (default: 1)
+        visualization_max_fps (float): Maximum rate at which visualization frames are rendered,
+            on a background thread; the visualization topic carries the most recent rendering.
+            0 renders every frame the thread keeps up with (default: 5.0)
+        frame_skip (int): Process OCR only every N frames of each topic to improve performance (default: 1)
+        change_threshold (float): Minimum mean absolute difference (0 to 1) between a downscaled
+            grayscale copy of a topic and the copy last recognized for OCR to run on that topic
+            again. 0 disables change detection (default: 0.0)
+        max_staleness (int): Recognize a topic after this many of its frames even if it did not
+            change, only used with change_threshold. 0 never forces OCR (default: 0)
+        text_prefilter_threshold (float): Minimum text likelihood (0 to 0.5) of a topic or ROI
+            image for OCR to run, measured as the density of character stroke edges in the
+            densest small cell of a downscaled grayscale copy. Images below it get an empty
+            result without calling the engine. Text lines score around 0.1 to 0.25, plain
+            backgrounds below 0.07. 0 disables the check (default: 0.0)
         confidence_threshold (float): Minimum confidence threshold for EasyOCR (default: 0.2)
         gpu (bool): Use GPU for EasyOCR if available (default: True)
         optimize_params (bool): Use optimized parameters for EasyOCR (default: True)
+        easyocr_batch_size (int): Number of text boxes per EasyOCR recognizer batch when
+            recognizing all topics of a frame together. 0 runs readtext per topic (default: 0)
+        ocr_executor (OCRExecutor): How the selected topics of a frame are recognized:
+            "none" (sequentially), "thread" or "process" (concurrently) (default: "none")
+        ocr_workers (int): Number of threads or processes used by ocr_executor (default: 4)
+        share_models (bool): With ocr_executor "process", load the engine once in a fork server
+            process and fork the workers from it, so they share the model weights copy-on-write
+            instead of each loading its own copy. Requires the fork start method and, with
+            EasyOCR, gpu disabled (default: False)
+        ocr_cpu_affinity (list[int]): With ocr_executor "process", CPUs the workers are pinned to,
+            split into a contiguous share per worker, or one CPU per worker round-robin when
+            there are fewer CPUs than workers. Linux only. Empty leaves scheduling to the
+            OS (default: [])
+        ocr_worker_threads (int): With ocr_executor "process", torch and OpenCV threads per worker
+            process, e.g. the CPU count divided by ocr_workers. 0 keeps the library defaults,
+            which use every core in each worker (default: 0)
+        warmup (bool): Recognize a synthetic image at the end of setup(), in every worker
+            process with ocr_executor "process", so the first frame does not pay model
+            initialization (default: False)
+        adaptive_resolution (bool): Downscale each topic or ROI image, after the preprocess
+            steps, to the smallest scale that keeps the median text height of its recent OCR
+            passes at min_text_height pixels, probing at full resolution periodically. Not
+            supported with detect_interval or easyocr_batch_size (default: False)
+        min_text_height (int): Text height in pixels that adaptive_resolution keeps (default: 20)
+        adaptive_probe_interval (int): Reduced-scale OCR passes of a topic or ROI between full
+            resolution passes that measure its text again (default: 30)
+        async_ocr (bool): Run OCR on a background thread. Frames are passed through at once
+            with the last completed result, tagged with its source frame id and age, and
+            frames arriving while OCR is busy are dropped instead of queued (default: False)
+        detect_interval (int): EasyOCR only. Run the text detector every N frames of a topic and
+            track the detected boxes in between, recognizing a box again only when its content
+            changed. 0 runs detection and recognition on every frame (default: 0)
+        track_min_score (float): Minimum template matching score for a tracked box to be kept,
+            a lost box triggers a new detection (default: 0.6)
+        track_change_tolerance (int): Maximum Hamming distance between perceptual hashes of a
+            tracked box for its text to be reused; its full resolution crop must also be
+            unchanged (default: 4)
+        result_cache_size (int): Number of OCR results cached per topic, keyed by an image
+            fingerprint and evicted least recently used first. 0 disables the cache (default: 0)
+        result_cache_mode (FingerprintMode): Fingerprint used as cache key: "exact" hash of a
+            downsampled grayscale crop or "phash" perceptual hash (default: "exact")
+        result_cache_tolerance (int): Maximum Hamming distance between perceptual hashes
+            for a cache hit, only used with "phash" (default: 0)
+        stage_timing (bool): Add "ocr_timing" to the metadata of every output frame, with the
+            milliseconds spent routing, recognizing (in total and per topic or ROI), aggregating,
+            writing output and drawing the visualization (default: False)
+        metrics_path (str | None): Prometheus text file rewritten every metrics_interval seconds
+            with frame counts, rolling p50/p99 stage latencies, cache hit ratios and dropped
+            records, e.g. for the node_exporter textfile collector (default: None, disabled)
+        metrics_interval (float): Seconds between writes of metrics_path (default: 10.0)
         video_chunks_dir (str): Directory path containing video chunks (default: './video_chunks')
     """
 
@@ -90,20 +321,64 @@ class FilterOpticalCharacterRecognitionConfig(FilterConfig):
     tesseract_cmd: Optional[
         str
     ] = f"{os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'bin', 'tesseract', 'tesseract.AppImage'))}"
+    tesseract_workers: Optional[int] = 0
+    tessdata_dir: Optional[str | None] = None
+    tesseract_language: Optional[list[str]] = []
+    engine_routes: Optional[dict] = {}
+    hybrid_contrast_threshold: Optional[float] = 0.8
     forward_ocr_texts: Optional[bool] = True
     write_output_file: Optional[bool] = True
+    subject_data_format: Optional[SubjectDataFormat] = SubjectDataFormat.JSON.value
+    output_segments: Optional[bool] = False
+    output_segment_bytes: Optional[int] = 0
+    output_segment_seconds: Optional[float] = 0.0
+    output_compression: Optional[SegmentCompression] = SegmentCompression.NONE.value
+    output_index_block: Optional[int] = 100
+    output_sqlite_path: Optional[str | None] = None
+    output_queue_size: Optional[int] = 0
+    output_batch_size: Optional[int] = 100
+    output_flush_interval: Optional[float] = 1.0
+    output_fsync: Optional[FsyncPolicy] = FsyncPolicy.NEVER.value
     topic_pattern: Optional[str | None] = None
     exclude_topics: Optional[list[str]] = []
+    roi_meta_key: Optional[str] = "ocr_rois"
+    preprocess: Optional[list[str]] = []
+    engine_profiles: Optional[dict] = {}
     # Visualization options
     draw_visualization: Optional[bool] = False
     visualization_topic: Optional[str] = "viz"
     visualization_resize_factor: Optional[float] = 1.0
     text_scale_factor: Optional[float] = 1.0
+    visualization_max_fps: Optional[float] = 5.0
     # Performance optimization options
     frame_skip: Optional[int] = 1
+    change_threshold: Optional[float] = 0.0
+    max_staleness: Optional[int] = 0
+    text_prefilter_threshold: Optional[float] = 0.0
     confidence_threshold: Optional[float] = 0.2
     gpu: Optional[bool] = True
     optimize_params: Optional[bool] = True
+    easyocr_batch_size: Optional[int] = 0
+    ocr_executor: Optional[OCRExecutor] = OCRExecutor.NONE.value
+    ocr_workers: Optional[int] = 4
+    share_models: Optional[bool] = False
+    ocr_cpu_affinity: Optional[list[int]] = []
+    ocr_worker_threads: Optional[int] = 0
+    warmup: Optional[bool] = False
+    adaptive_resolution: Optional[bool] = False
+    min_text_height: Optional[int] = 20
+    adaptive_probe_interval: Optional[int] = 30
+    async_ocr: Optional[bool] = False
+    detect_interval: Optional[int] = 0
+    track_min_score: Optional[float] = 0.6
+    track_change_tolerance: Optional[int] = 4
+    result_cache_size: Optional[int] = 0
+    result_cache_mode: Optional[FingerprintMode] = FingerprintMode.EXACT.value
+    result_cache_tolerance: Optional[int] = 0
+    # Profiling options
+    stage_timing: Optional[bool] = False
+    metrics_path: Optional[str | None] = None
+    metrics_interval: Optional[float] = 10.0
     # Video chunks directory
     video_chunks_dir: Optional[str] = "/output/"
 
@@ -157,8 +432,27 @@ class FilterOpticalCharacterRecognition(Filter):
             "output_json_path": (str, str.strip),
             "ocr_language": (list, lambda x: [lang.strip() for lang in x.split(",")]),
             "tesseract_cmd": (str, str.strip),
+            "tesseract_workers": (int, lambda x: int(x.strip())),
+            "tessdata_dir": (str, str.strip),
+            "tesseract_language": (
+                list,
+                lambda x: [lang.strip() for lang in x.split(",") if lang.strip()],
+            ),
+            "engine_routes": (dict, json.loads),
+            "hybrid_contrast_threshold": (float, lambda x: float(x.strip())),
             "forward_ocr_texts": (bool, lambda x: x.strip().lower() == "true"),
             "write_output_file": (bool, lambda x: x.strip().lower() == "true"),
+            "subject_data_format": (str, str.strip),
+            "output_segments": (bool, lambda x: x.strip().lower() == "true"),
+            "output_segment_bytes": (int, lambda x: int(x.strip())),
+            "output_segment_seconds": (float, lambda x: float(x.strip())),
+            "output_compression": (str, str.strip),
+            "output_index_block": (int, lambda x: int(x.strip())),
+            "output_sqlite_path": (str, str.strip),
+            "output_queue_size": (int, lambda x: int(x.strip())),
+            "output_batch_size": (int, lambda x: int(x.strip())),
+            "output_flush_interval": (float, lambda x: float(x.strip())),
+            "output_fsync": (str, str.strip),
             "topic_pattern": (str, str.strip),
             "exclude_topics": (
                 list,
@@ -166,14 +460,51 @@ class FilterOpticalCharacterRecognition(Filter):
                 if x.strip().startswith("[")
                 else [topic.strip() for topic in x.split(",")],
             ),
+            "roi_meta_key": (str, str.strip),
+            "preprocess": (
+                list,
+                lambda x: json.loads(x)
+                if x.strip().startswith("[")
+                else [step.strip() for step in x.split(",") if step.strip()],
+            ),
+            "engine_profiles": (dict, json.loads),
             "draw_visualization": (bool, lambda x: x.strip().lower() == "true"),
             "visualization_topic": (str, str.strip),
             "visualization_resize_factor": (float, lambda x: float(x.strip())),
             "text_scale_factor": (float, lambda x: float(x.strip())),
+            "visualization_max_fps": (float, lambda x: float(x.strip())),
             "frame_skip": (int, lambda x: int(x.strip())),
+            "change_threshold": (float, lambda x: float(x.strip())),
+            "max_staleness": (int, lambda x: int(x.strip())),
+            "text_prefilter_threshold": (float, lambda x: float(x.strip())),
             "confidence_threshold": (float, lambda x: float(x.strip())),
             "gpu": (bool, lambda x: x.strip().lower() == "true"),
             "optimize_params": (bool, lambda x: x.strip().lower() == "true"),
+            "easyocr_batch_size": (int, lambda x: int(x.strip())),
+            "ocr_executor": (str, str.strip),
+            "ocr_workers": (int, lambda x: int(x.strip())),
+            "share_models": (bool, lambda x: x.strip().lower() == "true"),
+            "ocr_cpu_affinity": (
+                list,
+                lambda x: json.loads(x)
+                if x.strip().startswith("[")
+                else [int(cpu) for cpu in x.split(",") if cpu.strip()],
+            ),
+            "ocr_worker_threads": (int, lambda x: int(x.strip())),
+            "warmup": (bool, lambda x: x.strip().lower() == "true"),
+            "adaptive_resolution": (bool, lambda x: x.strip().lower() == "true"),
+            "min_text_height": (int, lambda x: int(x.strip())),
+            "adaptive_probe_interval": (int, lambda x: int(x.strip())),
+            "async_ocr": (bool, lambda x: x.strip().lower() == "true"),
+            "detect_interval": (int, lambda x: int(x.strip())),
+            "track_min_score": (float, lambda x: float(x.strip())),
+            "track_change_tolerance": (int, lambda x: int(x.strip())),
+            "result_cache_size": (int, lambda x: int(x.strip())),
+            "result_cache_mode": (str, str.strip),
+            "result_cache_tolerance": (int, lambda x: int(x.strip())),
+            "stage_timing": (bool, lambda x: x.strip().lower() == "true"),
+            "metrics_path": (str, str.strip),
+            "metrics_interval": (float, lambda x: float(x.strip())),
             "video_chunks_dir": (str, str.strip),
         }
 
@@ -223,11 +554,53 @@ class FilterOpticalCharacterRecognition(Filter):
         if not config.ocr_language:
             raise ValueError("ocr_language list cannot be empty")
 
-        # Validate Tesseract command
+        # Validate hybrid engine settings
+        if not isinstance(config.tesseract_language, list):
+            raise TypeError("tesseract_language must be a list")
+        if not all(isinstance(lang, str) for lang in config.tesseract_language):
+            raise TypeError("All elements in tesseract_language must be strings")
+        if not isinstance(config.engine_routes, dict):
+            raise TypeError("engine_routes must be a dict")
+        parse_engine_routes(config.engine_routes)
+        if not isinstance(config.hybrid_contrast_threshold, float):
+            raise TypeError("hybrid_contrast_threshold must be a float")
+        if (
+            config.hybrid_contrast_threshold < 0
+            or config.hybrid_contrast_threshold > 1.0
+        ):
+            raise ValueError("hybrid_contrast_threshold must be between 0 and 1.0")
+        if config.ocr_engine == OCREngine.HYBRID:
+            if not config.tesseract_language:
+                config.tesseract_language = (
+                    ["eng"]
+                    if config.ocr_language == ["en"]
+                    else list(config.ocr_language)
+                )
+        else:
+            for option in ("tesseract_language", "engine_routes"):
+                if getattr(config, option):
+                    raise ValueError(f"{option} requires ocr_engine 'hybrid'")
+
+        # Validate Tesseract worker pool
+        if not isinstance(config.tesseract_workers, int):
+            raise TypeError("tesseract_workers must be an integer")
+        if config.tesseract_workers < 0:
+            raise ValueError("tesseract_workers must be 0 or greater")
+        if config.tessdata_dir is not None:
+            if not isinstance(config.tessdata_dir, str):
+                raise TypeError("tessdata_dir must be a string or None")
+            if not os.path.isdir(config.tessdata_dir):
+                raise ValueError(
+                    f"Tesseract data directory not found at {config.tessdata_dir}"
+                )
+
+        # Validate Tesseract command (not used by the worker pool)
         if not isinstance(config.tesseract_cmd, str):
             raise TypeError("tesseract_cmd must be a string")
-        if config.ocr_engine == OCREngine.TESSERACT and not os.path.exists(
-            config.tesseract_cmd
+        if (
+            config.ocr_engine in (OCREngine.TESSERACT, OCREngine.HYBRID)
+            and config.tesseract_workers == 0
+            and not os.path.exists(config.tesseract_cmd)
         ):
             raise ValueError(
                 f"Tesseract executable not found at {config.tesseract_cmd}"
@@ -238,6 +611,81 @@ class FilterOpticalCharacterRecognition(Filter):
             if not isinstance(getattr(config, flag), bool):
                 raise TypeError(f"{flag} must be a boolean")
 
+        # Validate subject data format
+        if not isinstance(config.subject_data_format, (str, SubjectDataFormat)):
+            raise TypeError(
+                "subject_data_format must be a string or SubjectDataFormat enum"
+            )
+        if isinstance(config.subject_data_format, str):
+            try:
+                config.subject_data_format = SubjectDataFormat.from_str(
+                    config.subject_data_format
+                )
+            except ValueError as e:
+                raise ValueError(f"Invalid subject data format: {str(e)}")
+
+        # Validate result segments
+        if not isinstance(config.output_segments, bool):
+            raise TypeError("output_segments must be a boolean")
+
+        if not isinstance(config.output_segment_bytes, int):
+            raise TypeError("output_segment_bytes must be an integer")
+        if config.output_segment_bytes < 0:
+            raise ValueError("output_segment_bytes must be 0 or greater")
+
+        if not isinstance(config.output_segment_seconds, float):
+            raise TypeError("output_segment_seconds must be a float")
+        if config.output_segment_seconds < 0:
+            raise ValueError("output_segment_seconds must be 0 or greater")
+
+        if not isinstance(config.output_compression, (str, SegmentCompression)):
+            raise TypeError(
+                "output_compression must be a string or SegmentCompression enum"
+            )
+        if isinstance(config.output_compression, str):
+            try:
+                config.output_compression = SegmentCompression.from_str(
+                    config.output_compression
+                )
+            except ValueError as e:
+                raise ValueError(f"Invalid output compression: {str(e)}")
+
+        if not isinstance(config.output_index_block, int):
+            raise TypeError("output_index_block must be an integer")
+        if config.output_index_block < 1:
+            raise ValueError("output_index_block must be at least 1")
+
+        # Validate SQLite sink
+        if config.output_sqlite_path is not None:
+            if not isinstance(config.output_sqlite_path, str):
+                raise TypeError("output_sqlite_path must be a string or None")
+            if not config.output_sqlite_path:
+                raise ValueError("output_sqlite_path cannot be empty")
+
+        # Validate background writer
+        if not isinstance(config.output_queue_size, int):
+            raise TypeError("output_queue_size must be an integer")
+        if config.output_queue_size < 0:
+            raise ValueError("output_queue_size must be 0 or greater")
+
+        if not isinstance(config.output_batch_size, int):
+            raise TypeError("output_batch_size must be an integer")
+        if config.output_batch_size < 1:
+            raise ValueError("output_batch_size must be at least 1")
+
+        if not isinstance(config.output_flush_interval, float):
+            raise TypeError("output_flush_interval must be a float")
+        if config.output_flush_interval < 0:
+            raise ValueError("output_flush_interval must be 0 or greater")
+
+        if not isinstance(config.output_fsync, (str, FsyncPolicy)):
+            raise TypeError("output_fsync must be a string or FsyncPolicy enum")
+        if isinstance(config.output_fsync, str):
+            try:
+                config.output_fsync = FsyncPolicy.from_str(config.output_fsync)
+            except ValueError as e:
+                raise ValueError(f"Invalid fsync policy: {str(e)}")
+
         # Validate topic pattern
         if config.topic_pattern is not None:
             if not isinstance(config.topic_pattern, str):
@@ -263,6 +711,27 @@ class FilterOpticalCharacterRecognition(Filter):
                 if not pattern.isidentifier():
                     raise ValueError(f"Invalid topic name in exclude_topics: {pattern}")
 
+        # Validate ROI metadata key
+        if not isinstance(config.roi_meta_key, str):
+            raise TypeError("roi_meta_key must be a string")
+        if not config.roi_meta_key:
+            raise ValueError("roi_meta_key cannot be empty")
+
+        # Validate preprocessing steps
+        if not isinstance(config.preprocess, list):
+            raise TypeError("preprocess must be a list")
+        if not all(isinstance(step, str) for step in config.preprocess):
+            raise TypeError("All elements in preprocess must be strings")
+        try:
+            PreprocessPipeline(config.preprocess)
+        except ValueError as e:
+            raise ValueError(f"Invalid preprocessing step: {str(e)}")
+
+        # Validate engine profiles
+        if not isinstance(config.engine_profiles, dict):
+            raise TypeError("engine_profiles must be a dict")
+        profiles = parse_profiles(config.engine_profiles)
+
         # Validate visualization settings
         if not isinstance(config.draw_visualization, bool):
             raise TypeError("draw_visualization must be a boolean")
@@ -290,12 +759,32 @@ class FilterOpticalCharacterRecognition(Filter):
         if config.text_scale_factor <= 0:
             raise ValueError("text_scale_factor must be greater than 0")
 
+        if not isinstance(config.visualization_max_fps, float):
+            raise TypeError("visualization_max_fps must be a float")
+        if config.visualization_max_fps < 0:
+            raise ValueError("visualization_max_fps must be 0 or greater")
+
         # Validate performance optimization settings
         if not isinstance(config.frame_skip, int):
             raise TypeError("frame_skip must be an integer")
         if config.frame_skip < 1:
             raise ValueError("frame_skip must be at least 1")
 
+        if not isinstance(config.change_threshold, float):
+            raise TypeError("change_threshold must be a float")
+        if config.change_threshold < 0 or config.change_threshold > 1.0:
+            raise ValueError("change_threshold must be between 0 and 1.0")
+
+        if not isinstance(config.max_staleness, int):
+            raise TypeError("max_staleness must be an integer")
+        if config.max_staleness < 0:
+            raise ValueError("max_staleness must be 0 or greater")
+
+        if not isinstance(config.text_prefilter_threshold, float):
+            raise TypeError("text_prefilter_threshold must be a float")
+        if config.text_prefilter_threshold < 0 or config.text_prefilter_threshold > 0.5:
+            raise ValueError("text_prefilter_threshold must be between 0 and 0.5")
+
         if not isinstance(config.confidence_threshold, float):
             raise TypeError("confidence_threshold must be a float")
         if config.confidence_threshold < 0 or config.confidence_threshold > 1.0:
@@ -307,6 +796,187 @@ class FilterOpticalCharacterRecognition(Filter):
         if not isinstance(config.optimize_params, bool):
             raise TypeError("optimize_params must be a boolean")
 
+        if not isinstance(config.easyocr_batch_size, int):
+            raise TypeError("easyocr_batch_size must be an integer")
+        if config.easyocr_batch_size < 0:
+            raise ValueError("easyocr_batch_size must be 0 or greater")
+
+        # Validate OCR executor
+        if not isinstance(config.ocr_executor, (str, OCRExecutor)):
+            raise TypeError("ocr_executor must be a string or OCRExecutor enum")
+        if isinstance(config.ocr_executor, str):
+            try:
+                config.ocr_executor = OCRExecutor.from_str(config.ocr_executor)
+            except ValueError as e:
+                raise ValueError(f"Invalid OCR executor: {str(e)}")
+
+        if not isinstance(config.ocr_workers, int):
+            raise TypeError("ocr_workers must be an integer")
+        if config.ocr_workers < 1:
+            raise ValueError("ocr_workers must be at least 1")
+
+        if not isinstance(config.share_models, bool):
+            raise TypeError("share_models must be a boolean")
+        if config.share_models:
+            if config.ocr_executor != OCRExecutor.PROCESS:
+                raise ValueError("share_models requires ocr_executor 'process'")
+            if "fork" not in multiprocessing.get_all_start_methods():
+                raise ValueError("share_models requires the fork start method")
+            if (
+                config.ocr_engine in (OCREngine.EASYOCR, OCREngine.HYBRID)
+                and config.gpu
+            ):
+                raise ValueError(
+                    "share_models requires gpu false, CUDA cannot be used in forked workers"
+                )
+
+        if not isinstance(config.ocr_cpu_affinity, list):
+            raise TypeError("ocr_cpu_affinity must be a list")
+        if not all(isinstance(cpu, int) for cpu in config.ocr_cpu_affinity):
+            raise TypeError("All elements in ocr_cpu_affinity must be integers")
+        if config.ocr_cpu_affinity:
+            if config.ocr_executor != OCRExecutor.PROCESS:
+                raise ValueError("ocr_cpu_affinity requires ocr_executor 'process'")
+            if not hasattr(os, "sched_setaffinity"):
+                raise ValueError("ocr_cpu_affinity is not supported on this platform")
+            if any(cpu < 0 for cpu in config.ocr_cpu_affinity):
+                raise ValueError("ocr_cpu_affinity must not contain negative CPU ids")
+
+        if not isinstance(config.ocr_worker_threads, int):
+            raise TypeError("ocr_worker_threads must be an integer")
+        if config.ocr_worker_threads < 0:
+            raise ValueError("ocr_worker_threads must be 0 or greater")
+        if config.ocr_worker_threads and config.ocr_executor != OCRExecutor.PROCESS:
+            raise ValueError("ocr_worker_threads requires ocr_executor 'process'")
+
+        if not isinstance(config.warmup, bool):
+            raise TypeError("warmup must be a boolean")
+
+        if not isinstance(config.adaptive_resolution, bool):
+            raise TypeError("adaptive_resolution must be a boolean")
+
+        if not isinstance(config.min_text_height, int):
+            raise TypeError("min_text_height must be an integer")
+        if config.min_text_height < 1:
+            raise ValueError("min_text_height must be at least 1")
+
+        if not isinstance(config.adaptive_probe_interval, int):
+            raise TypeError("adaptive_probe_interval must be an integer")
+        if config.adaptive_probe_interval < 1:
+            raise ValueError("adaptive_probe_interval must be at least 1")
+
+        if not isinstance(config.async_ocr, bool):
+            raise TypeError("async_ocr must be a boolean")
+
+        if config.ocr_executor == OCRExecutor.PROCESS and config.tesseract_workers > 0:
+            raise ValueError(
+                "tesseract_workers cannot be combined with ocr_executor 'process', "
+                "use ocr_executor 'thread' to share the Tesseract worker pool"
+            )
+
+        # Validate detect-then-track settings
+        if not isinstance(config.detect_interval, int):
+            raise TypeError("detect_interval must be an integer")
+        if config.detect_interval < 0:
+            raise ValueError("detect_interval must be 0 or greater")
+        if config.detect_interval > 0:
+            if config.ocr_engine != OCREngine.EASYOCR:
+                raise ValueError("detect_interval is only supported with easyocr")
+            if config.ocr_executor != OCRExecutor.NONE:
+                raise ValueError("detect_interval cannot be combined with ocr_executor")
+
+        if not isinstance(config.track_min_score, float):
+            raise TypeError("track_min_score must be a float")
+        if config.track_min_score < 0 or config.track_min_score > 1.0:
+            raise ValueError("track_min_score must be between 0 and 1.0")
+
+        if not isinstance(config.track_change_tolerance, int):
+            raise TypeError("track_change_tolerance must be an integer")
+        if config.track_change_tolerance < 0 or config.track_change_tolerance > 64:
+            raise ValueError("track_change_tolerance must be between 0 and 64")
+
+        # Validate result cache
+        if not isinstance(config.result_cache_size, int):
+            raise TypeError("result_cache_size must be an integer")
+        if config.result_cache_size < 0:
+            raise ValueError("result_cache_size must be 0 or greater")
+
+        if not isinstance(config.result_cache_mode, (str, FingerprintMode)):
+            raise TypeError(
+                "result_cache_mode must be a string or FingerprintMode enum"
+            )
+        if isinstance(config.result_cache_mode, str):
+            try:
+                config.result_cache_mode = FingerprintMode.from_str(
+                    config.result_cache_mode
+                )
+            except ValueError as e:
+                raise ValueError(f"Invalid result cache mode: {str(e)}")
+
+        if not isinstance(config.result_cache_tolerance, int):
+            raise TypeError("result_cache_tolerance must be an integer")
+        if config.result_cache_tolerance < 0 or config.result_cache_tolerance > 64:
+            raise ValueError("result_cache_tolerance must be between 0 and 64")
+
+        # Validate profiling
+        if not isinstance(config.stage_timing, bool):
+            raise TypeError("stage_timing must be a boolean")
+
+        if config.metrics_path is not None:
+            if not isinstance(config.metrics_path, str):
+                raise TypeError("metrics_path must be a string or None")
+            if not config.metrics_path:
+                raise ValueError("metrics_path cannot be empty")
+
+        if not isinstance(config.metrics_interval, float):
+            raise TypeError("metrics_interval must be a float")
+        if config.metrics_interval <= 0:
+            raise ValueError("metrics_interval must be greater than 0")
+
+        if (
+            config.ocr_engine == OCREngine.EASYOCR
+            and config.easyocr_batch_size > 0
+            and config.ocr_executor != OCRExecutor.NONE
+        ):
+            raise ValueError(
+                "easyocr_batch_size already recognizes all topics of a frame together "
+                "and cannot be combined with ocr_executor"
+            )
+
+        if config.ocr_engine == OCREngine.HYBRID and config.easyocr_batch_size > 0:
+            raise ValueError(
+                "easyocr_batch_size cannot be combined with ocr_engine 'hybrid'"
+            )
+
+        if profiles:
+            # Both recognize through EasyOCR internals that readtext() arguments do not reach
+            if config.ocr_engine == OCREngine.EASYOCR and config.easyocr_batch_size > 0:
+                raise ValueError(
+                    "engine_profiles cannot be combined with easyocr_batch_size"
+                )
+            if config.detect_interval > 0:
+                raise ValueError(
+                    "engine_profiles cannot be combined with detect_interval"
+                )
+            if config.tesseract_workers > 0 and any(
+                profile.oem is not None for _, profile in profiles
+            ):
+                raise ValueError(
+                    "oem in engine_profiles cannot be used with tesseract_workers, "
+                    "the worker processes load a single engine mode"
+                )
+
+        if config.adaptive_resolution:
+            # Both work on image geometry the text height measurements do not cover
+            if config.detect_interval > 0:
+                raise ValueError(
+                    "adaptive_resolution cannot be combined with detect_interval"
+                )
+            if config.ocr_engine == OCREngine.EASYOCR and config.easyocr_batch_size > 0:
+                raise ValueError(
+                    "adaptive_resolution cannot be combined with easyocr_batch_size"
+                )
+
         return config
 
     def setup(self, config: FilterOpticalCharacterRecognitionConfig):
@@ -332,8 +1002,16 @@ class FilterOpticalCharacterRecognition(Filter):
         self.write_output_file = config.write_output_file
         self.topic_pattern = config.topic_pattern
         self.exclude_topics = config.exclude_topics
+        self.roi_meta_key = config.roi_meta_key
+        self.preprocess = PreprocessPipeline(config.preprocess)
+        self.profiles = ProfileRouter(parse_profiles(config.engine_profiles))
         self.output_file = None
-        self.subject_data = list()
+        self.segment_writer = None
+        self.subject_data_format = config.subject_data_format
+        self.subject_writer = None
+        self.output_writer = None
+        self.subject_queue = None
+        self.sqlite_writer = None
         # Visualization settings
         self.draw_visualization = config.draw_visualization
         self.visualization_topic = config.visualization_topic
@@ -344,9 +1022,25 @@ class FilterOpticalCharacterRecognition(Filter):
         self.confidence_threshold = config.confidence_threshold
         self.gpu = config.gpu
         self.optimize_params = config.optimize_params
-        self.frame_counter = 0
-        # Cache for OCR results to reuse during skipped frames
-        self.ocr_cache = {}
+        self.easyocr_batch_size = config.easyocr_batch_size
+        self.ocr_executor = config.ocr_executor
+        self.ocr_workers = config.ocr_workers
+        self.executor = None
+        self.farm = None
+        self.result_cache = None
+        if config.result_cache_size > 0:
+            self.result_cache = OCRResultCache(
+                config.result_cache_size,
+                config.result_cache_mode,
+                config.result_cache_tolerance,
+            )
+        # Per-topic gating, topics reuse their own last result while skipped
+        self.change_gate = TopicChangeGate(
+            self.frame_skip, config.change_threshold, config.max_staleness
+        )
+        self.text_prefilter = None
+        if config.text_prefilter_threshold > 0:
+            self.text_prefilter = TextPresenceFilter(config.text_prefilter_threshold)
         # Video chunks directory
         self.video_chunks_dir = config.video_chunks_dir
 
@@ -360,47 +1054,275 @@ class FilterOpticalCharacterRecognition(Filter):
         else:
             self.topic_regex = None
             logger.info("No topic pattern specified, will process all topics")
+        # Patterns compiled once, decisions cached per topic
+        self.topic_router = TopicRouter(self.exclude_topics, self.topic_pattern)
 
         if self.ocr_engine == OCREngine.TESSERACT:
-            pytesseract.pytesseract.tesseract_cmd = config.tesseract_cmd
+            self.engine = TesseractEngine(
+                self.language,
+                config.tesseract_cmd,
+                config.tesseract_workers,
+                config.tessdata_dir,
+            )
         elif self.ocr_engine == OCREngine.EASYOCR:
             gpu_param = self.gpu  # Only use GPU if specifically enabled
-            logger.info(
-                f"Initializing EasyOCR with languages: {self.language}, GPU: {gpu_param}"
+            self.engine = EasyOCREngine(
+                self.language,
+                gpu_param,
+                self.optimize_params,
+                self.confidence_threshold,
+                self.easyocr_batch_size,
+            )
+        elif self.ocr_engine == OCREngine.HYBRID:
+            # Both engines are loaded, here or in every worker process
+            self.engine = HybridEngine(
+                TesseractEngine(
+                    config.tesseract_language,
+                    config.tesseract_cmd,
+                    config.tesseract_workers,
+                    config.tessdata_dir,
+                ),
+                EasyOCREngine(
+                    self.language,
+                    self.gpu,
+                    self.optimize_params,
+                    self.confidence_threshold,
+                ),
             )
-            self.easyocr_reader = easyocr.Reader(self.language, gpu=gpu_param)
         else:
             raise ValueError("Invalid OCR engine selection.")
+        self.engine_router = None
+        if self.ocr_engine == OCREngine.HYBRID:
+            self.engine_router = EngineRouter(
+                parse_engine_routes(config.engine_routes),
+                config.hybrid_contrast_threshold,
+            )
+        # Engine of the last result of each job, as carried by the results
+        self.job_engines: "OrderedDict[str, str]" = OrderedDict()
+
+        start = time.perf_counter()
+        if self.ocr_executor == OCRExecutor.PROCESS:
+            # Without share_models, each worker process loads its own copy of the
+            # engine. With it, the engine is loaded once in a spawned fork server
+            # and the workers are forked from there: this process already runs
+            # openfilter's ZeroMQ threads, so it is never forked itself
+            logger.info(
+                f"Starting OCR worker farm with {self.ocr_workers} workers"
+                + (" (shared models)" if config.share_models else "")
+            )
+            self.farm = OCRWorkerFarm(
+                self.engine,
+                self.ocr_workers,
+                share_models=config.share_models,
+                warmup=config.warmup,
+                cpus=config.ocr_cpu_affinity,
+                threads=config.ocr_worker_threads,
+            )
+            self.farm.start()
+        else:
+            self.engine.start()
+            if config.warmup:
+                self.engine.warm_up()
+            if self.ocr_executor == OCRExecutor.THREAD:
+                logger.info(f"Starting OCR thread pool with {self.ocr_workers} workers")
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.ocr_workers, thread_name_prefix="ocr"
+                )
+        logger.info(
+            f"OCR engine ready in {time.perf_counter() - start:.2f}s"
+            + (" (warmed up)" if config.warmup else "")
+        )
+        self.easyocr_reader = getattr(self.engine, "reader", None)
+
+        self.visualizer = None
+        if self.draw_visualization:
+            self.visualizer = VisualizationRenderer(
+                self.visualization_resize_factor,
+                self.text_scale_factor,
+                config.visualization_max_fps,
+            )
+            self.visualizer.start()
+
+        self.async_worker = None
+        self.async_seq = 0
+        if config.async_ocr:
+            logger.info("Running OCR on a background thread")
+            self.async_worker = LatestFrameWorker()
+            self.async_worker.start()
+
+        self.adaptive = None
+        if config.adaptive_resolution:
+            self.adaptive = AdaptiveScaler(
+                config.min_text_height, config.adaptive_probe_interval
+            )
+
+        self.tracker = None
+        if config.detect_interval > 0:
+            self.tracker = TextTracker(
+                self.engine,
+                config.detect_interval,
+                config.track_min_score,
+                config.track_change_tolerance,
+            )
 
         if config.debug:
             logger.setLevel(logging.DEBUG)
 
+        # Per-job engine times are only measured when someone reads them
+        self.stage_timing = config.stage_timing
+        self.collect_timing = config.stage_timing or config.metrics_path is not None
+        self.frames_processed = 0
+        self.stage_stats = None
+        self.metrics_exporter = None
+        if config.metrics_path:
+            self.stage_stats = RollingStats()
+            self.metrics_exporter = PrometheusFileExporter(
+                config.metrics_path, config.metrics_interval
+            )
+            logger.info(f"Writing metrics to {config.metrics_path}")
+
+        if config.output_sqlite_path:
+            # Never written on the processing thread
+            sqlite_sink = SQLiteResultSink(config.output_sqlite_path)
+            sqlite_sink.open()
+            self.sqlite_writer = BackgroundWriter(
+                sqlite_sink,
+                config.output_queue_size or 1000,
+                config.output_batch_size,
+                config.output_flush_interval,
+                name="ocr-sqlite-writer",
+            )
+            self.sqlite_writer.start()
+            logger.info(f"Writing OCR results to {config.output_sqlite_path}")
+
         if self.write_output_file:
             os.makedirs(os.path.dirname(self.output_json_path), exist_ok=True)
-            try:
-                self.output_file = open(self.output_json_path, "a", encoding="utf-8")
-            except Exception as e:
-                logger.error(f"Failed to open output JSON file: {e}")
-                raise
+            if config.output_segments:
+                self.segment_writer = SegmentedResultWriter(
+                    self.output_json_path[: -len(".json")],
+                    config.output_segment_bytes,
+                    config.output_segment_seconds,
+                    config.output_compression,
+                    config.output_index_block,
+                )
+                self.segment_writer.open()
+                logger.info(
+                    f"Writing OCR results to segments {self.segment_writer.path}"
+                )
+            else:
+                try:
+                    self.output_file = open(
+                        self.output_json_path, "a", encoding="utf-8"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to open output JSON file: {e}")
+                    raise
+            # Subject data is streamed to disk instead of being kept until shutdown
+            self.subject_writer = SubjectDataWriter(
+                os.path.join(
+                    os.path.dirname(self.output_json_path),
+                    f"subject_data.{self.subject_data_format.value}",
+                ),
+                self.subject_data_format,
+                autoflush=config.output_queue_size == 0,
+            )
+            self.subject_writer.open()
+
+            if config.output_queue_size > 0:
+                # Writes and flushes leave the processing thread
+                writer_args = (
+                    config.output_queue_size,
+                    config.output_batch_size,
+                    config.output_flush_interval,
+                    config.output_fsync,
+                )
+                self.output_writer = BackgroundWriter(
+                    self.segment_writer or self.output_file,
+                    *writer_args,
+                    name="ocr-output-writer",
+                )
+                self.subject_queue = BackgroundWriter(
+                    self.subject_writer, *writer_args, name="ocr-subject-writer"
+                )
+                self.output_writer.start()
+                self.subject_queue.start()
 
     def shutdown(self):
         """
         Clean up resources when the filter is shutting down.
 
-        Closes the output file if it was opened and logs the shutdown status.
+        Stops the async worker, OCR executor and engine, closes the output file if it
+        was opened and logs the shutdown status.
         """
+        if self.metrics_exporter:
+            # Final metrics, while the writers and the async worker still report
+            self.write_metrics()
+            self.metrics_exporter = None
+
+        if self.async_worker:
+            self.async_worker.close()
+            logger.info(f"Async OCR stats: {self.async_worker.stats()}")
+            # The result of the last frame may have completed after the last process()
+            latest = self.async_worker.latest()
+            if latest and latest.seq != self.async_seq:
+                topic_results, should_skip, _, _ = latest.value
+                for topic, result in topic_results.items():
+                    if result["ran_ocr"] and not should_skip:
+                        self.record_result(topic, result)
+            self.async_worker = None
+        if self.visualizer:
+            self.visualizer.close()
+            logger.info(f"Visualization stats: {self.visualizer.stats()}")
+            self.visualizer = None
+        if self.executor:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        if self.farm:
+            self.farm.close()
+            self.farm = None
+        self.engine.close()
+
+        if self.result_cache:
+            logger.info(f"OCR result cache stats: {self.result_cache.stats()}")
+        if self.text_prefilter:
+            logger.info(f"Text prefilter stats: {self.text_prefilter.stats()}")
+        if self.tracker:
+            logger.info(f"Text tracker stats: {self.tracker.stats()}")
+        if self.adaptive:
+            logger.info(f"Adaptive resolution stats: {self.adaptive.stats()}")
+        if self.engine_router:
+            logger.info(f"Engine routing stats: {self.engine_router.stats()}")
+
+        # Drain the background writers before closing their files
+        for writer in (self.output_writer, self.subject_queue, self.sqlite_writer):
+            if writer:
+                writer.close()
+                logger.info(f"{writer.name} stats: {writer.stats()}")
+        if self.sqlite_writer:
+            self.sqlite_writer.target.close()
+            logger.info(
+                f"Saved {self.sqlite_writer.target.records} OCR results to {self.sqlite_writer.target.path}"
+            )
+        self.output_writer = None
+        self.subject_queue = None
+        self.sqlite_writer = None
+
         if self.output_file:
             self.output_file.close()
             logger.info("Closed output JSON file.")
-            # Save subject data to JSON file
-            # Save subject data to JSON file
-            subject_data_file = os.path.join(
-                os.path.dirname(self.output_json_path), "subject_data.json"
+        if self.segment_writer:
+            self.segment_writer.close()
+            logger.info(
+                f"Closed OCR result segments: {self.segment_writer.segments} segments, "
+                f"{self.segment_writer.blocks} blocks, {self.segment_writer.records} records"
             )
-            with open(subject_data_file, "w") as f:
-                json.dump(self.subject_data, f, indent=4)
-
-            logger.info(f"Saved subject data to {subject_data_file}")
+            self.segment_writer = None
+        if self.subject_writer:
+            self.subject_writer.close()
+            logger.info(
+                f"Saved {self.subject_writer.records} subject data records to {self.subject_writer.path}"
+            )
+            self.subject_writer = None
 
         if self.write_output_file:
             logger.info(
@@ -413,6 +1335,9 @@ class FilterOpticalCharacterRecognition(Filter):
         """
         Overlay all recognized OCR text on the image.
 
+        process() renders the visualization topic on a background thread; this
+        draws the same overlay synchronously.
+
         Args:
             image: Original image
             texts: List of OCR text strings
@@ -420,197 +1345,639 @@ class FilterOpticalCharacterRecognition(Filter):
         Returns:
             Annotated image with text drawn in a list-style overlay
         """
-        vis_image = image.copy()
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        font_scale = max(
-            0.3, 0.5 * self.visualization_resize_factor * self.text_scale_factor
+        return draw_texts(
+            image, texts, self.visualization_resize_factor, self.text_scale_factor
+        )
+
+    def run_ocr(
+        self,
+        images: list,
+        durations: Optional[list] = None,
+        heights: Optional[list] = None,
+        profiles: Optional[list] = None,
+        engines: Optional[list] = None,
+    ) -> list[tuple[list[str], list[float]]]:
+        """
+        Recognize a batch of topic images with the configured executor.
+
+        Args:
+            images: Images of the selected topics of one frame
+            durations: If given, receives the seconds each image took, except when
+                EasyOCR batching recognizes all images together
+            heights: If given, receives the list of text heights found in each image,
+                not supported with EasyOCR batching
+            profiles: If given, the EngineProfile of each image, None for the engine defaults
+            engines: With the hybrid engine, the engine name of each image
+
+        Returns:
+            list[tuple[list[str], list[float]]]: Texts and confidences per image,
+            in the same order as ``images``
+        """
+        if self.farm:
+            # Timed inside the workers, so durations exclude the handoff
+            results = self.farm.map(
+                images, heights is not None, durations is not None, profiles, engines
+            )
+        elif self.ocr_engine == OCREngine.EASYOCR and self.easyocr_batch_size:
+            return self.engine.recognize_batch(images)
+        else:
+            recognize = (
+                self.engine.recognize
+                if heights is None
+                else self.engine.recognize_detail
+            )
+            if durations is not None:
+                recognize = partial(_timed_call, recognize)
+            args = [images]
+            if profiles is not None or engines is not None:
+                args.append(profiles or [None] * len(images))
+            if engines is not None:
+                args.append(engines)
+            # Not worth a round trip through the thread pool for a single image
+            if self.executor is None or len(images) < 2:
+                results = [recognize(*job) for job in zip(*args)]
+            else:
+                results = list(self.executor.map(recognize, *args))
+
+        if durations is not None:
+            durations.extend(seconds for _, seconds in results)
+            results = [result for result, _ in results]
+        if heights is not None:
+            heights.extend(result[2] for result in results)
+            results = [result[:2] for result in results]
+        return results
+
+    def recognize_jobs(
+        self,
+        jobs: list[tuple[str, object]],
+        durations: Optional[list] = None,
+        heights: Optional[list] = None,
+    ) -> list[tuple[list[str], list[float]]]:
+        """
+        Recognize (topic, image) jobs with the text tracker if enabled, otherwise with run_ocr().
+
+        Returns:
+            list[tuple[list[str], list[float]]]: Texts and confidences per job, in the same order
+        """
+        if self.tracker:
+            update = self.tracker.update
+            if durations is None:
+                return [update(topic, image) for topic, image in jobs]
+            results = []
+            for topic, image in jobs:
+                result, seconds = _timed_call(partial(update, topic), image)
+                results.append(result)
+                durations.append(seconds)
+            return results
+        profiles = None
+        if self.profiles:
+            profiles = [self.profiles.profile(key) for key, _ in jobs]
+        engines = None
+        if self.engine_router:
+            engines = [self.job_engines[key] for key, _ in jobs]
+        return self.run_ocr(
+            [image for _, image in jobs], durations, heights, profiles, engines
         )
-        font_thickness = max(1, int(self.text_scale_factor))
-        font_color = (0, 255, 0)  # Green text
-        line_height = int(20 * self.text_scale_factor)
 
-        for i, text in enumerate(texts):
-            y = 30 + i * line_height
-            cv2.putText(
-                vis_image, text, (10, y), font, font_scale, font_color, font_thickness
+    def recognize_topics(
+        self,
+        selected: list[tuple[str, object]],
+        job_times: Optional[dict[str, float]] = None,
+        job_heights: Optional[dict[str, list]] = None,
+    ) -> list[tuple[list[str], list[float]]]:
+        """
+        Recognize the selected topics of a frame, serving repeated images from the result cache.
+
+        Args:
+            selected: (topic, image) pairs that passed topic routing, ROIs use roi_job_key() names
+            job_times: If given, receives the engine seconds of each job that was recognized
+            job_heights: If given, receives the text heights of each job that was recognized
+
+        Returns:
+            list[tuple[list[str], list[float]]]: Texts and confidences per topic, in the same order
+        """
+        images = [image for _, image in selected]
+        if self.engine_router:
+            # Cache hits too, their results are labelled like fresh ones
+            for key, image in selected:
+                self.job_engines[key] = self.engine_router.engine(key, image)
+                self.job_engines.move_to_end(key)
+            # Bounded like the change gate, which keeps the results they label
+            while len(self.job_engines) > MAX_CACHED_KEYS:
+                self.job_engines.popitem(last=False)
+        durations = [] if job_times is not None else None
+        heights = [] if job_heights is not None else None
+        if self.result_cache is None:
+            results = self.recognize_jobs(selected, durations, heights)
+            keys = [key for key, _ in selected]
+            if durations:
+                job_times.update(zip(keys, durations))
+            if heights:
+                job_heights.update(zip(keys, heights))
+            return results
+
+        results: list = [None] * len(selected)
+        keys = []
+        pending = []
+        for index, (topic, _) in enumerate(selected):
+            key = self.result_cache.fingerprint(images[index])
+            keys.append(key)
+            cached = self.result_cache.get(topic, key)
+            if cached is not None:
+                # Copies, so frames never share the cached lists
+                results[index] = (list(cached[0]), list(cached[1]))
+            else:
+                pending.append(index)
+
+        if pending:
+            recognized = self.recognize_jobs(
+                [selected[index] for index in pending], durations, heights
+            )
+            for index, result in zip(pending, recognized):
+                self.result_cache.put(selected[index][0], keys[index], result)
+                results[index] = result
+            pending_keys = [selected[index][0] for index in pending]
+            if durations:
+                job_times.update(zip(pending_keys, durations))
+            if heights:
+                job_heights.update(zip(pending_keys, heights))
+        else:
+            logger.debug("All topics served from the OCR result cache")
+
+        return results
+
+    def job_result(
+        self, key: str, recognized: dict[str, tuple[list[str], list[float]]]
+    ) -> tuple[list[str], list[float]]:
+        """
+        Result of an OCR job in the current frame.
+
+        Args:
+            key (str): Topic name or roi_job_key() of the job
+            recognized: Results of the jobs that ran OCR in this frame
+
+        Returns:
+            tuple[list[str], list[float]]: The fresh result, or a copy of the last one if the job was gated
+        """
+        if key in recognized:
+            return recognized[key]
+        # Copies, so frames never share the stored lists
+        texts, confidences = self.change_gate.last_result(key)
+        return list(texts), list(confidences)
+
+    def select_topics(self, frames: dict[str, Frame]) -> list[tuple[str, Frame]]:
+        """
+        Route the topics of a frame.
+
+        Returns:
+            list[tuple[str, Frame]]: Topics that are not excluded, match topic_pattern
+            and are not flagged with skip_ocr
+        """
+        selected: list[tuple[str, Frame]] = []
+        for topic, frame in frames.items():
+            if not self.topic_router.selected(topic):
+                continue
+
+            frame_meta = frame.data.get("meta", {})
+            if frame_meta.get(SKIP_OCR_FLAG, False):
+                logger.debug(f"Skipping OCR for topic {topic} due to skip_ocr flag")
+                continue
+
+            selected.append((topic, frame))
+        return selected
+
+    def build_jobs(
+        self, selected: list[tuple[str, Frame]]
+    ) -> tuple[list, dict, dict[str, float]]:
+        """
+        Split the selected topics into OCR jobs.
+
+        Returns:
+            tuple[list, dict, dict[str, float]]: (key, image) jobs, one per topic or one per
+            ROI for topics that supply ROIs, with the preprocessing steps applied, the parsed
+            ROIs of those topics and the adaptive resolution scale of each job
+        """
+        jobs: list[tuple[str, object]] = []
+        topic_rois: dict[str, list[tuple[str, tuple[int, int, int, int]]]] = {}
+        for topic, frame in selected:
+            # OCR never writes to the image, so it is not copied
+            image = readonly_bgr(frame)
+            rois = frame.data.get("meta", {}).get(self.roi_meta_key)
+            if rois is None:
+                jobs.append((topic, image))
+                continue
+            topic_rois[topic] = parse_rois(rois, image.shape)
+            for roi_id, (x1, y1, x2, y2) in topic_rois[topic]:
+                # Views into the frame image, nothing is copied
+                jobs.append((roi_job_key(topic, roi_id), image[y1:y2, x1:x2]))
+        if self.preprocess:
+            # Once per job, so gating, caching and OCR all see the same smaller image
+            jobs = [(key, self.preprocess.apply(image)[0]) for key, image in jobs]
+        job_scales: dict[str, float] = {}
+        if self.adaptive:
+            scaled = []
+            for key, image in jobs:
+                image, job_scales[key] = self.adaptive.resize(key, image)
+                scaled.append((key, image))
+            jobs = scaled
+        return jobs, topic_rois, job_scales
+
+    def recognize_frame(
+        self,
+        jobs: list[tuple[str, object]],
+        topic_rois: dict,
+        topics: list[tuple[str, object]],
+        timer: Optional[StageTimer] = None,
+        job_times: Optional[dict[str, float]] = None,
+        job_scales: Optional[dict[str, float]] = None,
+    ) -> dict[str, dict]:
+        """
+        Gate and recognize the OCR jobs of a frame and gather the results per topic.
+
+        Args:
+            jobs: (key, image) jobs from build_jobs()
+            topic_rois: Parsed ROIs from build_jobs()
+            topics: (topic, frame_id) of the selected topics
+            timer: Receives the "ocr" and "aggregation" stage times if given
+            job_times: Receives the engine seconds of each recognized job if given
+            job_scales: Adaptive resolution scales from build_jobs()
+
+        Returns:
+            dict[str, dict]: Per topic "frame_id", "texts", "confidences", "rois"
+            (None without ROIs) and "ran_ocr"
+        """
+        timer = timer or StageTimer()
+        with timer.stage("ocr"):
+            # Per-job gating: unchanged topics and ROIs reuse their last result
+            pending = [
+                (key, image)
+                for key, image in jobs
+                if self.change_gate.should_run(key, image)
+            ]
+
+            recognized: dict[str, tuple[list[str], list[float]]] = {}
+            if self.text_prefilter:
+                # Jobs without text-like strokes get an empty result, the engine is not called
+                with_text = []
+                for key, image in pending:
+                    if self.text_prefilter.has_text(image):
+                        with_text.append((key, image))
+                    else:
+                        logger.debug(f"No text found in {key}, skipping OCR")
+                        recognized[key] = ([], [])
+                        self.job_engines.pop(key, None)
+                pending = with_text
+
+            # Recognize the remaining jobs, results come back in job order
+            job_heights = {} if self.adaptive else None
+            recognized.update(
+                zip(
+                    [key for key, _ in pending],
+                    self.recognize_topics(pending, job_times, job_heights),
+                )
             )
+            for key, result in recognized.items():
+                self.change_gate.update(key, result)
+            for key, heights in (job_heights or {}).items():
+                self.adaptive.observe(key, heights, (job_scales or {}).get(key, 1.0))
+
+        with timer.stage("aggregation"):
+            return self.gather_results(topic_rois, topics, recognized)
+
+    def gather_results(
+        self,
+        topic_rois: dict,
+        topics: list[tuple[str, object]],
+        recognized: dict[str, tuple[list[str], list[float]]],
+    ) -> dict[str, dict]:
+        """Gather the job results of a frame per topic, see recognize_frame()."""
+        results: dict[str, dict] = {}
+        for topic, frame_id in topics:
+            roi_results = None
+            if topic in topic_rois:
+                # Topic texts are the texts of its ROIs, in ROI order
+                roi_results = {}
+                texts, confidences = [], []
+                ran_ocr = False
+                engines = set()
+                for roi_id, _ in topic_rois[topic]:
+                    key = roi_job_key(topic, roi_id)
+                    roi_texts, roi_confidences = self.job_result(key, recognized)
+                    ran_ocr = ran_ocr or key in recognized
+                    roi_engine = self.job_engines.get(key)
+                    roi_results[roi_id] = {
+                        "texts": roi_texts,
+                        "ocr_confidence": average_confidence(roi_confidences),
+                    }
+                    if self.engine_router:
+                        roi_results[roi_id]["ocr_engine"] = roi_engine
+                        engines.add(roi_engine)
+                    texts += roi_texts
+                    confidences += roi_confidences
+                # Engines of the ROIs, e.g. "easyocr+tesseract" when they differ
+                engine = "+".join(sorted(engines - {None})) or None
+            else:
+                texts, confidences = self.job_result(topic, recognized)
+                ran_ocr = topic in recognized
+                engine = self.job_engines.get(topic)
+
+            results[topic] = {
+                "frame_id": frame_id,
+                "texts": texts,
+                "confidences": confidences,
+                "rois": roi_results,
+                "ran_ocr": ran_ocr,
+            }
+            if self.engine_router:
+                results[topic]["engine"] = engine
+        return results
+
+    def result_record(self, topic: str, result: dict) -> dict:
+        """Output record of the OCR result of a topic."""
+        ocr_result = {
+            "topic": topic,
+            "frame_id": result["frame_id"],
+            "texts": result["texts"],
+            "ocr_confidence": average_confidence(result["confidences"]),
+            "timestamp": round(time.time(), 3),
+        }
+        if result["rois"] is not None:
+            ocr_result["rois"] = result["rois"]
+        if "engine" in result:
+            ocr_result["ocr_engine"] = result["engine"]
+        return ocr_result
+
+    def record_result(self, topic: str, result: dict):
+        """Send a fresh OCR result to the SQLite sink and, for main, to the output file."""
+        ocr_result = self.result_record(topic, result)
+        if self.sqlite_writer:
+            self.sqlite_writer.put(ocr_result)
+        if self.write_output_file and topic == "main":
+            self.write_result(ocr_result)
+
+    def write_result(self, ocr_result: dict):
+        """Append an output record to the output file or segments."""
+        # Segments serialize records themselves, the output file takes lines
+        if self.segment_writer:
+            record = ocr_result
+        else:
+            record = json.dumps(ocr_result, ensure_ascii=False) + "\n"
+
+        if self.output_writer:
+            self.output_writer.put(record)
+        elif self.segment_writer:
+            self.segment_writer.write(record)
+            self.segment_writer.flush()
+        else:
+            self.output_file.write(record)
+            self.output_file.flush()
+
+    def recognize_frame_async(
+        self,
+        jobs: list[tuple[str, object]],
+        topic_rois: dict,
+        topics: list[tuple[str, object]],
+        job_scales: dict[str, float],
+        should_skip: bool,
+    ) -> tuple[dict[str, dict], bool, StageTimer, Optional[dict[str, float]]]:
+        """
+        Run recognize_frame() on the async worker.
 
-        if self.visualization_resize_factor != 1.0:
-            new_w = int(vis_image.shape[1] * self.visualization_resize_factor)
-            new_h = int(vis_image.shape[0] * self.visualization_resize_factor)
-            vis_image = cv2.resize(vis_image, (new_w, new_h))
+        Returns:
+            tuple: The results, the skip_ocr state of the frame, its stage timer and
+            the engine seconds per job (None unless timing is enabled)
+        """
+        timer = StageTimer()
+        job_times = {} if self.collect_timing else None
+        results = self.recognize_frame(
+            jobs, topic_rois, topics, timer, job_times, job_scales
+        )
+        return results, should_skip, timer, job_times
+
+    def observe_metrics(
+        self,
+        timer: StageTimer,
+        job_times: Optional[dict[str, float]],
+        ocr_seconds: Optional[float] = None,
+    ):
+        """
+        Add the stage times of a frame to the rolling metrics and write the metrics file when due.
 
-        return vis_image
+        Args:
+            timer: Stage times of the frame
+            job_times: Engine seconds of the jobs recognized in the frame
+            ocr_seconds: OCR time of a fresh async result, which is not part of the frame's stages
+        """
+        self.frames_processed += 1
+        for name, seconds in timer.stages.items():
+            self.stage_stats.observe(name, seconds)
+        if ocr_seconds is not None:
+            self.stage_stats.observe("ocr", ocr_seconds)
+        for seconds in (job_times or {}).values():
+            self.stage_stats.observe("ocr_job", seconds)
+        self.stage_stats.observe("total", timer.elapsed())
+        if self.metrics_exporter.due():
+            self.write_metrics()
+
+    def write_metrics(self):
+        """Write the current metrics file."""
+        ratios = {}
+        if self.result_cache:
+            ratios["result"] = self.result_cache.hit_rate
+        gate = self.change_gate
+        if gate.runs + gate.skips:
+            ratios["change_gate"] = gate.skips / (gate.runs + gate.skips)
+        if (
+            self.text_prefilter
+            and self.text_prefilter.passed + self.text_prefilter.skipped
+        ):
+            ratios["text_prefilter"] = self.text_prefilter.skip_rate
+        if self.tracker and self.tracker.reused + self.tracker.recognitions:
+            ratios["tracker"] = self.tracker.reused / (
+                self.tracker.reused + self.tracker.recognitions
+            )
+        writers = (self.output_writer, self.subject_queue, self.sqlite_writer)
+        counters = {
+            "dropped_records_total": sum(w.dropped for w in writers if w),
+        }
+        if self.async_worker:
+            counters["async_dropped_frames_total"] = self.async_worker.dropped
+        if self.text_prefilter:
+            counters["text_prefilter_skipped_total"] = self.text_prefilter.skipped
+        if self.engine_router:
+            for engine, jobs in self.engine_router.jobs.items():
+                counters[f"{engine}_jobs_total"] = jobs
+        self.metrics_exporter.write(
+            self.frames_processed, self.stage_stats, ratios, counters
+        )
 
     def process(self, frames: dict[str, Frame]):
+        timer = StageTimer()
+        job_times = {} if self.collect_timing else None
+        ocr_seconds = None
+
         # Initialize OCR results structure
         ocr_results: dict[str, dict[str, list]] = {}
         processed_topics = []
 
-        # Frame skipping for performance optimization
-        self.frame_counter += 1
-        should_run_ocr = self.frame_counter % self.frame_skip == 0
+        with timer.stage("routing"):
+            selected = self.select_topics(frames)
 
-        # If skipping this frame, use cached results if available
-        if not should_run_ocr and self.ocr_cache:
-            logger.debug(
-                f"Skipping OCR on frame {self.frame_counter}, using cached results"
+            # One OCR job per topic, or one per ROI for topics that supply ROIs
+            jobs, topic_rois, job_scales = self.build_jobs(selected)
+            topics = [
+                (topic, frame.data.get("meta", {}).get("id", None))
+                for topic, frame in selected
+            ]
+
+            # Check if any frame has skip_ocr=True
+            should_skip = any(
+                f.data.get("meta", {}).get(SKIP_OCR_FLAG, False)
+                for f in frames.values()
             )
-            ocr_results = self.ocr_cache
-        else:
-            for topic, frame in frames.items():
-                # Check if topic should be excluded (either exact match or regex pattern)
-                should_exclude = False
-                for pattern in self.exclude_topics:
-                    try:
-                        if re.match(pattern, topic):
-                            should_exclude = True
-                            break
-                    except re.error:
-                        # If pattern is not a valid regex, treat it as an exact match
-                        if pattern == topic:
-                            should_exclude = True
-                            break
-
-                if should_exclude:
-                    logger.debug(
-                        f"Skipping OCR for topic {topic} as it matches exclude pattern"
-                    )
-                    continue
 
-                # Skip if topic doesn't match pattern (if pattern is specified)
-                if self.topic_regex and not self.topic_regex.search(topic):
-                    logger.debug(
-                        f"Skipping OCR for topic {topic} due to topic_regex mismatch"
+        if self.async_worker:
+            with timer.stage("submit"):
+                if jobs:
+                    # Copies, the frames are passed on before the worker reads them
+                    jobs = [(key, image.copy()) for key, image in jobs]
+                    main_meta = (
+                        frames["main"].data.get("meta", {}) if "main" in frames else {}
                     )
-                    continue
-
-                frame_meta = frame.data.get("meta", {})
-                if frame_meta.get(SKIP_OCR_FLAG, False):
-                    logger.debug(f"Skipping OCR for topic {topic} due to skip_ocr flag")
-                    continue
-
-                processed_topics.append(topic)
-                image = frame.rw_bgr.image
-                frame_id = frame_meta.get("id", None)
-                texts: list[str] = []
-                confidences: list[float] = []
-
-                if self.ocr_engine == OCREngine.TESSERACT:
-                    data = pytesseract.image_to_data(
-                        image, lang="+".join(self.language), output_type=Output.DICT
+                    self.async_worker.submit(
+                        main_meta.get("id", topics[0][1]),
+                        partial(
+                            self.recognize_frame_async,
+                            jobs,
+                            topic_rois,
+                            topics,
+                            job_scales,
+                            should_skip,
+                        ),
                     )
-                    lines: dict[int, dict[str, list]] = {}
-                    for i, word in enumerate(data["text"]):
-                        txt = word.strip()
-                        if not txt:
-                            continue
-                        ln = data["line_num"][i]
-                        try:
-                            conf = int(data["conf"][i])
-                        except Exception:
-                            conf = 0
-
-                        if ln not in lines:
-                            lines[ln] = {"words": [], "confs": []}
-                        lines[ln]["words"].append(txt)
-                        lines[ln]["confs"].append(conf)
-
-                    for ln in sorted(lines):
-                        words = lines[ln]["words"]
-                        confs = lines[ln]["confs"]
-                        texts.append(" ".join(words))
-                        # confidence per line
-                        line_conf = sum(confs) / len(confs)
-                        confidences.append(line_conf / 100.0)
-
-                elif self.ocr_engine == OCREngine.EASYOCR:
-                    # Use optimized parameters if configured
-                    if self.optimize_params:
-                        # optimized branch: still ask for (bbox, text, conf)
-                        results = self.easyocr_reader.readtext(
-                            image,
-                            detail=1,
-                            paragraph=False,
-                            min_size=3,
-                            contrast_ths=0.1,
-                            adjust_contrast=0.5,
-                            text_threshold=self.confidence_threshold,
-                        )
-                        for _, txt, conf in results:
-                            if conf >= self.confidence_threshold:
-                                texts.append(txt)
-                                confidences.append(conf)
-                    else:
-                        results = self.easyocr_reader.readtext(image, detail=1)
-                        texts = [t for _, t, _ in results]
-                        confidences = [c for _, _, c in results]
-                else:
-                    raise ValueError("Invalid OCR engine selected.")
+            # Pass frames through with the last completed result, never waiting for OCR
+            latest = self.async_worker.latest()
+            if latest:
+                topic_results, should_skip, ocr_timer, job_times = latest.value
+            else:
+                topic_results, should_skip, ocr_timer, job_times = {}, True, None, None
+            fresh = latest is not None and latest.seq != self.async_seq
+            if latest:
+                self.async_seq = latest.seq
+            if ocr_timer and fresh:
+                ocr_seconds = ocr_timer.stages.get("ocr", 0.0)
+            # Topics opted out of OCR in this frame get no result, not the latest one
+            forwarded_topics = {topic for topic, _ in selected}
+            forwarded = {
+                topic: result
+                for topic, result in topic_results.items()
+                if topic in forwarded_topics
+            }
+        else:
+            latest = None
+            ocr_timer = None
+            topic_results = self.recognize_frame(
+                jobs, topic_rois, topics, timer, job_times, job_scales
+            )
+            forwarded = topic_results
+            fresh = True
 
-                # ocr confidence per frame
-                avg_confidence = 0.0
-                if confidences:
-                    avg_confidence = round(sum(confidences) / len(confidences), 4)
+        with timer.stage("aggregation"):
+            for topic, result in forwarded.items():
+                if result["ran_ocr"]:
+                    processed_topics.append(topic)
 
                 # Store OCR results in the appropriate structure
                 if self.forward_ocr_texts:
                     main_frame = frames.get("main")
                     if main_frame:
                         ocr_results.update(
-                            {topic: {"texts": texts, "ocr_confidence": avg_confidence}}
+                            {
+                                topic: {
+                                    "texts": result["texts"],
+                                    "ocr_confidence": average_confidence(
+                                        result["confidences"]
+                                    ),
+                                }
+                            }
                         )
+                        if result["rois"] is not None:
+                            ocr_results[topic]["rois"] = result["rois"]
+                        if "engine" in result:
+                            ocr_results[topic]["ocr_engine"] = result["engine"]
 
-                if self.output_file and topic == "main":
-                    # Check if any frame has skip_ocr=True
-                    should_skip = any(
-                        f.data.get("meta", {}).get(SKIP_OCR_FLAG, False)
-                        for f in frames.values()
+            # Updated OCR metadata per frame
+            metas = {}
+            for topic, frame in frames.items():
+                # Start with original metadata
+                meta = dict(frame.data.get("meta", {}))
+
+                # Add OCR texts if forwarding is enabled
+                if self.forward_ocr_texts:
+                    meta["ocr_texts"] = ocr_results.get(topic, {}).get("texts", [])
+                    meta["ocr_confidence"] = ocr_results.get(topic, {}).get(
+                        "ocr_confidence", 0.0
                     )
-                    if not should_skip:
-                        ocr_result = {
-                            "topic": topic,
-                            "frame_id": frame_id,
-                            "texts": texts,
-                            "ocr_confidence": avg_confidence,
-                        }
-                        self.output_file.write(
-                            json.dumps(ocr_result, ensure_ascii=False) + "\n"
+                    if "rois" in ocr_results.get(topic, {}):
+                        meta["ocr_roi_results"] = ocr_results[topic]["rois"]
+                    if "ocr_engine" in ocr_results.get(topic, {}):
+                        meta["ocr_engine"] = ocr_results[topic]["ocr_engine"]
+                    if self.async_worker and topic in forwarded_topics:
+                        # Where the forwarded result comes from and how old it is
+                        meta["ocr_source_frame_id"] = (
+                            latest.frame_id if latest else None
                         )
-                        self.output_file.flush()
+                        meta["ocr_age_ms"] = latest.age_ms() if latest else None
+                metas[topic] = meta
 
-            # Cache results for future frames
-            if should_run_ocr:
-                self.ocr_cache = ocr_results.copy()
+        with timer.stage("output"):
+            # Only frames that actually ran OCR are written, each result once
+            if fresh and not should_skip:
+                for topic, result in topic_results.items():
+                    if result["ran_ocr"]:
+                        self.record_result(topic, result)
 
-        # Prepare result dictionary with updated OCR metadata per frame
-        output_frames = {}
-
-        for topic, frame in frames.items():
-            # Start with original metadata
-            meta = dict(frame.data.get("meta", {}))
-
-            # Add OCR texts if forwarding is enabled
-            if self.forward_ocr_texts:
-                meta["ocr_texts"] = ocr_results.get(topic, {}).get("texts", [])
-                meta["ocr_confidence"] = ocr_results.get(topic, {}).get(
-                    "ocr_confidence", 0.0
+        # Add visualization frame if enabled
+        vis_image = None
+        if self.visualizer and "main" in frames:
+            with timer.stage("visualization"):
+                main_frame = frames["main"]
+                self.visualizer.submit(
+                    main_frame.data.get("meta", {}).get("id"),
+                    readonly_bgr(main_frame),
+                    forwarded.get("main", {}).get("texts", []),
                 )
-
-            # Add the frame to result
-            output_frames[topic] = Frame(frame.rw_bgr.image, {"meta": meta}, "BGR")
+                vis_image = self.visualizer.latest()
+
+        if self.stage_timing:
+            # Frame construction and subject data below are only in the metrics file
+            timing = timer.as_meta(job_times)
+            if ocr_timer:
+                # Async OCR ran on the worker for the source frame of the result
+                timing["ocr_ms"] = round(ocr_timer.stages.get("ocr", 0.0) * 1000.0, 3)
+            for meta in metas.values():
+                meta["ocr_timing"] = dict(timing)
+
+        with timer.stage("frames"):
+            # Frames share the incoming image, only the metadata is replaced
+            output_frames = {
+                topic: Frame(frame, {"meta": metas[topic]})
+                for topic, frame in frames.items()
+            }
+            if vis_image is not None:
+                output_frames[self.visualization_topic] = Frame(vis_image, {}, "BGR")
 
         # Write subject data only once for main frame (or any one frame)
         if self.write_output_file:
-            main_meta = output_frames["main"].data.get("meta", {})
-            self.subject_data.append({"meta": main_meta})
+            with timer.stage("output"):
+                main_meta = output_frames["main"].data.get("meta", {})
+                if self.subject_queue:
+                    self.subject_queue.put({"meta": main_meta})
+                else:
+                    self.subject_writer.write({"meta": main_meta})
 
-        # Add visualization frame if enabled
-        if self.draw_visualization:
-            main_frame = frames["main"]
-            texts = ocr_results.get("main", []) if self.forward_ocr_texts else []
-            vis_image = self.draw_text_visualization(main_frame.rw_bgr.image, texts)
-            output_frames[self.visualization_topic] = Frame(vis_image, {}, "BGR")
+        if self.metrics_exporter:
+            self.observe_metrics(timer, job_times if fresh else None, ocr_seconds)
 
         return output_frames
 
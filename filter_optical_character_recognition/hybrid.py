@@ -0,0 +1,157 @@
+import logging
+import re
+from typing import Optional
+
+import cv2
+import numpy as np
+
+__all__ = ["EngineRouter", "contrast_score", "parse_engine_routes"]
+
+logger = logging.getLogger(__name__)
+
+# Engine names, the values of the matching OCREngine members
+TESSERACT = "tesseract"
+EASYOCR = "easyocr"
+ENGINES = (TESSERACT, EASYOCR)
+
+# Decisions kept before the cache is cleared, guards against unbounded topic names
+MAX_CACHED_KEYS = 4096
+
+# Longest side of the grayscale copy the contrast score is measured on
+SAMPLE_SIDE = 128
+# Gray level variance below which an image is considered flat
+MIN_VARIANCE = 1.0
+
+
+def contrast_score(image: np.ndarray) -> float:
+    """
+    How cleanly an image splits into dark and light pixels, from 0 to 1.
+
+    The score is Otsu's separability, the between-class variance of the Otsu
+    threshold divided by the total variance, measured on a grayscale copy
+    downscaled to SAMPLE_SIDE pixels. Dark text on a plain background, or the
+    reverse, scores close to 1; textured scenes, gradients and uneven lighting
+    score lower. Flat images score 0.
+
+    Args:
+        image (np.ndarray): BGR or grayscale image
+
+    Returns:
+        float: Separability of the image
+    """
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    height, width = gray.shape[:2]
+    scale = SAMPLE_SIDE / max(height, width)
+    if scale < 1.0:
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+    variance = float(gray.var())
+    if variance < MIN_VARIANCE:
+        return 0.0
+    threshold, _ = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    dark = gray <= threshold
+    dark_share = float(dark.mean())
+    if dark_share in (0.0, 1.0):
+        return 0.0
+    difference = float(gray[dark].mean()) - float(gray[~dark].mean())
+    return dark_share * (1.0 - dark_share) * difference**2 / variance
+
+
+def parse_engine_routes(raw: dict) -> list[tuple[re.Pattern, str]]:
+    """
+    Parse engine routes given as {pattern: engine}.
+
+    Args:
+        raw (dict): Regex patterns searched in topic names (or ROI job keys such as
+            "main[score]") mapped to "tesseract" or "easyocr"
+
+    Returns:
+        list[tuple[re.Pattern, str]]: Routes in the order given
+
+    Raises:
+        TypeError: If a pattern or engine is not a string
+        ValueError: If a pattern is not a valid regex or an engine is unknown
+    """
+    routes = []
+    for pattern, engine in raw.items():
+        if not isinstance(pattern, str) or not isinstance(engine, str):
+            raise TypeError("engine_routes must map regex strings to engine names")
+        try:
+            regex = re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid engine route pattern {pattern!r}: {e}")
+        engine = engine.strip().lower()
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Invalid engine {engine!r} for route {pattern!r}. "
+                f"Expected one of: {list(ENGINES)}"
+            )
+        routes.append((regex, engine))
+    return routes
+
+
+class EngineRouter:
+    """
+    Picks Tesseract or EasyOCR for each OCR job of the hybrid engine.
+
+    The first route whose pattern is found in the job key with re.search
+    decides: the topic name, or "topic[roi_id]" for ROI jobs. Like topic
+    routing, that only depends on the key, so it is decided once per key.
+    Jobs matching no route are decided per image by contrast_score(): clean
+    high-contrast crops, which Tesseract reads fastest, go to Tesseract, and
+    everything else, such as natural scenes, to EasyOCR.
+    """
+
+    def __init__(
+        self, routes: list[tuple[re.Pattern, str]], contrast_threshold: float = 0.8
+    ):
+        self.routes = routes
+        self.contrast_threshold = contrast_threshold
+        self.jobs = dict.fromkeys(ENGINES, 0)
+        self.by_route = 0
+        self.by_contrast = 0
+        self._rules: dict[str, Optional[str]] = {}
+
+    def _rule(self, key: str) -> Optional[str]:
+        if key in self._rules:
+            return self._rules[key]
+        if len(self._rules) >= MAX_CACHED_KEYS:
+            self._rules.clear()
+        rule = next(
+            (engine for regex, engine in self.routes if regex.search(key)), None
+        )
+        if rule is not None:
+            logger.debug(f"Routing {key} to {rule}")
+        self._rules[key] = rule
+        return rule
+
+    def engine(self, key: str, image: np.ndarray) -> str:
+        """
+        Engine of a job.
+
+        Args:
+            key (str): Topic name or roi_job_key() of the job
+            image (np.ndarray): Image of the job, only read for keys without a route
+
+        Returns:
+            str: "tesseract" or "easyocr"
+        """
+        engine = self._rule(key)
+        if engine is not None:
+            self.by_route += 1
+        else:
+            self.by_contrast += 1
+            if contrast_score(image) >= self.contrast_threshold:
+                engine = TESSERACT
+            else:
+                engine = EASYOCR
+        self.jobs[engine] += 1
+        return engine
+
+    def stats(self) -> dict:
+        """Counters for logging."""
+        return {
+            **{f"{engine}_jobs": jobs for engine, jobs in self.jobs.items()},
+            "by_route": self.by_route,
+            "by_contrast": self.by_contrast,
+        }
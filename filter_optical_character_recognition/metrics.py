@@ -0,0 +1,157 @@
+import logging
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+import numpy as np
+
+__all__ = ["StageTimer", "RollingStats", "PrometheusFileExporter"]
+
+logger = logging.getLogger(__name__)
+
+# Samples per stage the rolling quantiles are computed over
+ROLLING_WINDOW = 1024
+QUANTILES = (0.5, 0.99)
+
+
+class StageTimer:
+    """Wall-clock time of the stages of one frame, in seconds."""
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block, adding to the stage if it was already timed in this frame."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def elapsed(self) -> float:
+        """Seconds since the timer was created."""
+        return time.perf_counter() - self._start
+
+    def as_meta(self, jobs: Optional[dict[str, float]] = None) -> dict:
+        """Stage times in milliseconds for frame metadata, with per-job OCR times if known."""
+        meta = {
+            f"{name}_ms": round(seconds * 1000.0, 3)
+            for name, seconds in self.stages.items()
+        }
+        if jobs:
+            meta["ocr_topics_ms"] = {
+                key: round(seconds * 1000.0, 3) for key, seconds in jobs.items()
+            }
+        meta["total_ms"] = round(self.elapsed() * 1000.0, 3)
+        return meta
+
+
+class RollingStats:
+    """Count, sum and rolling quantiles of named latency samples."""
+
+    def __init__(self, window: int = ROLLING_WINDOW):
+        self.window = window
+        self._samples: dict[str, deque] = {}
+        self.counts: dict[str, int] = {}
+        self.sums: dict[str, float] = {}
+
+    def observe(self, name: str, seconds: float):
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.window)
+            self.counts[name] = 0
+            self.sums[name] = 0.0
+        samples.append(seconds)
+        self.counts[name] += 1
+        self.sums[name] += seconds
+
+    def quantiles(self, name: str) -> dict[float, float]:
+        """Quantiles of the last ``window`` samples of a stage."""
+        values = np.quantile(np.fromiter(self._samples[name], float), QUANTILES)
+        return dict(zip(QUANTILES, (float(v) for v in values)))
+
+    def names(self) -> list[str]:
+        return list(self._samples)
+
+
+class PrometheusFileExporter:
+    """
+    Periodically writes metrics in the Prometheus text exposition format.
+
+    The file is replaced atomically, so it can be scraped at any time, e.g. by the
+    node_exporter textfile collector.
+    """
+
+    def __init__(self, path: str, interval: float = 10.0, prefix: str = "ocr_filter"):
+        self.path = path
+        self.interval = interval
+        self.prefix = prefix
+        self._last_write = time.monotonic()
+
+    def due(self) -> bool:
+        """Whether ``interval`` seconds passed since the last write."""
+        return time.monotonic() - self._last_write >= self.interval
+
+    def write(
+        self,
+        frames: int,
+        stages: RollingStats,
+        ratios: dict[str, float],
+        counters: dict[str, int],
+    ):
+        """
+        Replace the metrics file.
+
+        Args:
+            frames (int): Frames processed so far
+            stages (RollingStats): Stage latencies in seconds
+            ratios (dict[str, float]): Cache hit ratios by cache name
+            counters (dict[str, int]): Other monotonic counters by metric name
+        """
+        p = self.prefix
+        lines = [
+            f"# HELP {p}_frames_total Frames processed by the OCR filter.",
+            f"# TYPE {p}_frames_total counter",
+            f"{p}_frames_total {frames}",
+            f"# HELP {p}_stage_seconds Rolling latency of the stages of process().",
+            f"# TYPE {p}_stage_seconds summary",
+        ]
+        for name in stages.names():
+            for quantile, value in stages.quantiles(name).items():
+                lines.append(
+                    f'{p}_stage_seconds{{stage="{name}",quantile="{quantile}"}} {value:.6f}'
+                )
+            lines.append(
+                f'{p}_stage_seconds_sum{{stage="{name}"}} {stages.sums[name]:.6f}'
+            )
+            lines.append(
+                f'{p}_stage_seconds_count{{stage="{name}"}} {stages.counts[name]}'
+            )
+        if ratios:
+            lines += [
+                f"# HELP {p}_cache_hit_ratio Fraction of lookups served without running OCR.",
+                f"# TYPE {p}_cache_hit_ratio gauge",
+            ]
+            lines += [
+                f'{p}_cache_hit_ratio{{cache="{name}"}} {value:.6f}'
+                for name, value in ratios.items()
+            ]
+        for name, value in counters.items():
+            lines += [f"# TYPE {p}_{name} counter", f"{p}_{name} {value}"]
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write metrics to {self.path}: {e}")
+        self._last_write = time.monotonic()
@@ -0,0 +1,141 @@
+import logging
+from enum import Enum
+from typing import Optional
+
+import cv2
+import numpy as np
+
+__all__ = ["PreprocessStep", "PreprocessPipeline"]
+
+logger = logging.getLogger(__name__)
+
+# Tile grid of the CLAHE step
+CLAHE_TILE_GRID = (8, 8)
+
+
+class PreprocessStep(Enum):
+    """
+    Enumeration of image preprocessing steps applied before the OCR engine.
+
+    Attributes:
+        GRAYSCALE: Convert to a single channel
+        RESIZE: Scale by a factor, e.g. "resize=0.5"
+        MAX_SIDE: Downscale so the longer side is at most this many pixels, e.g. "max_side=1280"
+        CLAHE: Contrast limited adaptive histogram equalization on the grayscale image,
+            optionally with a clip limit, e.g. "clahe=3.0" (default clip limit 2.0)
+        OTSU: Binarize the grayscale image with Otsu's threshold
+    """
+
+    GRAYSCALE = "grayscale"
+    RESIZE = "resize"
+    MAX_SIDE = "max_side"
+    CLAHE = "clahe"
+    OTSU = "otsu"
+
+    @classmethod
+    def from_str(cls, value: str) -> "PreprocessStep":
+        """
+        Convert a string to a PreprocessStep enum value.
+
+        Args:
+            value (str): String representation of the step
+
+        Returns:
+            PreprocessStep: Corresponding enum value
+
+        Raises:
+            ValueError: If the string doesn't match any enum value
+        """
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            raise ValueError(
+                f"Invalid mode: {value!r}. Expected one of: {[s.value for s in cls]}"
+            )
+
+
+def _parse_step(spec: str) -> tuple[PreprocessStep, Optional[float]]:
+    name, sep, raw = spec.partition("=")
+    step = PreprocessStep.from_str(name)
+    if not sep:
+        if step in (PreprocessStep.RESIZE, PreprocessStep.MAX_SIDE):
+            raise ValueError(f"Preprocessing step {step.value!r} needs a value")
+        return step, None
+    if step in (PreprocessStep.GRAYSCALE, PreprocessStep.OTSU):
+        raise ValueError(f"Preprocessing step {step.value!r} takes no value")
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError(f"Invalid value for preprocessing step {spec!r}")
+    if value <= 0:
+        raise ValueError(f"Value of preprocessing step {spec!r} must be greater than 0")
+    return step, value
+
+
+def _to_gray(image: np.ndarray) -> np.ndarray:
+    return image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+class PreprocessPipeline:
+    """
+    Declarative image preprocessing ahead of the OCR engine.
+
+    Steps are given as strings, "name" or "name=value", and applied in order,
+    e.g. ["grayscale", "max_side=1280", "clahe", "otsu"]. Resizing steps only
+    ever produce a new image, the input image is never modified, and the
+    overall scale is returned with the image.
+    """
+
+    def __init__(self, steps: list[str]):
+        self.steps = [_parse_step(spec) for spec in steps]
+        self._clahe: dict[float, object] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.steps)
+
+    def _equalize(self, gray: np.ndarray, clip_limit: float) -> np.ndarray:
+        # CLAHE objects are reused, they are not safe to share between threads
+        # but apply() is only called on the processing thread
+        clahe = self._clahe.get(clip_limit)
+        if clahe is None:
+            clahe = self._clahe[clip_limit] = cv2.createCLAHE(
+                clipLimit=clip_limit, tileGridSize=CLAHE_TILE_GRID
+            )
+        return clahe.apply(gray)
+
+    def apply(self, image: np.ndarray) -> tuple[np.ndarray, float]:
+        """
+        Run the steps on an image.
+
+        Args:
+            image (np.ndarray): BGR or grayscale image
+
+        Returns:
+            tuple[np.ndarray, float]: The preprocessed image and its size relative
+            to the input (1.0 when no step resized it)
+        """
+        scale = 1.0
+        height, width = image.shape[:2]
+        for step, value in self.steps:
+            if step == PreprocessStep.GRAYSCALE:
+                image = _to_gray(image)
+            elif step in (PreprocessStep.RESIZE, PreprocessStep.MAX_SIDE):
+                factor = value
+                if step == PreprocessStep.MAX_SIDE:
+                    factor = min(1.0, value / max(image.shape[:2]))
+                if factor == 1.0:
+                    continue
+                scale *= factor
+                size = (
+                    max(1, int(round(width * scale))),
+                    max(1, int(round(height * scale))),
+                )
+                interpolation = cv2.INTER_AREA if factor < 1.0 else cv2.INTER_CUBIC
+                image = cv2.resize(image, size, interpolation=interpolation)
+            elif step == PreprocessStep.CLAHE:
+                image = self._equalize(_to_gray(image), value or 2.0)
+            elif step == PreprocessStep.OTSU:
+                _, image = cv2.threshold(
+                    _to_gray(image), 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+                )
+        return image, scale
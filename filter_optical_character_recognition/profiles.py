@@ -0,0 +1,166 @@
+import logging
+import re
+import shlex
+from typing import NamedTuple, Optional
+
+__all__ = ["EngineProfile", "ProfileRouter", "parse_profiles"]
+
+logger = logging.getLogger(__name__)
+
+# Decisions kept before the cache is cleared, guards against unbounded topic names
+MAX_CACHED_KEYS = 4096
+
+# Valid ranges of the Tesseract settings
+PSM_RANGE = range(0, 14)
+OEM_RANGE = range(0, 4)
+# EasyOCR rejects canvases smaller than its detector's stride
+MIN_CANVAS_SIZE = 32
+
+
+class EngineProfile(NamedTuple):
+    """
+    Engine settings for the topics matching a profile pattern, None keeps the default.
+
+    Attributes:
+        psm: Tesseract page segmentation mode, e.g. 7 for a single text line
+        oem: Tesseract OCR engine mode
+        allowlist: Characters to recognize, for Tesseract and EasyOCR
+        min_size: EasyOCR minimum text box size in pixels
+        canvas_size: EasyOCR maximum image size for the detector
+    """
+
+    psm: Optional[int] = None
+    oem: Optional[int] = None
+    allowlist: Optional[str] = None
+    min_size: Optional[int] = None
+    canvas_size: Optional[int] = None
+
+    def tesseract_config(self) -> str:
+        """Command line options for pytesseract's ``config`` argument."""
+        options = []
+        if self.psm is not None:
+            options.append(f"--psm {self.psm}")
+        if self.oem is not None:
+            options.append(f"--oem {self.oem}")
+        if self.allowlist:
+            options.append(f"-c tessedit_char_whitelist={shlex.quote(self.allowlist)}")
+        return " ".join(options)
+
+    def easyocr_kwargs(self) -> dict:
+        """Keyword arguments for EasyOCR's readtext()."""
+        kwargs = {}
+        if self.allowlist:
+            kwargs["allowlist"] = self.allowlist
+        if self.min_size is not None:
+            kwargs["min_size"] = self.min_size
+        if self.canvas_size is not None:
+            kwargs["canvas_size"] = self.canvas_size
+        return kwargs
+
+
+def _int_setting(pattern: str, name: str, value, valid: range) -> int:
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError(f"{name} of engine profile {pattern!r} must be an integer")
+    if value not in valid:
+        raise ValueError(
+            f"{name} of engine profile {pattern!r} must be between "
+            f"{valid.start} and {valid.stop - 1}"
+        )
+    return value
+
+
+def parse_profiles(raw: dict) -> list[tuple[re.Pattern, EngineProfile]]:
+    """
+    Parse engine profiles given as {pattern: {setting: value}}.
+
+    Args:
+        raw (dict): Regex patterns searched in topic names (or ROI job keys such as
+            "main[score]") mapped to settings: "psm", "oem", "allowlist", "min_size"
+            and "canvas_size"
+
+    Returns:
+        list[tuple[re.Pattern, EngineProfile]]: Profiles in the order given
+
+    Raises:
+        TypeError: If a profile or setting has the wrong type
+        ValueError: If a pattern is not a valid regex or a setting is unknown or out of range
+    """
+    profiles = []
+    for pattern, settings in raw.items():
+        if not isinstance(pattern, str) or not isinstance(settings, dict):
+            raise TypeError("engine_profiles must map regex strings to dicts")
+        try:
+            regex = re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid engine profile pattern {pattern!r}: {e}")
+        unknown = set(settings) - set(EngineProfile._fields)
+        if unknown:
+            raise ValueError(
+                f"Unknown settings in engine profile {pattern!r}: {sorted(unknown)}. "
+                f"Expected any of: {list(EngineProfile._fields)}"
+            )
+        values = {}
+        if "psm" in settings:
+            values["psm"] = _int_setting(pattern, "psm", settings["psm"], PSM_RANGE)
+        if "oem" in settings:
+            values["oem"] = _int_setting(pattern, "oem", settings["oem"], OEM_RANGE)
+        if "min_size" in settings:
+            values["min_size"] = _int_setting(
+                pattern, "min_size", settings["min_size"], range(1, 1 << 16)
+            )
+        if "canvas_size" in settings:
+            values["canvas_size"] = _int_setting(
+                pattern,
+                "canvas_size",
+                settings["canvas_size"],
+                range(MIN_CANVAS_SIZE, 1 << 16),
+            )
+        if "allowlist" in settings:
+            allowlist = settings["allowlist"]
+            if not isinstance(allowlist, str) or not allowlist:
+                raise TypeError(
+                    f"allowlist of engine profile {pattern!r} must be a non-empty string"
+                )
+            values["allowlist"] = allowlist
+        profiles.append((regex, EngineProfile(**values)))
+    return profiles
+
+
+class ProfileRouter:
+    """
+    Picks the engine profile of each OCR job, with patterns compiled once.
+
+    The first profile whose pattern is found in the job key with re.search
+    applies: the topic name, or "topic[roi_id]" for ROI jobs. Jobs matching no
+    pattern use the engine defaults. Like topic routing, the choice only depends
+    on the key, so it is made once per key and looked up afterwards.
+    """
+
+    def __init__(self, profiles: list[tuple[re.Pattern, EngineProfile]]):
+        self.profiles = profiles
+        self._choices: dict[str, Optional[EngineProfile]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.profiles)
+
+    def profile(self, key: str) -> Optional[EngineProfile]:
+        """
+        Profile of a job.
+
+        Args:
+            key (str): Topic name or roi_job_key() of the job
+
+        Returns:
+            EngineProfile | None: The profile, or None for the engine defaults
+        """
+        if key in self._choices:
+            return self._choices[key]
+        if len(self._choices) >= MAX_CACHED_KEYS:
+            self._choices.clear()
+        choice = next(
+            (profile for regex, profile in self.profiles if regex.search(key)), None
+        )
+        if choice is not None:
+            logger.debug(f"Using engine profile {choice} for {key}")
+        self._choices[key] = choice
+        return choice
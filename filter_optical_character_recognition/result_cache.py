@@ -0,0 +1,186 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from enum import Enum
+
+import cv2
+import numpy as np
+
+__all__ = [
+    "FingerprintMode",
+    "OCRResultCache",
+    "grayscale_thumbnail",
+    "image_fingerprint",
+]
+
+logger = logging.getLogger(__name__)
+
+# Side of the square thumbnail fingerprints are computed from
+THUMBNAIL_SIZE = 32
+# Side of the low frequency DCT block kept by the perceptual hash (64 bits)
+PHASH_SIZE = 8
+# Topics kept before the least recently used one is dropped, guards against
+# unbounded topic names and ROI job keys
+MAX_CACHED_TOPICS = 4096
+
+
+class FingerprintMode(Enum):
+    """
+    Enumeration of image fingerprints used as result cache keys.
+
+    Attributes:
+        EXACT: Hash of a downsampled grayscale copy, hits only on identical thumbnails
+        PHASH: 64-bit perceptual hash, hits within a Hamming distance tolerance
+    """
+
+    EXACT = "exact"
+    PHASH = "phash"
+
+    @classmethod
+    def from_str(cls, value: str) -> "FingerprintMode":
+        """
+        Convert a string to a FingerprintMode enum value.
+
+        Args:
+            value (str): String representation of the fingerprint mode
+
+        Returns:
+            FingerprintMode: Corresponding enum value
+
+        Raises:
+            ValueError: If the string doesn't match any enum value
+        """
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            raise ValueError(
+                f"Invalid mode: {value!r}. Expected one of: {[s.value for s in cls]}"
+            )
+
+
+def grayscale_thumbnail(image: np.ndarray, size: int = THUMBNAIL_SIZE) -> np.ndarray:
+    """
+    Downscale an image to a small square grayscale copy.
+
+    Downsampling happens before the color conversion, so the full image is read once.
+    """
+    small = cv2.resize(image, (size, size), interpolation=cv2.INTER_AREA)
+    if small.ndim == 3:
+        small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    return small
+
+
+def image_fingerprint(image: np.ndarray, mode: FingerprintMode):
+    """
+    Compute a cache key for an image.
+
+    Args:
+        image (np.ndarray): BGR or grayscale image
+        mode (FingerprintMode): Fingerprint to compute
+
+    Returns:
+        bytes | int: Digest for EXACT, 64-bit hash for PHASH
+    """
+    thumbnail = grayscale_thumbnail(image)
+    if mode == FingerprintMode.EXACT:
+        digest = hashlib.blake2b(digest_size=16)
+        # Crops of different sizes never share results
+        digest.update(np.asarray(image.shape[:2], dtype=np.int64).tobytes())
+        digest.update(thumbnail.tobytes())
+        return digest.digest()
+
+    dct = cv2.dct(thumbnail.astype(np.float32))[:PHASH_SIZE, :PHASH_SIZE]
+    bits = (dct > np.median(dct)).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+class OCRResultCache:
+    """
+    Per-topic LRU cache of OCR results keyed by image fingerprint.
+
+    Each topic keeps at most ``max_entries`` results, and at most
+    MAX_CACHED_TOPICS topics are kept. With PHASH fingerprints a lookup hits
+    any stored hash within ``tolerance`` differing bits.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        mode: FingerprintMode = FingerprintMode.EXACT,
+        tolerance: int = 0,
+    ):
+        self.max_entries = max_entries
+        self.mode = mode
+        self.tolerance = tolerance if mode == FingerprintMode.PHASH else 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, OrderedDict]" = OrderedDict()
+
+    def fingerprint(self, image: np.ndarray):
+        """Compute the cache key of an image with the configured mode."""
+        return image_fingerprint(image, self.mode)
+
+    def get(self, topic: str, key):
+        """
+        Look up a result and mark it as most recently used.
+
+        Args:
+            topic (str): Topic the image came from
+            key: Fingerprint returned by fingerprint()
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        entries = self._entries.get(topic)
+        if entries is not None:
+            self._entries.move_to_end(topic)
+            match = key if key in entries else None
+            if match is None and self.tolerance:
+                match = next(
+                    (
+                        stored
+                        for stored in reversed(entries)
+                        if (stored ^ key).bit_count() <= self.tolerance
+                    ),
+                    None,
+                )
+            if match is not None:
+                entries.move_to_end(match)
+                self.hits += 1
+                return entries[match]
+
+        self.misses += 1
+        return None
+
+    def put(self, topic: str, key, result):
+        """Store a result, evicting the least recently used one if the topic is full."""
+        entries = self._entries.get(topic)
+        if entries is None:
+            if len(self._entries) >= MAX_CACHED_TOPICS:
+                _, dropped = self._entries.popitem(last=False)
+                self.evictions += len(dropped)
+            entries = self._entries[topic] = OrderedDict()
+        else:
+            self._entries.move_to_end(topic)
+        entries[key] = result
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """Counters for logging and metrics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+            "entries": sum(len(entries) for entries in self._entries.values()),
+        }
@@ -0,0 +1,68 @@
+import logging
+
+__all__ = ["parse_rois", "roi_job_key"]
+
+logger = logging.getLogger(__name__)
+
+
+def roi_job_key(topic: str, roi_id: str) -> str:
+    """Name under which a ROI is gated, cached and recognized."""
+    return f"{topic}[{roi_id}]"
+
+
+def parse_rois(rois, image_shape) -> list[tuple[str, tuple[int, int, int, int]]]:
+    """
+    Parse the regions of interest supplied in frame metadata.
+
+    Each ROI is either a ``[x1, y1, x2, y2]`` box in pixels or a dict with a
+    ``box`` in that format and an optional ``id``. ROIs without an id are named
+    after their position in the list. Ids are made unique: a ROI whose id is
+    already taken, or whose position is the explicit id of another ROI, gets a
+    ``#2``, ``#3``... suffix with a warning. Boxes are clamped to the image;
+    malformed entries, non-finite coordinates and boxes that are empty once
+    clamped are skipped with a warning.
+
+    Args:
+        rois: List of ROIs taken from the frame metadata
+        image_shape: Shape of the image the boxes refer to
+
+    Returns:
+        list[tuple[str, tuple[int, int, int, int]]]: (roi id, clamped box) pairs in input order
+    """
+    if not isinstance(rois, (list, tuple)):
+        logger.warning(f"Ignoring ROIs, expected a list but got {type(rois).__name__}")
+        return []
+
+    # Explicit ids win over the position names of unnamed ROIs
+    explicit = {str(roi["id"]) for roi in rois if isinstance(roi, dict) and "id" in roi}
+    height, width = image_shape[:2]
+    parsed = []
+    taken: set[str] = set()
+    for index, roi in enumerate(rois):
+        roi_id, box, named = str(index), roi, False
+        if isinstance(roi, dict):
+            named = "id" in roi
+            roi_id = str(roi.get("id", index))
+            box = roi.get("box")
+        try:
+            x1, y1, x2, y2 = (int(round(float(v))) for v in box)
+        except (TypeError, ValueError, OverflowError):
+            logger.warning(f"Ignoring malformed ROI {roi!r}")
+            continue
+
+        x1, x2 = max(0, min(x1, width)), max(0, min(x2, width))
+        y1, y2 = max(0, min(y1, height)), max(0, min(y2, height))
+        if x2 <= x1 or y2 <= y1:
+            logger.warning(f"Ignoring empty ROI {roi!r}")
+            continue
+
+        if roi_id in taken or (not named and roi_id in explicit):
+            base, suffix = roi_id, 2
+            while f"{base}#{suffix}" in taken or f"{base}#{suffix}" in explicit:
+                suffix += 1
+            roi_id = f"{base}#{suffix}"
+            logger.warning(f"Duplicate ROI id {base!r}, renamed to {roi_id!r}")
+        taken.add(roi_id)
+        parsed.append((roi_id, (x1, y1, x2, y2)))
+
+    return parsed
@@ -0,0 +1,65 @@
+import logging
+import re
+from typing import Optional
+
+__all__ = ["TopicRouter"]
+
+logger = logging.getLogger(__name__)
+
+# Decisions kept before the cache is cleared, guards against unbounded topic names
+MAX_CACHED_TOPICS = 4096
+
+
+class TopicRouter:
+    """
+    Decides which topics are recognized, with patterns compiled once.
+
+    A topic is excluded when an ``exclude_topics`` entry matches it with
+    re.match, or equals it when the entry is not a valid regex. Otherwise it is
+    included when ``topic_pattern`` is unset or found in it with re.search. The
+    decision only depends on the topic name, so it is computed the first time a
+    topic is seen and looked up afterwards; new topics are simply decided on
+    their first frame.
+    """
+
+    def __init__(self, exclude_topics: list[str], topic_pattern: Optional[str] = None):
+        self.exclude_regexes: list[re.Pattern] = []
+        self.exclude_names: set[str] = set()
+        for pattern in exclude_topics:
+            try:
+                self.exclude_regexes.append(re.compile(pattern))
+            except re.error:
+                # If pattern is not a valid regex, treat it as an exact match
+                self.exclude_names.add(pattern)
+        self.topic_regex = re.compile(topic_pattern) if topic_pattern else None
+        self._decisions: dict[str, bool] = {}
+
+    def _decide(self, topic: str) -> bool:
+        if topic in self.exclude_names or any(
+            regex.match(topic) for regex in self.exclude_regexes
+        ):
+            logger.debug(
+                f"Skipping OCR for topic {topic} as it matches exclude pattern"
+            )
+            return False
+        if self.topic_regex and not self.topic_regex.search(topic):
+            logger.debug(f"Skipping OCR for topic {topic} due to topic_regex mismatch")
+            return False
+        return True
+
+    def selected(self, topic: str) -> bool:
+        """
+        Whether a topic passes the exclude and include patterns.
+
+        Args:
+            topic (str): Topic name
+
+        Returns:
+            bool: True if the topic should be recognized
+        """
+        decision = self._decisions.get(topic)
+        if decision is None:
+            if len(self._decisions) >= MAX_CACHED_TOPICS:
+                self._decisions.clear()
+            decision = self._decisions[topic] = self._decide(topic)
+        return decision
@@ -0,0 +1,336 @@
+import glob
+import gzip
+import importlib.util
+import json
+import logging
+import os
+import re
+import time
+from enum import Enum
+from typing import Iterator, Optional
+
+__all__ = [
+    "SegmentCompression",
+    "SegmentedResultWriter",
+    "list_segments",
+    "read_segment_index",
+    "find_records",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class SegmentCompression(Enum):
+    """
+    Enumeration of per-block compression of result segments.
+
+    Attributes:
+        NONE: Plain JSON lines
+        GZIP: Every index block is a separate gzip member
+        ZSTD: Every index block is a separate zstd frame (requires zstandard)
+    """
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @classmethod
+    def from_str(cls, value: str) -> "SegmentCompression":
+        """
+        Convert a string to a SegmentCompression enum value.
+
+        Args:
+            value (str): String representation of the compression
+
+        Returns:
+            SegmentCompression: Corresponding enum value
+
+        Raises:
+            ValueError: If the string doesn't match any enum value
+        """
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            raise ValueError(
+                f"Invalid mode: {value!r}. Expected one of: {[s.value for s in cls]}"
+            )
+
+    @property
+    def suffix(self) -> str:
+        """File name suffix of segments with this compression."""
+        return {"none": ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}[self.value]
+
+
+def _compress(data: bytes, compression: SegmentCompression) -> bytes:
+    if compression == SegmentCompression.GZIP:
+        return gzip.compress(data)
+    if compression == SegmentCompression.ZSTD:
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _decompress(data: bytes, compression: SegmentCompression) -> bytes:
+    if compression == SegmentCompression.GZIP:
+        return gzip.decompress(data)
+    if compression == SegmentCompression.ZSTD:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+def _span(values: list) -> Optional[list]:
+    """[min, max] of numeric values, None if any value is not a number."""
+    if not values or not all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in values
+    ):
+        return None
+    return [min(values), max(values)]
+
+
+class SegmentedResultWriter:
+    """
+    Writes OCR result records into rotating, optionally compressed segments.
+
+    ``<base>.000001.jsonl[.gz|.zst]`` holds the records, grouped in blocks of
+    ``block_records``. Each block is compressed on its own, so it can be read
+    without decompressing the rest of the segment, and concatenated blocks are
+    still a valid gzip or zstd stream. ``<base>.000001.idx`` is the sidecar index,
+    one JSON line per block with its byte offset and length, record count and the
+    frame_id and timestamp ranges of its records.
+
+    A new segment is started once the current one reaches ``max_bytes`` or is
+    ``max_seconds`` old (0 disables either limit), and on every start so earlier
+    segments are never appended to. A block is also cut short and written out on
+    every flush(), so flushed records are on disk and readable before the block
+    fills. The age limit is checked there too, so an expired segment is closed
+    on the next flush instead of waiting for the next record.
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        max_bytes: int = 0,
+        max_seconds: float = 0.0,
+        compression: SegmentCompression = SegmentCompression.NONE,
+        block_records: int = 100,
+    ):
+        self.base_path = base_path
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.compression = compression
+        self.block_records = block_records
+        self.segments = 0
+        self.blocks = 0
+        self.records = 0
+        self.path = None
+        self._seq = 0
+        self._file = None
+        self._index = None
+        self._opened_at = 0.0
+        self._block: list[dict] = []
+
+    def open(self):
+        """
+        Start the first segment after the ones already on disk.
+
+        Raises:
+            ImportError: If zstd compression is requested without zstandard installed
+        """
+        if (
+            self.compression == SegmentCompression.ZSTD
+            and importlib.util.find_spec("zstandard") is None
+        ):
+            raise ImportError(
+                "output_compression 'zstd' requires the 'zstandard' package "
+                "(pip install filter_optical_character_recognition[zstd])"
+            )
+        os.makedirs(os.path.dirname(self.base_path) or ".", exist_ok=True)
+        existing = list_segments(self.base_path)
+        self._seq = existing[-1][0] if existing else 0
+        self._rotate()
+
+    def _rotate(self):
+        self._close_segment()
+        self._seq += 1
+        prefix = f"{self.base_path}.{self._seq:06d}"
+        self.path = prefix + self.compression.suffix
+        self._file = open(self.path, "ab")
+        self._index = open(prefix + ".idx", "a", encoding="utf-8")
+        self._opened_at = time.monotonic()
+        self.segments += 1
+        logger.debug(f"Started result segment {self.path}")
+
+    def _expired(self) -> bool:
+        """Whether the current segment holds records and is max_seconds old."""
+        return bool(
+            self.max_seconds
+            and time.monotonic() - self._opened_at >= self.max_seconds
+            and (self._block or self._file.tell())
+        )
+
+    def write(self, record: dict):
+        """Append a record, writing out the current block once it is full."""
+        # Rotate before the next record, so no empty segment is left behind
+        if (
+            self.max_bytes and not self._block and self._file.tell() >= self.max_bytes
+        ) or self._expired():
+            self._rotate()
+        self._block.append(record)
+        self.records += 1
+        if len(self._block) >= self.block_records:
+            self._write_block()
+
+    def _write_block(self):
+        if not self._block:
+            return
+        data = "".join(
+            json.dumps(record, ensure_ascii=False) + "\n" for record in self._block
+        ).encode("utf-8")
+        payload = _compress(data, self.compression)
+        offset = self._file.tell()
+        self._file.write(payload)
+        entry = {
+            "offset": offset,
+            "length": len(payload),
+            "records": len(self._block),
+            "frame_ids": _span([r.get("frame_id") for r in self._block]),
+            "timestamps": _span([r.get("timestamp") for r in self._block]),
+        }
+        self._index.write(json.dumps(entry) + "\n")
+        self._block = []
+        self.blocks += 1
+
+    def flush(self):
+        """Write out the current block, even if partial, and flush it to the operating system."""
+        if self._expired():
+            self._rotate()
+        self._write_block()
+        self._file.flush()
+        self._index.flush()
+
+    def fileno(self) -> int:
+        """File descriptor of the current segment."""
+        return self._file.fileno()
+
+    def _close_segment(self) -> bool:
+        """Close the current segment, returning whether it holds no records."""
+        if self._file is None:
+            return False
+        self._write_block()
+        empty = not self._file.tell()
+        # A closed segment is final, sync it once so rotation keeps it durable
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._index.flush()
+        os.fsync(self._index.fileno())
+        self._file.close()
+        self._index.close()
+        self._file = None
+        self._index = None
+        return empty
+
+    def close(self):
+        """Write the last block and close the current segment, removing it if empty."""
+        path = self.path
+        if self._close_segment():
+            # Nothing was written since the last rotation
+            os.remove(path)
+            os.remove(path[: path.index(".jsonl")] + ".idx")
+            self.segments -= 1
+
+
+def list_segments(base_path: str) -> list[tuple[int, str]]:
+    """
+    Find the segments written for ``base_path``.
+
+    Returns:
+        list[tuple[int, str]]: (sequence number, path) pairs in sequence order
+    """
+    pattern = re.compile(re.escape(os.path.basename(base_path)) + r"\.(\d{6})\.jsonl")
+    segments = []
+    for path in glob.glob(glob.escape(base_path) + ".*.jsonl*"):
+        match = pattern.match(os.path.basename(path))
+        if match:
+            segments.append((int(match.group(1)), path))
+    return sorted(segments)
+
+
+def read_segment_index(segment_path: str) -> list[dict]:
+    """
+    Read the sidecar index of a segment.
+
+    Args:
+        segment_path (str): Path of a segment file
+
+    Returns:
+        list[dict]: One entry per block with "offset", "length", "records",
+        "frame_ids" and "timestamps" ([min, max] or None)
+    """
+    index_path = segment_path[: segment_path.index(".jsonl")] + ".idx"
+    entries = []
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Only the last line can be partial
+                break
+    return entries
+
+
+def _overlaps(span: Optional[list], low, high) -> bool:
+    if span is None:
+        # Unknown range, the block has to be read
+        return True
+    try:
+        return (low is None or span[1] >= low) and (high is None or span[0] <= high)
+    except TypeError:
+        return True
+
+
+def find_records(
+    base_path: str,
+    frame_id=None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> Iterator[dict]:
+    """
+    Read the records matching a frame_id and/or timestamp window.
+
+    Only the blocks whose index ranges overlap the query are read and
+    decompressed; the records of those blocks are then filtered exactly.
+
+    Args:
+        base_path (str): Output path without its extension, as passed to SegmentedResultWriter
+        frame_id: Frame id to look up (default: None, any frame)
+        start (float | None): Earliest timestamp, inclusive (default: None)
+        end (float | None): Latest timestamp, inclusive (default: None)
+
+    Yields:
+        dict: Matching records in write order
+    """
+    for _, path in list_segments(base_path):
+        compression = next(c for c in SegmentCompression if path.endswith(c.suffix))
+        with open(path, "rb") as f:
+            for entry in read_segment_index(path):
+                if frame_id is not None and not _overlaps(
+                    entry["frame_ids"], frame_id, frame_id
+                ):
+                    continue
+                if not _overlaps(entry["timestamps"], start, end):
+                    continue
+                f.seek(entry["offset"])
+                data = _decompress(f.read(entry["length"]), compression)
+                for line in data.decode("utf-8").splitlines():
+                    record = json.loads(line)
+                    if frame_id is not None and record.get("frame_id") != frame_id:
+                        continue
+                    timestamp = record.get("timestamp")
+                    if start is not None and (timestamp is None or timestamp < start):
+                        continue
+                    if end is not None and (timestamp is None or timestamp > end):
+                        continue
+                    yield record
@@ -0,0 +1,180 @@
+import argparse
+import json
+import logging
+import os
+import sqlite3
+from typing import Optional
+
+__all__ = ["SQLiteResultSink", "search_text"]
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ocr_results (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    frame_id,
+    timestamp REAL NOT NULL,
+    confidence REAL NOT NULL,
+    text TEXT NOT NULL,
+    texts TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ocr_results_frame ON ocr_results (frame_id);
+CREATE INDEX IF NOT EXISTS ocr_results_timestamp ON ocr_results (timestamp);
+CREATE VIRTUAL TABLE IF NOT EXISTS ocr_text USING fts5 (
+    text, content='ocr_results', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS ocr_results_fts AFTER INSERT ON ocr_results BEGIN
+    INSERT INTO ocr_text (rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+
+class SQLiteResultSink:
+    """
+    Stores OCR result records in a SQLite database with a full-text index.
+
+    One row per record holds topic, frame_id, timestamp, confidence, the texts
+    joined by newlines (indexed with FTS5) and the texts as a JSON list. Records
+    are buffered by write() and inserted in one transaction by flush(). The
+    database runs in WAL mode, so search_text() can read while it is written.
+
+    The sink is meant to sit behind a BackgroundWriter; after open() it must only
+    be used from one thread at a time.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records = 0
+        self._conn = None
+        self._pending: list[tuple] = []
+
+    def open(self):
+        """Create the database and its tables if needed."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Opened here, written by the background writer thread
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def write(self, record: dict):
+        """Buffer a record for the next transaction."""
+        texts = record.get("texts", [])
+        self._pending.append(
+            (
+                record["topic"],
+                record.get("frame_id"),
+                record["timestamp"],
+                record.get("ocr_confidence", 0.0),
+                "\n".join(texts),
+                json.dumps(texts, ensure_ascii=False),
+            )
+        )
+
+    def flush(self):
+        """Insert the buffered records in a single transaction."""
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO ocr_results "
+                "(topic, frame_id, timestamp, confidence, text, texts) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                self._pending,
+            )
+        self.records += len(self._pending)
+        self._pending = []
+
+    def close(self):
+        """Insert the remaining records and close the database."""
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None
+
+
+def search_text(
+    path: str,
+    text: str,
+    topic: Optional[str] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    limit: int = 100,
+    raw: bool = False,
+) -> list[dict]:
+    """
+    Find the frames whose recognized text matches a query.
+
+    Args:
+        path (str): Database written by SQLiteResultSink
+        text (str): Words to look for, matched as a phrase (case-insensitive)
+        topic (str | None): Only search this topic (default: None)
+        start (float | None): Earliest timestamp, inclusive (default: None)
+        end (float | None): Latest timestamp, inclusive (default: None)
+        limit (int): Maximum number of rows returned (default: 100)
+        raw (bool): Pass ``text`` to FTS5 MATCH as is, e.g. ``"goal OR score"``
+            or ``"break*"`` (default: False)
+
+    Returns:
+        list[dict]: Matching rows ordered by timestamp, with "topic", "frame_id",
+        "timestamp", "ocr_confidence" and "texts"
+    """
+    query = text if raw else '"' + text.replace('"', '""') + '"'
+    sql = (
+        "SELECT r.topic, r.frame_id, r.timestamp, r.confidence, r.texts "
+        "FROM ocr_text JOIN ocr_results r ON r.id = ocr_text.rowid "
+        "WHERE ocr_text MATCH ?"
+    )
+    params: list = [query]
+    if topic is not None:
+        sql += " AND r.topic = ?"
+        params.append(topic)
+    if start is not None:
+        sql += " AND r.timestamp >= ?"
+        params.append(start)
+    if end is not None:
+        sql += " AND r.timestamp <= ?"
+        params.append(end)
+    sql += " ORDER BY r.timestamp LIMIT ?"
+    params.append(limit)
+
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+    return [
+        {
+            "topic": topic,
+            "frame_id": frame_id,
+            "timestamp": timestamp,
+            "ocr_confidence": confidence,
+            "texts": json.loads(texts),
+        }
+        for topic, frame_id, timestamp, confidence, texts in rows
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Search OCR results stored by the SQLite sink"
+    )
+    parser.add_argument("database", help="Path of the SQLite database")
+    parser.add_argument("text", help="Text to search for")
+    parser.add_argument("--topic", help="Only search this topic")
+    parser.add_argument("--limit", type=int, default=100, help="Maximum results")
+    parser.add_argument(
+        "--raw", action="store_true", help="Use the text as an FTS5 query"
+    )
+    args = parser.parse_args()
+
+    for row in search_text(
+        args.database, args.text, args.topic, limit=args.limit, raw=args.raw
+    ):
+        print(json.dumps(row, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
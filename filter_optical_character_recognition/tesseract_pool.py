@@ -0,0 +1,290 @@
+import importlib.util
+import logging
+import multiprocessing
+import queue
+import threading
+from typing import Optional
+
+import numpy as np
+
+__all__ = ["TesseractWorkerPool"]
+
+logger = logging.getLogger(__name__)
+
+# Keys produced for each recognized word, mirroring pytesseract's Output.DICT
+DATA_KEYS = (
+    "block_num",
+    "par_num",
+    "line_num",
+    "word_num",
+    "left",
+    "top",
+    "width",
+    "height",
+    "conf",
+    "text",
+)
+
+
+def _recognize(
+    api, image: np.ndarray, psm: Optional[int] = None, allowlist: Optional[str] = None
+) -> dict[str, list]:
+    """
+    Run recognition on an already initialized tesserocr API.
+
+    Args:
+        api: tesserocr.PyTessBaseAPI instance with language data loaded
+        image (np.ndarray): Grayscale or 3-channel image
+        psm (int | None): Page segmentation mode for this image only
+        allowlist (str | None): Characters to recognize in this image only
+
+    Returns:
+        dict[str, list]: Word level results laid out like pytesseract's Output.DICT
+    """
+    from tesserocr import PSM, RIL, iterate_level
+
+    image = np.ascontiguousarray(image)
+    height, width = image.shape[:2]
+    channels = 1 if image.ndim == 2 else image.shape[2]
+    api.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+    api.SetPageSegMode(PSM.AUTO if psm is None else psm)
+    api.SetVariable("tessedit_char_whitelist", allowlist or "")
+    api.Recognize()
+
+    data: dict[str, list] = {key: [] for key in DATA_KEYS}
+    iterator = api.GetIterator()
+    if iterator is None:
+        return data
+
+    block = par = line = word = 0
+    for r in iterate_level(iterator, RIL.WORD):
+        # Numbering follows tesseract's TSV output: each counter restarts
+        # when its parent level begins.
+        if r.IsAtBeginningOf(RIL.BLOCK):
+            block += 1
+            par = 0
+        if r.IsAtBeginningOf(RIL.PARA):
+            par += 1
+            line = 0
+        if r.IsAtBeginningOf(RIL.TEXTLINE):
+            line += 1
+            word = 0
+        word += 1
+
+        bbox = r.BoundingBox(RIL.WORD) or (0, 0, 0, 0)
+        data["block_num"].append(block)
+        data["par_num"].append(par)
+        data["line_num"].append(line)
+        data["word_num"].append(word)
+        data["left"].append(bbox[0])
+        data["top"].append(bbox[1])
+        data["width"].append(bbox[2] - bbox[0])
+        data["height"].append(bbox[3] - bbox[1])
+        data["conf"].append(r.Confidence(RIL.WORD))
+        data["text"].append(r.GetUTF8Text(RIL.WORD) or "")
+
+    return data
+
+
+def _worker_main(conn, lang: str, tessdata_dir: Optional[str]):
+    """
+    Entry point of a worker process.
+
+    Loads the language data once, then serves recognition requests sent over
+    ``conn`` until the pipe is closed or a ``None`` header is received.
+    """
+    try:
+        import tesserocr
+
+        kwargs = {"lang": lang}
+        if tessdata_dir:
+            kwargs["path"] = tessdata_dir
+        api = tesserocr.PyTessBaseAPI(**kwargs)
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+
+    conn.send(("ready", None))
+
+    with api:
+        while True:
+            try:
+                header = conn.recv()
+            except (EOFError, OSError):
+                break
+            if header is None:
+                break
+
+            shape, dtype, psm, allowlist = header
+            buffer = conn.recv_bytes()
+            try:
+                image = np.frombuffer(buffer, dtype=np.dtype(dtype)).reshape(shape)
+                conn.send(("ok", _recognize(api, image, psm, allowlist)))
+            except Exception as e:
+                conn.send(("error", f"{type(e).__name__}: {e}"))
+
+    conn.close()
+
+
+class _Worker:
+    """A single long-lived Tesseract process and the parent end of its pipe."""
+
+    def __init__(self, ctx, lang: str, tessdata_dir: Optional[str], index: int):
+        self.conn, child_conn = ctx.Pipe(duplex=True)
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, lang, tessdata_dir),
+            name=f"tesseract-worker-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def wait_ready(self, timeout: float):
+        if not self.conn.poll(timeout):
+            raise RuntimeError("Timed out waiting for Tesseract worker to start")
+        status, message = self.conn.recv()
+        if status != "ready":
+            raise RuntimeError(f"Tesseract worker failed to start: {message}")
+
+    def stop(self, timeout: float):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self.conn.close()
+
+
+class TesseractWorkerPool:
+    """
+    Pool of persistent Tesseract worker processes.
+
+    Each worker loads the language data once through ``tesserocr`` and then
+    receives raw image buffers over a pipe, so recognizing a frame costs neither
+    a process spawn nor a temporary image file. Calls are thread-safe: every
+    request borrows an idle worker and returns it when done.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        lang: str,
+        tessdata_dir: Optional[str] = None,
+        start_timeout: float = 30.0,
+    ):
+        if size < 1:
+            raise ValueError("TesseractWorkerPool size must be at least 1")
+        self.size = size
+        self.lang = lang
+        self.tessdata_dir = tessdata_dir
+        self.start_timeout = start_timeout
+        self._ctx = multiprocessing.get_context("spawn")
+        self._workers: list[_Worker] = []
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self):
+        """
+        Spawn the worker processes and wait until each has loaded its language data.
+
+        Raises:
+            ImportError: If tesserocr is not installed
+            RuntimeError: If a worker fails to initialize
+        """
+        if self._started:
+            return
+        if importlib.util.find_spec("tesserocr") is None:
+            raise ImportError(
+                "tesseract_workers requires the 'tesserocr' package "
+                "(pip install filter_optical_character_recognition[tesserocr])"
+            )
+
+        logger.info(
+            f"Starting {self.size} Tesseract worker(s) with languages: {self.lang}"
+        )
+        try:
+            for index in range(self.size):
+                worker = self._spawn(index)
+                self._workers.append(worker)
+                self._idle.put(worker)
+        except Exception:
+            self.close()
+            raise
+        self._started = True
+
+    def _spawn(self, index: int) -> _Worker:
+        worker = _Worker(self._ctx, self.lang, self.tessdata_dir, index)
+        try:
+            worker.wait_ready(self.start_timeout)
+        except Exception:
+            worker.stop(1.0)
+            raise
+        return worker
+
+    def image_to_data(
+        self,
+        image: np.ndarray,
+        psm: Optional[int] = None,
+        allowlist: Optional[str] = None,
+    ) -> dict[str, list]:
+        """
+        Recognize an image on the next idle worker.
+
+        Args:
+            image (np.ndarray): Grayscale or 3-channel uint8 image
+            psm (int | None): Page segmentation mode, Tesseract's automatic mode when None
+            allowlist (str | None): Characters to recognize, all when None
+
+        Returns:
+            dict[str, list]: Word level results with the same keys as pytesseract's Output.DICT
+
+        Raises:
+            RuntimeError: If the pool is not started or the worker failed
+        """
+        if not self._started:
+            raise RuntimeError("TesseractWorkerPool has not been started")
+
+        image = np.ascontiguousarray(image)
+        worker = self._idle.get()
+        try:
+            if not worker.process.is_alive():
+                # Its replacement failed to start after it died, try again
+                worker = self._replace(worker)
+            worker.conn.send((image.shape, image.dtype.str, psm, allowlist))
+            worker.conn.send_bytes(memoryview(image).cast("B"))
+            status, payload = worker.conn.recv()
+        except (EOFError, BrokenPipeError, OSError) as e:
+            # The worker died mid-request; replace it so the pool keeps its size
+            logger.error(f"Tesseract worker {worker.process.name} died: {e}")
+            worker = self._replace(worker)
+            raise RuntimeError(f"Tesseract worker died: {e}")
+        finally:
+            self._idle.put(worker)
+
+        if status != "ok":
+            raise RuntimeError(f"Tesseract worker error: {payload}")
+        return payload
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        worker.stop(1.0)
+        with self._lock:
+            index = self._workers.index(worker)
+        # Spawned without the lock, so other workers are replaced concurrently
+        replacement = self._spawn(index)
+        with self._lock:
+            self._workers[index] = replacement
+        return replacement
+
+    def close(self, timeout: float = 5.0):
+        """Stop all worker processes."""
+        for worker in self._workers:
+            worker.stop(timeout)
+        self._workers = []
+        self._idle = queue.Queue()
+        self._started = False
@@ -0,0 +1,258 @@
+import logging
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from filter_optical_character_recognition.result_cache import (
+    FingerprintMode,
+    image_fingerprint,
+)
+
+__all__ = ["TextTracker"]
+
+logger = logging.getLogger(__name__)
+
+# Keys kept before the least recently used one is dropped, guards against
+# unbounded topic names and ROI job keys
+MAX_CACHED_KEYS = 4096
+
+# Smallest search margin around a tracked box, in pixels
+MIN_SEARCH_MARGIN = 8
+
+# Smallest cell compared between a tracked crop and its recognized crop
+MIN_CELL_SIZE = 8
+
+# Mean grey level difference of a crop cell that counts as changed content.
+# A single edited character moves its cells by 30 or more, compression noise
+# by less than 5.
+CELL_CHANGE_LEVEL = 12
+
+
+def _cell_difference(crop: np.ndarray, reference: np.ndarray) -> float:
+    """
+    Largest mean absolute difference between cells of two grayscale crops.
+
+    Cells are squares of half the shorter side, so a change confined to one
+    character is not averaged away over the whole line. A reference of another
+    size, from an earlier detection, is resized to the crop first.
+    """
+    height, width = crop.shape[:2]
+    if reference.shape[:2] != (height, width):
+        reference = cv2.resize(reference, (width, height), interpolation=cv2.INTER_AREA)
+    diff = cv2.absdiff(crop, reference)
+    cell = max(MIN_CELL_SIZE, min(height, width) // 2)
+    cells = cv2.resize(
+        diff,
+        (-(-width // cell), -(-height // cell)),
+        interpolation=cv2.INTER_AREA,
+    )
+    return float(cells.max())
+
+
+class _Track:
+    """A detected text box followed across frames."""
+
+    __slots__ = ("box", "template", "fingerprint", "reference", "result")
+
+    def __init__(self, box: tuple[int, int, int, int]):
+        self.box = box
+        self.template = None
+        self.fingerprint = None
+        # Full resolution crop the current result was recognized from
+        self.reference = None
+        self.result = None
+
+
+class _TopicTracks:
+    """Tracks of a single topic."""
+
+    __slots__ = ("tracks", "frames_since_detect")
+
+    def __init__(self):
+        self.tracks: list[_Track] = []
+        self.frames_since_detect = 0
+
+
+class TextTracker:
+    """
+    Detect-then-track text recognition on top of an EasyOCREngine.
+
+    The text detector runs on the first frame of a topic and then every
+    ``detect_interval`` frames. In between, each detected box is followed by
+    template matching in a window around its last position, and losing any box
+    triggers a new detection. A box is sent to the recognizer again when the
+    perceptual hash of its content is more than ``change_tolerance`` bits away
+    from the hash it was last recognized with, or when any cell of the
+    full resolution crop differs from the recognized crop by more than
+    ``CELL_CHANGE_LEVEL`` grey levels on average. The hash alone is too coarse
+    to see a single edited character. Static and scrolling text is not
+    recognized again on every frame.
+    """
+
+    def __init__(
+        self,
+        engine,
+        detect_interval: int,
+        min_score: float = 0.6,
+        change_tolerance: int = 4,
+        search_margin: float = 0.5,
+    ):
+        self.engine = engine
+        self.detect_interval = detect_interval
+        self.min_score = min_score
+        self.change_tolerance = change_tolerance
+        self.search_margin = search_margin
+        self.detections = 0
+        self.recognitions = 0
+        self.reused = 0
+        self._topics: "OrderedDict[str, _TopicTracks]" = OrderedDict()
+
+    def update(self, key: str, image: np.ndarray) -> tuple[list[str], list[float]]:
+        """
+        Track and recognize the text of one topic in a new frame.
+
+        Args:
+            key (str): Topic name or ROI job key
+            image (np.ndarray): BGR or grayscale image of the topic
+
+        Returns:
+            tuple[list[str], list[float]]: Texts and confidences of the tracked boxes
+        """
+        state = self._topics.get(key)
+        if state is None:
+            if len(self._topics) >= MAX_CACHED_KEYS:
+                self._topics.popitem(last=False)
+            state = self._topics[key] = _TopicTracks()
+        else:
+            self._topics.move_to_end(key)
+
+        gray = None
+        if state.tracks and state.frames_since_detect < self.detect_interval:
+            gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            if not all(self._follow(track, gray) for track in state.tracks):
+                logger.debug(f"Lost a text box of {key}, detecting again")
+                gray = None
+
+        previous: list[_Track] = []
+        if gray is None:
+            gray, horizontal_list, free_list = self.engine.detect(image)
+            previous, state.tracks = state.tracks, self._new_tracks(
+                gray, horizontal_list, free_list
+            )
+            state.frames_since_detect = 0
+            self.detections += 1
+        state.frames_since_detect += 1
+
+        self._recognize_changed(gray, state.tracks, previous)
+        return self.engine.collect(
+            [
+                (track.box, *track.result)
+                for track in state.tracks
+                if track.result is not None
+            ]
+        )
+
+    def _new_tracks(self, gray, horizontal_list: list, free_list: list) -> list:
+        """Start tracks from detector output, free-form polygons become their bounding boxes."""
+        height, width = gray.shape[:2]
+        boxes = [
+            (x_min, y_min, x_max, y_max)
+            for x_min, x_max, y_min, y_max in horizontal_list
+        ]
+        for polygon in free_list:
+            xs = [point[0] for point in polygon]
+            ys = [point[1] for point in polygon]
+            boxes.append((min(xs), min(ys), max(xs), max(ys)))
+
+        tracks = []
+        for x1, y1, x2, y2 in boxes:
+            x1, x2 = max(0, int(x1)), min(width, int(x2))
+            y1, y2 = max(0, int(y1)), min(height, int(y2))
+            if x2 > x1 and y2 > y1:
+                tracks.append(_Track((x1, y1, x2, y2)))
+        return tracks
+
+    def _follow(self, track: _Track, gray: np.ndarray) -> bool:
+        """Move a track to the best template match near its last position."""
+        x1, y1, x2, y2 = track.box
+        w, h = x2 - x1, y2 - y1
+        margin_x = max(int(w * self.search_margin), MIN_SEARCH_MARGIN)
+        margin_y = max(int(h * self.search_margin), MIN_SEARCH_MARGIN)
+        wx1, wy1 = max(0, x1 - margin_x), max(0, y1 - margin_y)
+        wx2 = min(gray.shape[1], x2 + margin_x)
+        wy2 = min(gray.shape[0], y2 + margin_y)
+        window = gray[wy1:wy2, wx1:wx2]
+        if window.shape[0] < h or window.shape[1] < w:
+            return False
+
+        scores = cv2.matchTemplate(window, track.template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (dx, dy) = cv2.minMaxLoc(scores)
+        if not np.isfinite(score) or score < self.min_score:
+            return False
+        track.box = (wx1 + dx, wy1 + dy, wx1 + dx + w, wy1 + dy + h)
+        return True
+
+    def _unchanged(self, fingerprint: int, crop: np.ndarray, track: _Track) -> bool:
+        return (
+            track.result is not None
+            and (fingerprint ^ track.fingerprint).bit_count() <= self.change_tolerance
+            and _cell_difference(crop, track.reference) <= CELL_CHANGE_LEVEL
+        )
+
+    def _recognize_changed(self, gray, tracks: list, previous: list):
+        """Recognize the tracks whose content changed, reusing results of the others."""
+        changed = []
+        for track in tracks:
+            x1, y1, x2, y2 = track.box
+            crop = gray[y1:y2, x1:x2]
+            # Copy so the template does not keep the whole frame alive
+            track.template = crop.copy()
+            fingerprint = image_fingerprint(crop, FingerprintMode.PHASH)
+
+            if track.result is None:
+                # A fresh detection inherits the result of identical text
+                match = next(
+                    (
+                        old
+                        for old in previous
+                        if self._unchanged(fingerprint, crop, old)
+                    ),
+                    None,
+                )
+                if match is not None:
+                    track.result = match.result
+                    track.fingerprint = match.fingerprint
+                    track.reference = match.reference
+
+            if self._unchanged(fingerprint, crop, track):
+                self.reused += 1
+                continue
+            track.fingerprint = fingerprint
+            track.reference = track.template
+            changed.append(track)
+
+        crops, owners = [], []
+        for track in changed:
+            x1, y1, x2, y2 = track.box
+            track_crops = self.engine.crop_boxes(gray, [[x1, x2, y1, y2]], [])
+            if track_crops:
+                crops.append(track_crops[0])
+                owners.append(track)
+            else:
+                # Too thin for the recognizer
+                track.result = None
+
+        if crops:
+            predictions = self.engine.recognize_crops(crops, self.engine.batch_size)
+            for track, (_, text, confidence) in zip(owners, predictions):
+                track.result = (text, confidence)
+            self.recognitions += len(crops)
+
+    def stats(self) -> dict:
+        """Counters for logging and metrics."""
+        return {
+            "detections": self.detections,
+            "recognitions": self.recognitions,
+            "reused": self.reused,
+        }
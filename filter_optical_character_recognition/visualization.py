@@ -0,0 +1,179 @@
+import logging
+import time
+from functools import partial
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from filter_optical_character_recognition.async_ocr import LatestFrameWorker
+
+__all__ = ["VisualizationRenderer", "draw_texts", "resize_image", "text_mask"]
+
+logger = logging.getLogger(__name__)
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+TEXT_COLOR = (0, 255, 0)  # Green text
+
+
+def resize_image(image: np.ndarray, resize_factor: float = 1.0) -> np.ndarray:
+    """Copy of an image scaled by ``resize_factor``."""
+    if resize_factor == 1.0:
+        return image.copy()
+    height, width = image.shape[:2]
+    size = (
+        max(1, int(width * resize_factor)),
+        max(1, int(height * resize_factor)),
+    )
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def text_mask(
+    shape: tuple,
+    texts: tuple,
+    resize_factor: float = 1.0,
+    text_scale_factor: float = 1.0,
+) -> np.ndarray:
+    """Mask of the text pixels, covering the rows from the top to the last line."""
+    font_scale = max(0.3, 0.5 * resize_factor * text_scale_factor)
+    font_thickness = max(1, int(text_scale_factor))
+    line_height = int(20 * text_scale_factor)
+    _, baseline = cv2.getTextSize("Ag", FONT, font_scale, font_thickness)
+    rows = min(
+        shape[0], 30 + (len(texts) - 1) * line_height + baseline + font_thickness
+    )
+    mask = np.zeros((max(1, rows), shape[1]), dtype=np.uint8)
+    for i, text in enumerate(texts):
+        y = 30 + i * line_height
+        cv2.putText(mask, text, (10, y), FONT, font_scale, 255, font_thickness)
+    return mask.astype(bool)
+
+
+def draw_texts(
+    image: np.ndarray,
+    texts: list[str],
+    resize_factor: float = 1.0,
+    text_scale_factor: float = 1.0,
+) -> np.ndarray:
+    """
+    Copy of an image at the output size with the texts drawn as a list.
+
+    Args:
+        image (np.ndarray): BGR image, not modified
+        texts (list[str]): Texts drawn from the top left, one per line
+        resize_factor (float): Scale of the output image
+        text_scale_factor (float): Scale of the text
+
+    Returns:
+        np.ndarray: The annotated image
+    """
+    image = resize_image(image, resize_factor)
+    if texts:
+        mask = text_mask(
+            image.shape[:2], tuple(texts), resize_factor, text_scale_factor
+        )
+        image[: mask.shape[0]][mask] = TEXT_COLOR
+    return image
+
+
+class VisualizationRenderer:
+    """
+    Renders the visualization frame on a background thread at a limited rate.
+
+    Frames due for rendering are downscaled on the caller's thread, which is
+    the only time the source image is read since the frame is passed on right
+    after, and the text is drawn on a background thread at the output size.
+    The drawn text is kept as an overlay mask per image size and text list, so
+    unchanged texts are composited without drawing them again. process() emits
+    the most recent rendered image, which may be a few frames old. Until the
+    first render completes, frames are drawn with draw_texts() on the caller's
+    thread, so the visualization is there from the first frame on.
+    """
+
+    def __init__(
+        self,
+        resize_factor: float = 1.0,
+        text_scale_factor: float = 1.0,
+        max_fps: float = 0.0,
+    ):
+        self.resize_factor = resize_factor
+        self.text_scale_factor = text_scale_factor
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.skipped = 0
+        self.overlay_hits = 0
+        self.overlay_misses = 0
+        self._last_submit: Optional[float] = None
+        # Drawn on the caller's thread while no render has completed
+        self._first: Optional[np.ndarray] = None
+        # Only used on the worker thread
+        self._overlay_key = None
+        self._overlay: Optional[np.ndarray] = None
+        self._worker = LatestFrameWorker(name="ocr-viz")
+
+    def start(self):
+        self._worker.start()
+
+    def submit(self, frame_id, image: np.ndarray, texts: list[str]) -> bool:
+        """
+        Queue a frame for rendering, unless one was queued less than 1 / max_fps ago.
+
+        Returns:
+            bool: Whether the frame was queued
+        """
+        now = time.monotonic()
+        if (
+            self._last_submit is not None
+            and now - self._last_submit < self.min_interval
+        ):
+            self.skipped += 1
+            return False
+        self._last_submit = now
+        if self._worker.latest() is None:
+            self._first = draw_texts(
+                image, texts, self.resize_factor, self.text_scale_factor
+            )
+        image = self.resize(image)
+        self._worker.submit(frame_id, partial(self.render, image, tuple(texts)))
+        return True
+
+    def resize(self, image: np.ndarray) -> np.ndarray:
+        """Copy of an image at the output size."""
+        return resize_image(image, self.resize_factor)
+
+    def latest(self) -> Optional[np.ndarray]:
+        """The most recently rendered image, None until the first frame is submitted."""
+        latest = self._worker.latest()
+        if latest is None:
+            return self._first
+        self._first = None
+        return latest.value
+
+    def render(self, image: np.ndarray, texts: tuple) -> np.ndarray:
+        """Draw the texts as a list onto an image returned by resize(), in place."""
+        if not texts:
+            return image
+        key = (image.shape[:2], texts)
+        if key != self._overlay_key:
+            self._overlay = text_mask(
+                image.shape[:2], texts, self.resize_factor, self.text_scale_factor
+            )
+            self._overlay_key = key
+            self.overlay_misses += 1
+        else:
+            self.overlay_hits += 1
+        band = image[: self._overlay.shape[0]]
+        band[self._overlay] = TEXT_COLOR
+        return image
+
+    def close(self):
+        self._worker.close()
+
+    def stats(self) -> dict:
+        """Counters for logging."""
+        stats = self._worker.stats()
+        stats.update(
+            rate_limited=self.skipped,
+            overlay_hits=self.overlay_hits,
+            overlay_misses=self.overlay_misses,
+        )
+        return stats
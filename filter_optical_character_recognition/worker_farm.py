@@ -0,0 +1,596 @@
+import gc
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from multiprocessing import connection, reduction, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+
+__all__ = ["OCRWorkerFarm", "affinity_sets"]
+
+logger = logging.getLogger(__name__)
+
+# Initial size of the shared memory slot of each worker, grown on demand
+SLOT_BYTES = 4 * 1024 * 1024
+
+
+def affinity_sets(cpus: list[int], size: int) -> list[set[int]]:
+    """
+    Split CPUs between workers.
+
+    With at least as many CPUs as workers, each worker gets a contiguous share of
+    the list, otherwise workers are pinned to single CPUs round-robin.
+
+    Args:
+        cpus (list[int]): CPU ids available to the workers
+        size (int): Number of workers
+
+    Returns:
+        list[set[int]]: CPUs of each worker, empty lists when ``cpus`` is empty
+    """
+    if not cpus:
+        return [set() for _ in range(size)]
+    if len(cpus) < size:
+        return [{cpus[i % len(cpus)]} for i in range(size)]
+    return [{int(c) for c in chunk} for chunk in np.array_split(cpus, size)]
+
+
+def _worker_main(
+    conn,
+    engine,
+    started: bool,
+    warmup: bool,
+    cpus: set[int],
+    threads: int,
+):
+    """
+    Entry point of a worker process.
+
+    Starts the engine, unless it was loaded before the fork, then recognizes the
+    image in its shared memory slot for every header received over ``conn`` until
+    the pipe is closed or a ``None`` header is received.
+    """
+    slot = None
+    try:
+        if cpus:
+            os.sched_setaffinity(0, cpus)
+        if threads:
+            import cv2
+
+            cv2.setNumThreads(threads)
+            try:
+                import torch
+
+                torch.set_num_threads(threads)
+            except ImportError:
+                pass
+        if not started:
+            engine.start()
+        if warmup:
+            engine.warm_up()
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+
+    conn.send(("ready", os.getpid()))
+
+    while True:
+        try:
+            header = conn.recv()
+        except (EOFError, OSError):
+            break
+        if header is None:
+            break
+
+        shape, dtype, name, detail, timed, profile, engine_name = header
+        image = None
+        try:
+            if name:
+                if slot is not None:
+                    slot.close()
+                slot = SharedMemory(name=name)
+            image = np.ndarray(shape, dtype=np.dtype(dtype), buffer=slot.buf)
+            image.flags.writeable = False
+            start = time.perf_counter()
+            recognize = engine.recognize_detail if detail else engine.recognize
+            # Only a hybrid engine takes an engine name
+            if engine_name:
+                result = recognize(image, profile, engine_name)
+            elif profile:
+                result = recognize(image, profile)
+            else:
+                result = recognize(image)
+            if timed:
+                result = (result, time.perf_counter() - start)
+        except Exception as e:
+            result = None
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            # A view of the slot keeps it from being closed when it is replaced
+            image = None
+        conn.send(("ok", result) if result is not None else ("error", error))
+
+    if slot is not None:
+        slot.close()
+    engine.close()
+    conn.close()
+
+
+def _reap(pid: int, timeout: float) -> bool:
+    """Wait up to ``timeout`` seconds for a child process to exit, and reap it."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if os.waitpid(pid, os.WNOHANG)[0]:
+                return True
+        except ChildProcessError:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+
+
+def _server_main(conn, engine, warmup: bool, threads: int):
+    """
+    Entry point of the fork server.
+
+    Starts the engine, then forks a worker for every ``("fork", index, cpus)``
+    request, followed by the worker's end of its pipe, and stops the worker of
+    every ``("stop", pid, timeout)`` request. The server never runs inference
+    or any thread of its own, so the workers are forked from a process that
+    only holds the loaded engine.
+    """
+    try:
+        engine.start()
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+    # Keep the garbage collector from writing to, and so copying, the pages of
+    # every object that exists at fork time
+    gc.freeze()
+    conn.send(("ready", os.getpid()))
+
+    pids = set()
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+
+        if request[0] == "fork":
+            _, index, cpus = request
+            child_conn = connection.Connection(reduction.recv_handle(conn))
+            pid = os.fork()
+            if pid == 0:
+                # os.fork rather than a multiprocessing process, which a
+                # daemonic server is not allowed to start
+                conn.close()
+                try:
+                    _worker_main(child_conn, engine, True, warmup, cpus, threads)
+                finally:
+                    os._exit(0)
+            child_conn.close()
+            pids.add(pid)
+            conn.send(pid)
+        elif request[0] == "stop":
+            _, pid, timeout = request
+            if pid in pids and not _reap(pid, timeout):
+                os.kill(pid, signal.SIGTERM)
+                _reap(pid, timeout)
+            pids.discard(pid)
+            conn.send(None)
+
+    for pid in pids:
+        os.kill(pid, signal.SIGTERM)
+        _reap(pid, 1.0)
+    engine.close()
+    conn.close()
+
+
+def _wait_ready(conn, timeout: float, what: str):
+    if not conn.poll(timeout):
+        raise RuntimeError(f"Timed out waiting for {what} to start")
+    status, message = conn.recv()
+    if status != "ready":
+        raise RuntimeError(f"{what} failed to start: {message}")
+
+
+class _ServedProcess:
+    """A worker process forked by the fork server, which alone can join it."""
+
+    def __init__(self, server: "_ForkServer", name: str, pid: int):
+        self.server = server
+        self.name = name
+        self.pid = pid
+
+    def stop(self, timeout: float):
+        self.server.stop(self.pid, timeout)
+
+
+class _ForkServer:
+    """
+    Clean process that loads the engine once and forks the workers from it.
+
+    Started with the farm's start method, spawn by default, so it inherits
+    none of the threads of the filter process, such as openfilter's ZeroMQ I/O
+    threads, which a fork of the filter itself would copy in an undefined state.
+    """
+
+    def __init__(self, farm: "OCRWorkerFarm"):
+        self.conn, child_conn = farm._ctx.Pipe(duplex=True)
+        self.process = farm._ctx.Process(
+            target=_server_main,
+            args=(child_conn, farm.engine, farm.warmup, farm.threads),
+            name="ocr-fork-server",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        # Requests of the filter and of worker replacements do not interleave
+        self._lock = threading.Lock()
+
+    def wait_ready(self, timeout: float):
+        _wait_ready(self.conn, timeout, "OCR fork server")
+
+    def fork(self, index: int, child_conn, cpus: set[int]) -> _ServedProcess:
+        """Fork a worker that serves the other end of ``child_conn``."""
+        try:
+            with self._lock:
+                self.conn.send(("fork", index, cpus))
+                reduction.send_handle(self.conn, child_conn.fileno(), self.process.pid)
+                pid = self.conn.recv()
+        except (EOFError, OSError) as e:
+            raise RuntimeError(f"OCR fork server died: {e}")
+        return _ServedProcess(self, f"ocr-worker-{index}", pid)
+
+    def stop(self, pid: int, timeout: float):
+        try:
+            with self._lock:
+                self.conn.send(("stop", pid, timeout))
+                self.conn.recv()
+        except (EOFError, OSError):
+            # The server takes its workers down with it
+            pass
+
+    def close(self, timeout: float):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self.conn.close()
+
+
+def _empty_result(detail: bool, timed: bool):
+    """Result of an image that was not recognized, in the layout map() returns."""
+    result = ([], [], []) if detail else ([], [])
+    return (result, 0.0) if timed else result
+
+
+class _Worker:
+    """A worker process, the parent end of its pipe and its shared memory slot."""
+
+    def __init__(self, farm: "OCRWorkerFarm", index: int, ctx=None):
+        ctx = ctx or farm._ctx
+        self.index = index
+        self.slot: Optional[SharedMemory] = None
+        # Whether the worker has yet to be told the name of a new slot
+        self.slot_changed = False
+        self.conn, child_conn = ctx.Pipe(duplex=True)
+        try:
+            if farm._server is not None:
+                self.process = farm._server.fork(
+                    index, child_conn, farm.affinity[index]
+                )
+            else:
+                self.process = ctx.Process(
+                    target=_worker_main,
+                    args=(
+                        child_conn,
+                        farm.engine,
+                        False,
+                        farm.warmup,
+                        farm.affinity[index],
+                        farm.threads,
+                    ),
+                    name=f"ocr-worker-{index}",
+                    daemon=True,
+                )
+                self.process.start()
+        except Exception:
+            self.conn.close()
+            raise
+        finally:
+            child_conn.close()
+
+    def wait_ready(self, timeout: float):
+        _wait_ready(self.conn, timeout, "OCR worker")
+
+    def submit(
+        self,
+        image: np.ndarray,
+        detail: bool,
+        timed: bool,
+        profile=None,
+        engine_name: Optional[str] = None,
+    ):
+        """Copy an image into the slot, growing it if needed, and send its header."""
+        if self.slot is None or self.slot.size < image.nbytes:
+            size = max(SLOT_BYTES, image.nbytes, 2 * self.slot.size if self.slot else 0)
+            self.release_slot()
+            self.slot = SharedMemory(create=True, size=size)
+            self.slot_changed = True
+        # The only copy of the image, strided views such as ROI crops included
+        np.ndarray(image.shape, dtype=image.dtype, buffer=self.slot.buf)[...] = image
+        name = self.slot.name if self.slot_changed else None
+        self.slot_changed = False
+        self.conn.send(
+            (image.shape, image.dtype.str, name, detail, timed, profile, engine_name)
+        )
+
+    def release_slot(self):
+        if self.slot is not None:
+            self.slot.close()
+            self.slot.unlink()
+            self.slot = None
+
+    def stop(self, timeout: float):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        if isinstance(self.process, _ServedProcess):
+            self.process.stop(timeout)
+        else:
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join(timeout)
+        self.conn.close()
+        self.release_slot()
+
+
+class OCRWorkerFarm:
+    """
+    Pool of persistent OCR worker processes fed through shared memory.
+
+    Each worker owns a copy of the engine and a shared memory slot. With
+    ``share_models``, the engine is instead loaded once in a fork server
+    process and the workers forked from it share its weights copy-on-write.
+    A dead worker is replaced in the background, from the same server or with
+    spawn, never by forking the running filter process. Images are
+    copied once into the slot of an idle worker and only a small header is sent
+    over the worker's pipe, so arrays are never pickled; the same pipe carries
+    back the texts and confidences. Workers can be pinned to CPUs and limited to
+    a number of torch and OpenCV threads, so several workers do not oversubscribe
+    the cores between them.
+    """
+
+    def __init__(
+        self,
+        engine,
+        size: int,
+        start_method: str = "spawn",
+        share_models: bool = False,
+        warmup: bool = False,
+        cpus: Optional[list[int]] = None,
+        threads: int = 0,
+        start_timeout: float = 300.0,
+    ):
+        if size < 1:
+            raise ValueError("OCRWorkerFarm size must be at least 1")
+        self.engine = engine
+        self.size = size
+        self.share_models = share_models
+        self.warmup = warmup
+        self.affinity = affinity_sets(cpus or [], size)
+        self.threads = threads
+        self.start_timeout = start_timeout
+        self._ctx = multiprocessing.get_context(start_method)
+        self._server: Optional[_ForkServer] = None
+        self._workers: list[Optional[_Worker]] = []
+        # Background restarts of dead workers, by worker index
+        self._restarts: dict[int, threading.Thread] = {}
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self):
+        """
+        Start the worker processes and wait until each has its engine ready.
+
+        Raises:
+            RuntimeError: If a worker fails to initialize
+        """
+        if self._running:
+            return
+        # Workers must share the resource tracker of this process, which unlinks
+        # the slots it created if the filter dies; forked workers would otherwise
+        # start their own and have it unlink the slots when they exit
+        resource_tracker.ensure_running()
+        try:
+            if self.share_models:
+                self._server = _ForkServer(self)
+                self._server.wait_ready(self.start_timeout)
+            # Started together so the engines load in parallel
+            self._workers = [_Worker(self, index) for index in range(self.size)]
+            for worker in self._workers:
+                worker.wait_ready(self.start_timeout)
+        except Exception:
+            self.close()
+            raise
+        self._running = True
+
+    def pids(self) -> list[int]:
+        """Process ids of the workers, and of the fork server holding the shared engine."""
+        pids = [worker.process.pid for worker in self._workers if worker is not None]
+        if self._server is not None:
+            pids.append(self._server.process.pid)
+        return pids
+
+    def map(
+        self,
+        images: list,
+        detail: bool = False,
+        timed: bool = False,
+        profiles: Optional[list] = None,
+        engines: Optional[list] = None,
+    ) -> list:
+        """
+        Recognize images on the workers, one image per idle worker at a time.
+
+        An image whose worker dies, or that finds no running worker while dead
+        ones are being replaced, gets an empty result instead of failing the
+        others.
+
+        Args:
+            images: Images to recognize, any layout numpy can copy
+            detail (bool): Return engine.recognize_detail() results instead of engine.recognize()
+            timed (bool): Return (result, seconds) pairs, timed inside the workers
+            profiles (list | None): EngineProfile, or None for the engine defaults, per image
+            engines (list | None): Engine name per image, for a HybridEngine
+
+        Returns:
+            list: One result per image, in the same order as ``images``
+
+        Raises:
+            RuntimeError: If the farm is not started, or the engine failed on an image
+        """
+        if not self._running:
+            raise RuntimeError("OCRWorkerFarm has not been started")
+
+        results = [None] * len(images)
+        error = None
+        with self._lock:
+            pending = list(
+                enumerate(
+                    zip(
+                        images,
+                        profiles or [None] * len(images),
+                        engines or [None] * len(images),
+                    )
+                )
+            )
+            pending.reverse()
+            # Retry restarts that failed, their workers are still missing
+            for index, worker in enumerate(self._workers):
+                if worker is None and index not in self._restarts:
+                    self._replace(index)
+            idle = [worker for worker in self._workers if worker is not None]
+            busy: dict = {}
+            while pending or busy:
+                while pending and idle:
+                    worker = idle.pop()
+                    index, (image, profile, engine_name) = pending.pop()
+                    try:
+                        worker.submit(
+                            np.asarray(image), detail, timed, profile, engine_name
+                        )
+                    except (BrokenPipeError, OSError) as e:
+                        logger.error(f"OCR worker {worker.process.name} died: {e}")
+                        self._replace(worker.index, worker)
+                        results[index] = _empty_result(detail, timed)
+                        continue
+                    busy[worker.conn] = (worker, index)
+
+                if not busy:
+                    if pending:
+                        # Every worker died and is still being replaced
+                        logger.error(
+                            f"No OCR worker available, {len(pending)} images not recognized"
+                        )
+                        for index, _ in pending:
+                            results[index] = _empty_result(detail, timed)
+                        pending = []
+                    continue
+                for conn in connection.wait(list(busy)):
+                    worker, index = busy.pop(conn)
+                    try:
+                        status, payload = conn.recv()
+                    except (EOFError, OSError) as e:
+                        # The worker died mid-request, only its image fails
+                        logger.error(f"OCR worker {worker.process.name} died: {e}")
+                        self._replace(worker.index, worker)
+                        results[index] = _empty_result(detail, timed)
+                        continue
+                    idle.append(worker)
+                    if status == "ok":
+                        results[index] = payload
+                    elif error is None:
+                        error = payload
+
+        if error is not None:
+            raise RuntimeError(f"OCR worker error: {error}")
+        return results
+
+    def _replace(self, index: int, worker: Optional[_Worker] = None):
+        """
+        Start a replacement for a worker in the background, called with the lock held.
+
+        map() runs without the worker until the replacement is ready, instead of
+        waiting up to start_timeout for its engine to load.
+        """
+        self._workers[index] = None
+        thread = threading.Thread(
+            target=self._restart,
+            args=(index, worker),
+            name=f"ocr-worker-restart-{index}",
+            daemon=True,
+        )
+        self._restarts[index] = thread
+        thread.start()
+
+    def _restart(self, index: int, worker: Optional[_Worker]):
+        if worker is not None:
+            worker.stop(1.0)
+        # The filter runs threads by now, so it is never forked again: workers
+        # come from the fork server, or are spawned
+        ctx = self._ctx
+        if self._server is None and ctx.get_start_method() == "fork":
+            ctx = multiprocessing.get_context("spawn")
+        replacement = None
+        try:
+            replacement = _Worker(self, index, ctx)
+            replacement.wait_ready(self.start_timeout)
+        except Exception as e:
+            if self._running:
+                logger.error(f"Failed to restart OCR worker {index}: {e}")
+            if replacement is not None:
+                replacement.stop(1.0)
+            replacement = None
+
+        with self._lock:
+            del self._restarts[index]
+            if replacement is not None and self._running:
+                self._workers[index] = replacement
+                logger.info(f"Restarted OCR worker {index}")
+                return
+        if replacement is not None:
+            replacement.stop(1.0)
+
+    def close(self, timeout: float = 5.0):
+        """Stop all worker processes and release their shared memory."""
+        with self._lock:
+            self._running = False
+            workers, self._workers = self._workers, []
+            restarts = list(self._restarts.values())
+        for worker in workers:
+            if worker is not None:
+                worker.stop(timeout)
+        # Restarts in flight stop their replacement once they see the farm closed
+        for thread in restarts:
+            thread.join(timeout)
+        if self._server is not None:
+            self._server.close(timeout)
+            self._server = None
@@ -0,0 +1,316 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from enum import Enum
+
+__all__ = [
+    "BackgroundWriter",
+    "FsyncPolicy",
+    "SubjectDataFormat",
+    "SubjectDataWriter",
+    "read_subject_data",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class SubjectDataFormat(Enum):
+    """
+    Enumeration of subject data file layouts.
+
+    Attributes:
+        JSON: A JSON array indented like json.dump(..., indent=4), streamed one record at a time
+        JSONL: One compact JSON record per line
+    """
+
+    JSON = "json"
+    JSONL = "jsonl"
+
+    @classmethod
+    def from_str(cls, value: str) -> "SubjectDataFormat":
+        """
+        Convert a string to a SubjectDataFormat enum value.
+
+        Args:
+            value (str): String representation of the format
+
+        Returns:
+            SubjectDataFormat: Corresponding enum value
+
+        Raises:
+            ValueError: If the string doesn't match any enum value
+        """
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            raise ValueError(
+                f"Invalid mode: {value!r}. Expected one of: {[s.value for s in cls]}"
+            )
+
+
+class FsyncPolicy(Enum):
+    """
+    Enumeration of when the background writer forces written data to stable storage.
+
+    Attributes:
+        NEVER: Only flush to the operating system
+        INTERVAL: fsync on every periodic flush
+        ALWAYS: fsync after every batch
+    """
+
+    NEVER = "never"
+    INTERVAL = "interval"
+    ALWAYS = "always"
+
+    @classmethod
+    def from_str(cls, value: str) -> "FsyncPolicy":
+        """
+        Convert a string to a FsyncPolicy enum value.
+
+        Args:
+            value (str): String representation of the policy
+
+        Returns:
+            FsyncPolicy: Corresponding enum value
+
+        Raises:
+            ValueError: If the string doesn't match any enum value
+        """
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            raise ValueError(
+                f"Invalid mode: {value!r}. Expected one of: {[s.value for s in cls]}"
+            )
+
+
+def _indent(text: str, prefix: str = "    ") -> str:
+    return "\n".join(prefix + line for line in text.splitlines())
+
+
+class SubjectDataWriter:
+    """
+    Writes subject data records to disk as they arrive.
+
+    Nothing is kept in memory. With ``autoflush`` every record reaches the operating
+    system when it is written, so a crash loses at most the record being written;
+    without it flushing is left to the caller, e.g. a BackgroundWriter. In JSON
+    layout the closing bracket is only written by close(); read_subject_data()
+    reads files that are missing it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fmt: SubjectDataFormat = SubjectDataFormat.JSON,
+        autoflush: bool = True,
+    ):
+        self.path = path
+        self.fmt = fmt
+        self.autoflush = autoflush
+        self.records = 0
+        self._file = None
+
+    def open(self):
+        """Create or truncate the file."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        if self.fmt == SubjectDataFormat.JSON:
+            self._file.write("[")
+            self._file.flush()
+
+    def write(self, record: dict):
+        """Append a record."""
+        if self.fmt == SubjectDataFormat.JSONL:
+            text = json.dumps(record, ensure_ascii=False) + "\n"
+        else:
+            separator = ",\n" if self.records else "\n"
+            text = separator + _indent(json.dumps(record, indent=4))
+        self._file.write(text)
+        if self.autoflush:
+            self._file.flush()
+        self.records += 1
+
+    def flush(self):
+        """Flush written records to the operating system."""
+        self._file.flush()
+
+    def fileno(self) -> int:
+        """File descriptor of the open file."""
+        return self._file.fileno()
+
+    def close(self):
+        """Terminate the JSON array and close the file."""
+        if self._file is None:
+            return
+        if self.fmt == SubjectDataFormat.JSON:
+            self._file.write("\n]" if self.records else "]")
+        self._file.close()
+        self._file = None
+
+
+class BackgroundWriter:
+    """
+    Moves writes off the caller's thread onto a dedicated writer thread.
+
+    Records are handed over through a bounded queue and written to ``target``
+    (anything with write(), flush() and fileno(), such as a text file) up to
+    ``batch_size`` at a time. The target is flushed at most every
+    ``flush_interval`` seconds (after every batch when 0) and fsynced according to
+    ``fsync``. put() never blocks: when the queue is full the record is dropped
+    and counted. close() drains the queue.
+    """
+
+    def __init__(
+        self,
+        target,
+        max_queue: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        fsync: FsyncPolicy = FsyncPolicy.NEVER,
+        name: str = "ocr-writer",
+    ):
+        self.target = target
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.name = name
+        self.written = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.max_depth = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._stop = object()
+        self._thread = None
+
+    def start(self):
+        """Start the writer thread."""
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def put(self, record) -> bool:
+        """
+        Queue a record for writing without blocking.
+
+        Returns:
+            bool: False if the queue was full and the record was dropped
+        """
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1:
+                logger.warning(f"{self.name} queue is full, dropping records")
+            return False
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return True
+
+    @property
+    def depth(self) -> int:
+        """Number of records waiting to be written."""
+        return self._queue.qsize()
+
+    def _flush(self, sync: bool):
+        self.target.flush()
+        if sync:
+            os.fsync(self.target.fileno())
+        self.flushes += 1
+
+    def _run(self):
+        last_flush = time.monotonic()
+        dirty = False
+        stopping = False
+        while not stopping:
+            timeout = None
+            if dirty:
+                timeout = max(0.0, last_flush + self.flush_interval - time.monotonic())
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while batch and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch and batch[-1] is self._stop:
+                batch.pop()
+                stopping = True
+
+            try:
+                for record in batch:
+                    self.target.write(record)
+                self.written += len(batch)
+                dirty = dirty or bool(batch)
+
+                now = time.monotonic()
+                if self.fsync == FsyncPolicy.ALWAYS and batch:
+                    self._flush(sync=True)
+                    dirty, last_flush = False, now
+                elif dirty and (now - last_flush >= self.flush_interval or stopping):
+                    self._flush(sync=self.fsync == FsyncPolicy.INTERVAL)
+                    dirty, last_flush = False, now
+            except Exception:
+                logger.exception(f"{self.name} failed to write {len(batch)} records")
+
+    def close(self):
+        """Write every queued record, flush and stop the thread."""
+        if self._thread is None:
+            return
+        # Blocks until there is room, the stop marker must not be dropped
+        self._queue.put(self._stop)
+        self._thread.join()
+        self._thread = None
+
+    def stats(self) -> dict:
+        """Counters for logging and metrics."""
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "flushes": self.flushes,
+        }
+
+
+def read_subject_data(path: str) -> list[dict]:
+    """
+    Read a subject data file in either layout, including files cut short by a crash.
+
+    Args:
+        path (str): Path of a file written by SubjectDataWriter
+
+    Returns:
+        list[dict]: The complete records of the file
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    if not text.lstrip().startswith("["):
+        records = []
+        for line in text.splitlines():
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Only the last line can be partial
+                logger.warning(f"Ignoring incomplete record in {path}")
+        return records
+
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    # Unterminated array, keep the records up to the last complete one
+    end = len(text)
+    while end > 0:
+        end = text.rfind("\n    }", 0, end)
+        if end < 0:
+            break
+        try:
+            return json.loads(text[: end + len("\n    }")] + "\n]")
+        except json.JSONDecodeError:
+            continue
+    return []
@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+"""
+Throughput and latency benchmark for FilterOpticalCharacterRecognition.process.
+
+Drives the filter with synthetic multi-topic frames for every combination of
+engine, resolution and topic count, reports frames/sec and p50/p95/p99 latency,
+and saves the results as JSON. With --baseline, results are compared against a
+previous run and the script exits with status 1 on a regression.
+
+Examples:
+    python scripts/benchmark.py --engines easyocr --resolutions 640x360 1280x720 --topics 1 4
+    python scripts/benchmark.py --output results/benchmark.json --baseline results/baseline.json
+    python scripts/benchmark.py --set ocr_executor=thread --set ocr_workers=4
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+from openfilter.filter_runtime.filter import Frame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.filter import (
+    FilterOpticalCharacterRecognition,
+    FilterOpticalCharacterRecognitionConfig,
+    OCREngine,
+)
+
+logger = logging.getLogger(__name__)
+
+WORDS = [
+    "BREAKING",
+    "NEWS",
+    "Score",
+    "Weather",
+    "Market",
+    "Update",
+    "Live",
+    "Open",
+    "your",
+    "EYE",
+    "Traffic",
+    "Sports",
+]
+
+
+def parse_resolution(value: str) -> tuple[int, int]:
+    """Parse WIDTHxHEIGHT."""
+    try:
+        width, height = (int(v) for v in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid resolution {value!r}, use WxH")
+    return width, height
+
+
+def parse_override(value: str) -> tuple[str, object]:
+    """Parse key=value, the value as JSON when possible."""
+    key, sep, raw = value.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Invalid override {value!r}, use key=value")
+    try:
+        return key.strip(), json.loads(raw)
+    except json.JSONDecodeError:
+        return key.strip(), raw
+
+
+def synthetic_image(width: int, height: int, rng: random.Random) -> np.ndarray:
+    """White image with a few lines of random words."""
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    scale = max(0.5, height / 360)
+    line_height = int(40 * scale)
+    for y in range(line_height, height - line_height // 2, line_height * 2):
+        text = " ".join(rng.choice(WORDS) for _ in range(3))
+        cv2.putText(
+            image,
+            text,
+            (int(10 * scale), y),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            scale,
+            (0, 0, 0),
+            max(1, int(2 * scale)),
+            cv2.LINE_AA,
+        )
+    return image
+
+
+def synthetic_frames(
+    count: int, width: int, height: int, topics: int, seed: int = 0
+) -> list[dict[str, Frame]]:
+    """Frames for "main" plus topics - 1 extra topics, every image different."""
+    rng = random.Random(seed)
+    names = ["main"] + [f"topic_{i}" for i in range(1, topics)]
+    return [
+        {
+            name: Frame(synthetic_image(width, height, rng), {"meta": {"id": i}}, "BGR")
+            for name in names
+        }
+        for i in range(count)
+    ]
+
+
+def latency_summary(latencies: list[float]) -> dict:
+    """Mean and percentiles of latencies in milliseconds."""
+    values = np.asarray(latencies) * 1000.0
+    return {
+        "mean": round(float(values.mean()), 3),
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p95": round(float(np.percentile(values, 95)), 3),
+        "p99": round(float(np.percentile(values, 99)), 3),
+        "max": round(float(values.max()), 3),
+    }
+
+
+def run_case(
+    engine: OCREngine,
+    resolution: tuple[int, int],
+    topics: int,
+    frames: int,
+    warmup: int,
+    overrides: dict,
+    output_dir: str,
+) -> dict:
+    """Benchmark one engine/resolution/topic count combination."""
+    width, height = resolution
+    case = {
+        "engine": engine.value,
+        "resolution": f"{width}x{height}",
+        "topics": topics,
+        "frames": frames,
+    }
+    config = FilterOpticalCharacterRecognitionConfig(
+        ocr_engine=engine.value,
+        output_json_path=os.path.join(output_dir, "ocr_results.json"),
+        **overrides,
+    )
+    try:
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+    except Exception as e:
+        logger.warning(f"Skipping {case}: {e}")
+        case["error"] = str(e)
+        return case
+
+    inputs = synthetic_frames(warmup + frames, width, height, topics)
+    latencies = []
+    try:
+        for i, frame in enumerate(inputs):
+            start = time.perf_counter()
+            filter_app.process(frame)
+            if i >= warmup:
+                latencies.append(time.perf_counter() - start)
+    finally:
+        filter_app.shutdown()
+
+    total = sum(latencies)
+    case["fps"] = round(frames / total, 3) if total else 0.0
+    case["latency_ms"] = latency_summary(latencies)
+    return case
+
+
+def case_key(case: dict) -> tuple:
+    return case["engine"], case["resolution"], case["topics"]
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    """
+    Compare results against a baseline run.
+
+    A case regresses when its frames/sec drops, or its p95 latency grows, by more
+    than ``max_regression`` (a fraction) relative to the baseline.
+
+    Returns:
+        list[str]: One message per regression
+    """
+    previous = {case_key(c): c for c in baseline["cases"] if "error" not in c}
+    regressions = []
+    for case in results["cases"]:
+        old = previous.get(case_key(case))
+        if old is None or "error" in case:
+            continue
+        name = "{} {} x{}".format(*case_key(case))
+        fps_change = case["fps"] / old["fps"] - 1 if old["fps"] else 0.0
+        p95_change = (
+            case["latency_ms"]["p95"] / old["latency_ms"]["p95"] - 1
+            if old["latency_ms"]["p95"]
+            else 0.0
+        )
+        print(
+            f"{name:<32} fps {old['fps']:>9.2f} -> {case['fps']:>9.2f} ({fps_change:+.1%})"
+            f"  p95 {old['latency_ms']['p95']:>9.2f} -> {case['latency_ms']['p95']:>9.2f} ms"
+            f" ({p95_change:+.1%})"
+        )
+        if fps_change < -max_regression:
+            regressions.append(f"{name}: frames/sec dropped by {-fps_change:.1%}")
+        if p95_change > max_regression:
+            regressions.append(f"{name}: p95 latency grew by {p95_change:.1%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark FilterOpticalCharacterRecognition throughput and latency."
+    )
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=[e.value for e in OCREngine],
+        default=[e.value for e in OCREngine],
+        help="OCR engines to benchmark",
+    )
+    parser.add_argument(
+        "--resolutions",
+        nargs="+",
+        type=parse_resolution,
+        default=[(640, 360), (1280, 720), (1920, 1080)],
+        help="Frame resolutions as WIDTHxHEIGHT",
+    )
+    parser.add_argument(
+        "--topics", nargs="+", type=int, default=[1, 4], help="Topics per frame"
+    )
+    parser.add_argument("--frames", type=int, default=30, help="Measured frames")
+    parser.add_argument(
+        "--warmup", type=int, default=3, help="Frames processed before measuring"
+    )
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        type=parse_override,
+        default=[],
+        help="Filter config override as key=value, e.g. ocr_executor=thread",
+    )
+    parser.add_argument(
+        "--output",
+        default=os.path.join("results", "benchmark.json"),
+        help="Where to save the results JSON",
+    )
+    parser.add_argument("--baseline", help="Results JSON of a previous run to compare")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.10,
+        help="Allowed relative drop in frames/sec or growth in p95 latency",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    overrides = dict(args.overrides)
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "overrides": overrides,
+        },
+        "cases": [],
+    }
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        for engine in args.engines:
+            for resolution in args.resolutions:
+                for topics in args.topics:
+                    case = run_case(
+                        OCREngine.from_str(engine),
+                        resolution,
+                        topics,
+                        args.frames,
+                        args.warmup,
+                        overrides,
+                        output_dir,
+                    )
+                    results["cases"].append(case)
+                    if "error" not in case:
+                        latency = case["latency_ms"]
+                        print(
+                            f"{case['engine']:<10} {case['resolution']:>10} x{topics:<3}"
+                            f" {case['fps']:>9.2f} fps  p50 {latency['p50']:>9.2f}"
+                            f"  p95 {latency['p95']:>9.2f}  p99 {latency['p99']:>9.2f} ms"
+                        )
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    print(f"Saved results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_regression)
+        if regressions:
+            print("Regressions:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
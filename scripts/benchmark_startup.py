@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+"""
+Startup benchmark for FilterOpticalCharacterRecognition.
+
+Every case runs in a fresh interpreter and measures the import time of the
+filter module (and which engine libraries it pulled in), normalize_config(),
+setup(), the latency of the first frame and the peak RSS. On Linux, the
+proportional set size (PSS) of the filter process and its OCR worker processes
+is reported as well, which shows memory shared between them (share_models)
+where RSS would count it once per process. Results are saved as JSON. With --baseline, results are compared against a previous run and the
+script exits with status 1 on a regression.
+
+Examples:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --engines tesseract --warmup both
+    python scripts/benchmark_startup.py --engines easyocr --set gpu=false --set ocr_executor=process --set share_models=true
+    python scripts/benchmark_startup.py --output results/startup.json --baseline results/startup_baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Libraries whose import dominates startup, reported per case
+HEAVY_MODULES = ["easyocr", "torch", "pytesseract"]
+
+# Measurements compared against a baseline, all lower is better
+METRICS = ["import_s", "setup_s", "first_frame_s", "peak_rss_mb", "total_pss_mb"]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def process_memory_mb(pid: int) -> dict:
+    """RSS and PSS of a process in MiB, empty where /proc/<pid>/smaps_rollup is missing."""
+    memory = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r", encoding="utf-8") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in ("Rss", "Pss"):
+                    memory[name.lower()] = int(value.split()[0]) / 1024
+    except OSError:
+        pass
+    return memory
+
+
+def measure(engine: str, warmup: bool, overrides: dict) -> dict:
+    """Measure one case in the current, fresh interpreter."""
+    sys.path.insert(0, ROOT)
+    start = time.perf_counter()
+    from filter_optical_character_recognition.filter import (
+        FilterOpticalCharacterRecognition,
+        FilterOpticalCharacterRecognitionConfig,
+    )
+
+    result = {
+        "import_s": time.perf_counter() - start,
+        "imported": [name for name in HEAVY_MODULES if name in sys.modules],
+        "import_rss_mb": peak_rss_mb(),
+    }
+
+    import cv2
+    import numpy as np
+    from openfilter.filter_runtime.filter import Frame
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine=engine,
+            output_json_path=os.path.join(output_dir, "ocr_results.json"),
+            warmup=warmup,
+            **overrides,
+        )
+        start = time.perf_counter()
+        filter_app = FilterOpticalCharacterRecognition(config)
+        config = filter_app.normalize_config(config)
+        result["normalize_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        filter_app.setup(config)
+        result["setup_s"] = time.perf_counter() - start
+
+        image = np.full((360, 640, 3), 255, dtype=np.uint8)
+        cv2.putText(
+            image, "Startup 42", (20, 180), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 0), 3
+        )
+        start = time.perf_counter()
+        filter_app.process({"main": Frame(image, {"meta": {"id": 1}}, "BGR")})
+        result["first_frame_s"] = time.perf_counter() - start
+
+        memory = process_memory_mb(os.getpid())
+        if "pss" in memory:
+            farm = filter_app.farm
+            workers = [process_memory_mb(pid) for pid in farm.pids()] if farm else []
+            result["pss_mb"] = memory["pss"]
+            result["workers"] = len(workers)
+            result["workers_rss_mb"] = sum(w.get("rss", 0.0) for w in workers)
+            result["workers_pss_mb"] = sum(w.get("pss", 0.0) for w in workers)
+            result["total_pss_mb"] = result["pss_mb"] + result["workers_pss_mb"]
+        filter_app.shutdown()
+
+    result["peak_rss_mb"] = peak_rss_mb()
+    return {
+        key: round(value, 4) if isinstance(value, float) else value
+        for key, value in result.items()
+    }
+
+
+def run_case(engine: str, warmup: bool, overrides: dict) -> dict:
+    """Run measure() in a child interpreter."""
+    case = {"engine": engine, "warmup": warmup}
+    command = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--child",
+        json.dumps({"engine": engine, "warmup": warmup, "overrides": overrides}),
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        lines = completed.stderr.strip().splitlines()
+        case["error"] = lines[-1] if lines else "failed"
+        return case
+    case.update(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return case
+
+
+def case_key(case: dict) -> tuple:
+    return case["engine"], case["warmup"]
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    """
+    Compare results against a baseline run.
+
+    A case regresses when any of METRICS grows by more than ``max_regression``
+    (a fraction) relative to the baseline.
+
+    Returns:
+        list[str]: One message per regression
+    """
+    previous = {case_key(c): c for c in baseline["cases"] if "error" not in c}
+    regressions = []
+    for case in results["cases"]:
+        old = previous.get(case_key(case))
+        if old is None or "error" in case:
+            continue
+        name = "{} warmup={}".format(*case_key(case))
+        for metric in METRICS:
+            if not old.get(metric) or metric not in case:
+                continue
+            change = case[metric] / old[metric] - 1
+            print(
+                f"{name:<24} {metric:<14} {old[metric]:>10.3f} -> {case[metric]:>10.3f}"
+                f" ({change:+.1%})"
+            )
+            if change > max_regression:
+                regressions.append(f"{name}: {metric} grew by {change:.1%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark FilterOpticalCharacterRecognition startup time and memory."
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=["tesseract", "easyocr"],
+        default=["tesseract", "easyocr"],
+        help="OCR engines to benchmark",
+    )
+    parser.add_argument(
+        "--warmup",
+        choices=["off", "on", "both"],
+        default="both",
+        help="Measure setup without warm-up, with it, or both",
+    )
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        help="Filter config override as key=value, e.g. gpu=false",
+    )
+    parser.add_argument(
+        "--output",
+        default=os.path.join("results", "startup.json"),
+        help="Where to save the results JSON",
+    )
+    parser.add_argument("--baseline", help="Results JSON of a previous run to compare")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Allowed relative growth of any startup measurement",
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        case = json.loads(args.child)
+        print(json.dumps(measure(case["engine"], case["warmup"], case["overrides"])))
+        return
+
+    overrides = {}
+    for value in args.overrides:
+        key, sep, raw = value.partition("=")
+        if not sep:
+            parser.error(f"Invalid override {value!r}, use key=value")
+        try:
+            overrides[key.strip()] = json.loads(raw)
+        except json.JSONDecodeError:
+            overrides[key.strip()] = raw
+    warmups = {"off": [False], "on": [True], "both": [False, True]}[args.warmup]
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "overrides": overrides,
+        },
+        "cases": [],
+    }
+    for engine in args.engines:
+        for warmup in warmups:
+            case = run_case(engine, warmup, overrides)
+            results["cases"].append(case)
+            if "error" in case:
+                print(f"{engine:<10} warmup={warmup!s:<5} failed: {case['error']}")
+                continue
+            print(
+                f"{engine:<10} warmup={warmup!s:<5} import {case['import_s']:>7.3f}s"
+                f"  setup {case['setup_s']:>7.3f}s  first frame {case['first_frame_s']:>7.3f}s"
+                f"  peak RSS {case['peak_rss_mb']:>8.1f} MiB"
+                + (
+                    f"  PSS {case['total_pss_mb']:>8.1f} MiB ({case['workers']} workers)"
+                    if "total_pss_mb" in case
+                    else ""
+                )
+                + f"  imported: {', '.join(case['imported']) or '-'}"
+            )
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    print(f"Saved results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_regression)
+        if regressions:
+            print("Regressions:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -46,7 +46,7 @@ def main():
     )
     parser.add_argument(
         "--ocr_engine",
-        choices=["tesseract", "easyocr"],
+        choices=["tesseract", "easyocr", "hybrid"],
         default="easyocr",
         help="OCR engine to use",
     )
@@ -55,6 +55,11 @@ def main():
         default="region_.*",
         help="Regex pattern for OCR filter to process topics",
     )
+    parser.add_argument(
+        "--roi_mode",
+        action="store_true",
+        help="Send text regions as ocr_rois on the main topic instead of cropped topics",
+    )
     args = parser.parse_args()
 
     # Ensure output directory exists
@@ -89,6 +94,7 @@ def main():
                     font_scale=2.0,
                     font_thickness=3,
                     padding=20,
+                    roi_mode=args.roi_mode,
                 ),
             ),
             # OCR filter - processes selected topics
@@ -104,7 +110,9 @@ def main():
                     # topic_pattern=args.ocr_topic_pattern,
                     # forward_ocr_texts=True,
                     # write_output_file=True,
-                    exclude_topics=["main"],  # ["region_*"] in regex format
+                    # In ROI mode only main is published and OCR runs on its ocr_rois
+                    exclude_topics=[] if args.roi_mode else ["main"],
+                    # ["region_*"] in regex format
                     # debug=True
                 ),
             ),
@@ -17,6 +17,7 @@ class MultiSourceProducerConfig(FilterConfig):
     font_scale: float = 2.0  # Font scale for text
     font_thickness: int = 3  # Font thickness for text
     padding: int = 20  # Padding around text regions
+    roi_mode: bool = False  # Send regions as ocr_rois on main, no cropped topics
 
 
 class MultiSourceProducer(Filter):
@@ -26,6 +27,9 @@ class MultiSourceProducer(Filter):
     1. main - The input frame with all text regions added
     2. region_[N] - Cropped text regions from the frame (where N is region number)
 
+    With roi_mode enabled the cropped topics are not published, the region boxes
+    are attached to the main frame metadata as ``ocr_rois`` instead.
+
     This demonstrates creating multiple different views of an input frame,
     each available as a separate topic for downstream filters to consume.
     """
@@ -130,16 +134,17 @@ class MultiSourceProducer(Filter):
         output_frames = {}
 
         # Add main frame (full image with text regions)
-        output_frames["main"] = Frame(
-            image,
-            {
-                "meta": {
-                    "description": "Input frame with text regions",
-                    "frame_num": self.frame_count,
-                }
-            },
-            "BGR",
-        )
+        main_meta = {
+            "description": "Input frame with text regions",
+            "frame_num": self.frame_count,
+        }
+        if self.config.roi_mode:
+            main_meta["ocr_rois"] = [
+                {"id": f"region_{i}", "box": list(box)} for i, box in enumerate(regions)
+            ]
+        output_frames["main"] = Frame(image, {"meta": main_meta}, "BGR")
+        if self.config.roi_mode:
+            return output_frames
 
         # Add cropped regions
         for i, (x1, y1, x2, y2) in enumerate(regions):
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition import adaptive
+from filter_optical_character_recognition.adaptive import AdaptiveScaler
+
+
+class TestAdaptiveScaler(unittest.TestCase):
+    def setUp(self):
+        self.image = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+    def test_starts_at_full_resolution(self):
+        scaler = AdaptiveScaler(min_text_height=20, probe_interval=10)
+        image, scale = scaler.resize("main", self.image)
+        self.assertIs(image, self.image)
+        self.assertEqual(scale, 1.0)
+
+    def test_scale_keeps_min_text_height(self):
+        scaler = AdaptiveScaler(min_text_height=20, probe_interval=10)
+        scaler.observe("main", [78.0, 80.0, 82.0], 1.0)
+
+        # 20 / 80 = 0.25
+        image, scale = scaler.resize("main", self.image)
+        self.assertEqual(scale, 0.25)
+        self.assertEqual(image.shape, (270, 480, 3))
+
+        # Heights seen at reduced scale are converted back before scaling
+        scaler.observe("main", [10.0], 0.25)
+        self.assertEqual(scaler.scale("main"), 0.375)
+
+    def test_scale_rounds_up(self):
+        scaler = AdaptiveScaler(min_text_height=20, probe_interval=10)
+        scaler.observe("main", [70.0], 1.0)
+        # 20 / 70 = 0.286, rounded up so text never ends below the minimum
+        self.assertEqual(scaler.scale("main"), 0.375)
+
+        scaler.observe("small", [12.0], 1.0)
+        self.assertEqual(scaler.scale("small"), 1.0)
+
+    def test_keys_are_independent(self):
+        scaler = AdaptiveScaler(min_text_height=20, probe_interval=10)
+        scaler.observe("main", [160.0], 1.0)
+        self.assertEqual(scaler.scale("main"), 0.125)
+        self.assertEqual(scaler.scale("crop"), 1.0)
+
+    def test_keys_are_bounded(self):
+        scaler = AdaptiveScaler(min_text_height=20, probe_interval=10)
+        scaler.observe("main", [160.0], 1.0)
+        for i in range(adaptive.MAX_CACHED_KEYS + 10):
+            scaler.observe(f"main/roi_{i}", [160.0], 1.0)
+            scaler.observe("main", [160.0], 1.0)
+        self.assertEqual(scaler.stats()["keys"], adaptive.MAX_CACHED_KEYS)
+        self.assertEqual(scaler.scale("main"), 0.125)
+        self.assertEqual(scaler.scale("main/roi_0"), 1.0)
+
+    def test_periodic_probe(self):
+        scaler = AdaptiveScaler(min_text_height=20, probe_interval=3)
+        scaler.observe("main", [80.0], 1.0)
+        scales = []
+        for _ in range(8):
+            scale = scaler.scale("main")
+            scales.append(scale)
+            scaler.observe("main", [80.0 * scale], scale)
+        self.assertEqual(scales, [0.25, 0.25, 0.25, 1.0, 0.25, 0.25, 0.25, 1.0])
+        self.assertEqual(scaler.stats()["full_resolution_passes"], 3)
+        self.assertEqual(scaler.stats()["reduced_passes"], 6)
+
+    def test_probe_after_empty_pass(self):
+        scaler = AdaptiveScaler(min_text_height=20, probe_interval=100)
+        scaler.observe("main", [80.0], 1.0)
+        scaler.observe("main", [], 0.25)
+        self.assertEqual(scaler.scale("main"), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
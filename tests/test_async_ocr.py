@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.async_ocr import LatestFrameWorker
+
+
+class TestLatestFrameWorker(unittest.TestCase):
+    def setUp(self):
+        self.worker = LatestFrameWorker()
+        self.worker.start()
+
+    def tearDown(self):
+        self.worker.close()
+
+    def wait_for(self, seq):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            latest = self.worker.latest()
+            if latest is not None and latest.seq >= seq:
+                return latest
+            time.sleep(0.01)
+        self.fail(f"Task {seq} did not complete")
+
+    def test_latest_result(self):
+        self.assertIsNone(self.worker.latest())
+        self.worker.submit(1, lambda: "first")
+        latest = self.wait_for(1)
+        self.assertEqual(latest.frame_id, 1)
+        self.assertEqual(latest.value, "first")
+        self.assertGreaterEqual(latest.age_ms(), 0.0)
+
+    def test_stale_frames_are_dropped(self):
+        release = threading.Event()
+        ran = []
+
+        def task(frame_id):
+            def run():
+                if frame_id == 1:
+                    release.wait(5)
+                ran.append(frame_id)
+                return frame_id
+
+            return run
+
+        self.worker.submit(1, task(1))
+        time.sleep(0.05)
+        # Frames 2 and 3 arrive while frame 1 is being recognized
+        self.worker.submit(2, task(2))
+        self.worker.submit(3, task(3))
+        release.set()
+
+        latest = self.wait_for(3)
+        self.assertEqual(latest.value, 3)
+        self.assertEqual(ran, [1, 3])
+        self.assertEqual(self.worker.stats()["dropped"], 1)
+
+    def test_failed_task_keeps_previous_result(self):
+        self.worker.submit(1, lambda: "ok")
+        self.wait_for(1)
+
+        def fail():
+            raise RuntimeError("engine crashed")
+
+        self.worker.submit(2, fail)
+        while self.worker.failed == 0:
+            time.sleep(0.01)
+        self.assertEqual(self.worker.latest().value, "ok")
+
+        self.worker.submit(3, lambda: "recovered")
+        self.assertEqual(self.wait_for(3).value, "recovered")
+        self.assertEqual(self.worker.failed, 1)
+
+    def test_close_finishes_pending_task(self):
+        self.worker.submit(1, lambda: time.sleep(0.05) or "slow")
+        self.worker.submit(2, lambda: "last")
+        self.worker.close()
+        self.assertEqual(self.worker.latest().value, "last")
+        with self.assertRaises(RuntimeError):
+            self.worker.submit(3, lambda: None)
+
+
+if __name__ == "__main__":
+    unittest.main()
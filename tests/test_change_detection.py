@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+
+import cv2
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition import change_detection
+from filter_optical_character_recognition.change_detection import TopicChangeGate
+
+
+class TestTopicChangeGate(unittest.TestCase):
+    def create_image(self, text):
+        """Helper method to create a white image with black text."""
+        image = np.ones((100, 300, 3), dtype=np.uint8) * 255
+        cv2.putText(image, text, (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
+        return image
+
+    def run_gate(self, gate, topic, image):
+        """Feed one frame to the gate and store a result when it asks for OCR."""
+        run = gate.should_run(topic, image)
+        if run:
+            gate.update(topic, ([topic], [1.0]))
+        return run
+
+    def test_frame_skip_per_topic(self):
+        gate = TopicChangeGate(frame_skip=3)
+        image = self.create_image("Hello")
+
+        # First frame always runs, then every third frame of the topic
+        runs = [self.run_gate(gate, "main", image) for _ in range(6)]
+        self.assertEqual(runs, [True, False, True, False, False, True])
+
+        # A new topic has its own counter and no result yet
+        self.assertTrue(self.run_gate(gate, "region_0", image))
+        self.assertEqual(gate.last_result("region_0"), (["region_0"], [1.0]))
+
+    def test_change_threshold(self):
+        gate = TopicChangeGate(threshold=0.02)
+        hello = self.create_image("Hello")
+        world = self.create_image("World, this changed")
+
+        self.assertTrue(self.run_gate(gate, "main", hello))
+        self.assertFalse(self.run_gate(gate, "main", hello.copy()))
+        self.assertTrue(self.run_gate(gate, "main", world))
+        self.assertFalse(self.run_gate(gate, "main", world))
+        self.assertEqual(gate.runs, 2)
+        self.assertEqual(gate.skips, 2)
+
+    def test_topics_are_bounded(self):
+        gate = TopicChangeGate(frame_skip=2)
+        image = np.zeros((4, 4), dtype=np.uint8)
+        self.run_gate(gate, "main", image)
+        for i in range(change_detection.MAX_CACHED_KEYS + 10):
+            self.run_gate(gate, f"main/roi_{i}", image)
+            # Kept as the most recently used topic
+            gate.should_run("main", image)
+        self.assertEqual(len(gate._topics), change_detection.MAX_CACHED_KEYS)
+        self.assertEqual(gate.last_result("main"), (["main"], [1.0]))
+        self.assertTrue(gate.should_run("main/roi_0", image))
+
+    def test_max_staleness(self):
+        gate = TopicChangeGate(threshold=0.5, max_staleness=3)
+        image = self.create_image("Hello")
+
+        runs = [self.run_gate(gate, "main", image) for _ in range(7)]
+        self.assertEqual(runs, [True, False, False, True, False, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
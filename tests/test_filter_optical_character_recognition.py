@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 
+import importlib.util
 import logging
 import multiprocessing
 import os
+import subprocess
 import sys
 import tempfile
+import time
 import unittest
 import json
 import cv2
@@ -19,6 +22,12 @@ from filter_optical_character_recognition.filter import (
     FilterOpticalCharacterRecognitionConfig,
     OCREngine,
 )
+from filter_optical_character_recognition.sqlite_sink import search_text
+from filter_optical_character_recognition.segments import (
+    find_records,
+    list_segments,
+    read_segment_index,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -177,6 +186,691 @@ class TestFilterOpticalCharacterRecognition(unittest.TestCase):
             self.assertEqual(result["ocr_confidence"], 0.0)
             self.assertEqual(result["texts"], [])
 
+    @unittest.skipUnless(
+        importlib.util.find_spec("tesserocr"), "tesserocr is not installed"
+    )
+    def test_process_with_tesseract_workers(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="tesseract",
+            output_json_path=self.output_file,
+            tesseract_workers=2,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+        self.assertIsNotNone(filter_app.engine.pool)
+
+        texts = ["Frame One", "Frame Two", "Frame Three"]
+        for i, text in enumerate(texts, start=1):
+            frame = self.create_test_frame(text, i)
+            filter_app.process(frame)
+        filter_app.shutdown()
+
+        with open(self.output_file, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+            self.assertEqual(len(lines), len(texts))
+            for i, line in enumerate(lines):
+                result = json.loads(line)
+                self.assertEqual(result["frame_id"], i + 1)
+                self.assertIn(texts[i], result["texts"])
+
+    def test_invalid_tesseract_workers(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="tesseract",
+                output_json_path=self.output_file,
+                tesseract_workers=-1,
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_process_with_thread_executor(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            ocr_executor="thread",
+            ocr_workers=2,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+        self.assertIsNotNone(filter_app.executor)
+
+        frame = self.create_test_frame("Open your EYE", 5)
+        output = filter_app.process(frame)
+        filter_app.shutdown()
+
+        self.assertEqual(list(output)[:2], ["main", "test_frame"])
+        for topic in ("main", "test_frame"):
+            self.assertIn("Open your EYE", output[topic].data["meta"]["ocr_texts"])
+
+        with open(self.output_file, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+            self.assertEqual(len(lines), 1)
+            result = json.loads(lines[0])
+            self.assertEqual(result["frame_id"], 5)
+            self.assertIn("Open your EYE", result["texts"])
+
+    def test_process_with_easyocr_batch(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            easyocr_batch_size=8,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        frames = self.create_test_frame("Open your EYE", 6)
+        empty = self.create_test_frame(None, 6)["main"]
+        frames["empty_frame"] = Frame(empty.rw_bgr.image, {"meta": {"id": 6}}, "BGR")
+        output = filter_app.process(frames)
+        filter_app.shutdown()
+
+        self.assertIn("Open your EYE", output["main"].data["meta"]["ocr_texts"])
+        self.assertIn("Open your EYE", output["test_frame"].data["meta"]["ocr_texts"])
+        self.assertEqual(output["empty_frame"].data["meta"]["ocr_texts"], [])
+
+    def test_process_with_result_cache(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            result_cache_size=8,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        for i in range(1, 4):
+            frame = self.create_test_frame("Open your EYE", i)
+            filter_app.process(frame)
+        filter_app.shutdown()
+
+        # Two topics, recognized on the first frame and served from cache afterwards
+        self.assertEqual(filter_app.result_cache.misses, 2)
+        self.assertEqual(filter_app.result_cache.hits, 4)
+
+        with open(self.output_file, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+            self.assertEqual(len(lines), 3)
+            for i, line in enumerate(lines):
+                result = json.loads(line)
+                self.assertEqual(result["frame_id"], i + 1)
+                self.assertIn("Open your EYE", result["texts"])
+
+    def test_process_with_rois(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        image = np.ones((200, 300, 3), dtype=np.uint8) * 255
+        cv2.putText(image, "Open", (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
+        cv2.putText(image, "EYE", (10, 150), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
+        rois = [
+            {"id": "top", "box": [0, 0, 300, 100]},
+            {"id": "bottom", "box": [0, 100, 300, 200]},
+        ]
+        frames = {"main": Frame(image, {"meta": {"id": 7, "ocr_rois": rois}}, "BGR")}
+        output = filter_app.process(frames)
+        filter_app.shutdown()
+
+        meta = output["main"].data["meta"]
+        self.assertEqual(list(meta["ocr_roi_results"]), ["top", "bottom"])
+        self.assertEqual(meta["ocr_roi_results"]["top"]["texts"], ["Open"])
+        self.assertEqual(meta["ocr_roi_results"]["bottom"]["texts"], ["EYE"])
+        self.assertEqual(meta["ocr_texts"], ["Open", "EYE"])
+
+        with open(self.output_file, "r", encoding="utf-8") as f:
+            result = json.loads(f.readlines()[-1])
+            self.assertEqual(result["frame_id"], 7)
+            self.assertEqual(result["rois"]["bottom"]["texts"], ["EYE"])
+
+    def test_async_ocr(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            async_ocr=True,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        # The first frame passes through before any OCR result exists
+        output = filter_app.process(self.create_test_frame("Open your EYE", 1))
+        meta = output["main"].data["meta"]
+        self.assertEqual(meta["ocr_texts"], [])
+        self.assertIsNone(meta["ocr_source_frame_id"])
+
+        # Wait for the background result, later frames are tagged with it
+        while filter_app.async_worker.latest() is None:
+            time.sleep(0.05)
+        output = filter_app.process(self.create_test_frame("Open your EYE", 2))
+        meta = output["main"].data["meta"]
+        filter_app.shutdown()
+
+        self.assertIn("Open your EYE", meta["ocr_texts"])
+        self.assertEqual(meta["ocr_source_frame_id"], 1)
+        self.assertGreaterEqual(meta["ocr_age_ms"], 0.0)
+
+        with open(self.output_file, "r", encoding="utf-8") as f:
+            frame_ids = [json.loads(line)["frame_id"] for line in f]
+            self.assertEqual(frame_ids[0], 1)
+            self.assertEqual(len(frame_ids), len(set(frame_ids)))
+
+    def test_async_ocr_skip_ocr(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            async_ocr=True,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        filter_app.process(self.create_test_frame("Open your EYE", 1))
+        while filter_app.async_worker.latest() is None:
+            time.sleep(0.05)
+
+        # Opted-out topics do not get the result of an earlier frame
+        frames = self.create_test_frame("Open your EYE", 2, skip_ocr=True)
+        frames["main"] = Frame(
+            frames["main"].rw_bgr.image, {"meta": {"id": 2, "skip_ocr": True}}, "BGR"
+        )
+        output = filter_app.process(frames)
+        for topic in ("main", "test_frame"):
+            meta = output[topic].data["meta"]
+            self.assertEqual(meta["ocr_texts"], [])
+            self.assertNotIn("ocr_source_frame_id", meta)
+            self.assertNotIn("ocr_age_ms", meta)
+
+        # Topics the worker recognizes keep getting the latest result
+        output = filter_app.process(self.create_test_frame("Open your EYE", 3))
+        filter_app.shutdown()
+        meta = output["main"].data["meta"]
+        self.assertIn("Open your EYE", meta["ocr_texts"])
+        self.assertIn(meta["ocr_source_frame_id"], (1, 3))
+
+    def test_subject_data_is_streamed(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            subject_data_format="jsonl",
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        subject_data_file = os.path.join(self.temp_dir.name, "subject_data.jsonl")
+        for i in range(1, 4):
+            filter_app.process(self.create_test_frame("Open your EYE", i))
+            # Records are on disk before shutdown
+            with open(subject_data_file, "r", encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), i)
+        filter_app.shutdown()
+
+        with open(subject_data_file, "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r["meta"]["id"] for r in records], [1, 2, 3])
+        self.assertIn("Open your EYE", records[0]["meta"]["ocr_texts"])
+
+    def test_background_output_writer(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            output_queue_size=16,
+            output_flush_interval=0.5,
+            output_fsync="interval",
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        for i in range(1, 4):
+            filter_app.process(self.create_test_frame("Open your EYE", i))
+        filter_app.shutdown()
+
+        with open(self.output_file, "r", encoding="utf-8") as f:
+            frame_ids = [json.loads(line)["frame_id"] for line in f]
+            self.assertEqual(frame_ids, [1, 2, 3])
+        subject_data_file = os.path.join(self.temp_dir.name, "subject_data.json")
+        with open(subject_data_file, "r", encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)), 3)
+
+    def test_invalid_output_fsync(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr",
+                output_json_path=self.output_file,
+                output_fsync="sometimes",
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_output_segments(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            output_segments=True,
+            output_compression="gzip",
+            output_index_block=2,
+            # Every flush cuts a block, keep them for shutdown
+            output_queue_size=10,
+            output_flush_interval=60.0,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        for i in range(1, 6):
+            filter_app.process(self.create_test_frame("Open your EYE", i))
+        filter_app.shutdown()
+
+        base_path = os.path.join(self.temp_dir.name, "output")
+        self.assertFalse(os.path.exists(self.output_file))
+        [(_, segment)] = list_segments(base_path)
+        self.assertEqual(len(read_segment_index(segment)), 3)
+        [record] = find_records(base_path, frame_id=4)
+        self.assertIn("Open your EYE", record["texts"])
+
+    def test_invalid_output_compression(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr",
+                output_json_path=self.output_file,
+                output_compression="lz4",
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_output_sqlite(self):
+        database = os.path.join(self.temp_dir.name, "ocr_results.db")
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            output_sqlite_path=database,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        for i in range(1, 4):
+            filter_app.process(self.create_test_frame("Open your EYE", i))
+        filter_app.shutdown()
+
+        rows = search_text(database, "open your eye", topic="main")
+        self.assertEqual([row["frame_id"] for row in rows], [1, 2, 3])
+
+    def test_stage_timing(self):
+        metrics_path = os.path.join(self.temp_dir.name, "ocr.prom")
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            stage_timing=True,
+            metrics_path=metrics_path,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        for i in range(1, 4):
+            result = filter_app.process(self.create_test_frame("Open your EYE", i))
+        timing = result["main"].data["meta"]["ocr_timing"]
+        for key in ("routing_ms", "ocr_ms", "aggregation_ms", "output_ms", "total_ms"):
+            self.assertIn(key, timing)
+        self.assertIn("main", timing["ocr_topics_ms"])
+        self.assertGreater(timing["ocr_ms"], 0)
+        filter_app.shutdown()
+
+        # Written at shutdown even before metrics_interval passed
+        with open(metrics_path, "r", encoding="utf-8") as f:
+            metrics = f.read()
+        self.assertIn("ocr_filter_frames_total 3", metrics)
+        self.assertIn('ocr_filter_stage_seconds_count{stage="ocr"} 3', metrics)
+
+    def test_invalid_metrics_interval(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr",
+                output_json_path=self.output_file,
+                metrics_interval=0.0,
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_preprocess(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            preprocess=["grayscale", "max_side=320", "clahe", "otsu"],
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        frames = self.create_test_frame("Open your EYE", 1)
+        original = frames["main"].rw_bgr.image.copy()
+        result = filter_app.process(frames)
+        filter_app.shutdown()
+
+        texts = " ".join(result["main"].data["meta"]["ocr_texts"]).lower()
+        self.assertIn("open", texts)
+        # Outputs carry the original image, only OCR sees the preprocessed copy
+        np.testing.assert_array_equal(result["main"].rw_bgr.image, original)
+
+    def test_invalid_preprocess(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr",
+                output_json_path=self.output_file,
+                preprocess=["grayscale", "sharpen"],
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_adaptive_resolution(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            adaptive_resolution=True,
+            min_text_height=12,
+            adaptive_probe_interval=2,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        # Large captions on a big frame
+        image = np.ones((720, 1280, 3), dtype=np.uint8) * 255
+        cv2.putText(
+            image,
+            "Open your EYE",
+            (40, 360),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            4,
+            (0, 0, 0),
+            8,
+            cv2.LINE_AA,
+        )
+        for i in range(1, 5):
+            frames = {"main": Frame(image, {"meta": {"id": i}}, "BGR")}
+            result = filter_app.process(frames)
+            texts = " ".join(result["main"].data["meta"]["ocr_texts"]).lower()
+            self.assertIn("open", texts)
+
+        self.assertLess(filter_app.adaptive.scale("main"), 1.0)
+        stats = filter_app.adaptive.stats()
+        self.assertGreater(stats["reduced_passes"], 0)
+        self.assertGreater(stats["full_resolution_passes"], 1)
+        filter_app.shutdown()
+
+    def test_invalid_adaptive_resolution(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr",
+                output_json_path=self.output_file,
+                adaptive_resolution=True,
+                detect_interval=5,
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_engine_libraries_imported_lazily(self):
+        code = (
+            "import sys\n"
+            "import filter_optical_character_recognition.filter as f\n"
+            "config = f.FilterOpticalCharacterRecognitionConfig(ocr_engine='easyocr')\n"
+            "f.FilterOpticalCharacterRecognition.normalize_config(config)\n"
+            "print(sorted(m for m in ('easyocr', 'torch', 'pytesseract') if m in sys.modules))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.abspath(os.path.join(os.path.dirname(__file__), "..")),
+        ).stdout
+        self.assertEqual(output.strip().splitlines()[-1], "[]")
+
+    def test_warmup(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            warmup=True,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        result = filter_app.process(self.create_test_frame("Open your EYE", 1))
+        texts = " ".join(result["main"].data["meta"]["ocr_texts"]).lower()
+        self.assertIn("open", texts)
+        filter_app.shutdown()
+
+    @unittest.skipUnless(
+        "fork" in multiprocessing.get_all_start_methods(), "fork is not available"
+    )
+    def test_share_models(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            gpu=False,
+            ocr_executor="process",
+            ocr_workers=2,
+            share_models=True,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        # Loaded in the fork server, this process is never forked
+        self.assertIsNone(filter_app.engine.reader)
+        self.assertEqual(len(filter_app.farm.pids()), 3)
+        result = filter_app.process(self.create_test_frame("Open your EYE", 1))
+        texts = " ".join(result["main"].data["meta"]["ocr_texts"]).lower()
+        self.assertIn("open", texts)
+        filter_app.shutdown()
+
+    def test_invalid_share_models(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr",
+                output_json_path=self.output_file,
+                share_models=True,
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_process_with_worker_farm(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            gpu=False,
+            ocr_executor="process",
+            ocr_workers=2,
+            ocr_worker_threads=1,
+            ocr_cpu_affinity=(
+                sorted(os.sched_getaffinity(0))
+                if hasattr(os, "sched_getaffinity")
+                else []
+            ),
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+        self.assertEqual(len(filter_app.farm.pids()), 2)
+
+        result = filter_app.process(self.create_test_frame("Open your EYE", 1))
+        for topic in ("main", "test_frame"):
+            texts = " ".join(result[topic].data["meta"]["ocr_texts"]).lower()
+            self.assertIn("open", texts)
+        filter_app.shutdown()
+        self.assertIsNone(filter_app.farm)
+
+    def test_invalid_worker_farm_options(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr", ocr_worker_threads=2
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr", ocr_executor="thread", ocr_cpu_affinity=[0]
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+        with self.assertRaises(TypeError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr", ocr_executor="process", ocr_cpu_affinity=["0"]
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_frames_pass_through(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        frames = self.create_test_frame("Open your EYE", 1)
+        image = frames["main"].image
+        result = filter_app.process(frames)
+        # Output frames reuse the incoming image, only the metadata is new
+        for topic in ("main", "test_frame"):
+            self.assertTrue(np.shares_memory(result[topic].image, image))
+        self.assertIn("ocr_texts", result["main"].data["meta"])
+        filter_app.shutdown()
+
+    def test_visualization(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            draw_visualization=True,
+            visualization_resize_factor=0.5,
+            visualization_max_fps=0.0,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        # Drawn on the processing thread until the background renderer catches up
+        result = filter_app.process(self.create_test_frame("Open your EYE", 1))
+        self.assertIn("viz", result)
+        image = result["viz"].ro_bgr.image
+        self.assertEqual(image.shape, (50, 150, 3))
+        self.assertTrue(np.all(image == (0, 255, 0), axis=2).any())
+        filter_app.shutdown()
+
+    def test_invalid_visualization_max_fps(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr", visualization_max_fps=-1.0
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_engine_profiles(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            engine_profiles={"^test_": {"allowlist": "0123456789", "min_size": 5}},
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        result = filter_app.process(self.create_test_frame("Score 42", 1))
+        main_texts = " ".join(result["main"].data["meta"]["ocr_texts"]).lower()
+        self.assertIn("score", main_texts)
+        # The profile only lets digits through
+        for text in result["test_frame"].data["meta"]["ocr_texts"]:
+            self.assertTrue(all(c in "0123456789 " for c in text), text)
+        filter_app.shutdown()
+
+    def test_invalid_engine_profiles(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr", engine_profiles={"main": {"dpi": 300}}
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr",
+                easyocr_batch_size=8,
+                engine_profiles={"main": {"allowlist": "0123456789"}},
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_hybrid_engine(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="hybrid",
+            output_json_path=self.output_file,
+            tesseract_cmd=os.path.abspath("bin/tesseract/tesseract.AppImage"),
+            engine_routes={"^test_": "easyocr"},
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        result = filter_app.process(self.create_test_frame("Hybrid Test", 1))
+        # Black text on white is routed to Tesseract by its contrast
+        self.assertEqual(result["main"].data["meta"]["ocr_engine"], "tesseract")
+        self.assertEqual(result["test_frame"].data["meta"]["ocr_engine"], "easyocr")
+        for topic in ("main", "test_frame"):
+            texts = " ".join(result[topic].data["meta"]["ocr_texts"]).lower()
+            self.assertIn("hybrid", texts)
+        filter_app.shutdown()
+
+        with open(self.output_file, "r", encoding="utf-8") as f:
+            self.assertEqual(json.loads(f.readline())["ocr_engine"], "tesseract")
+
+    def test_invalid_hybrid_options(self):
+        tesseract_cmd = os.path.abspath("bin/tesseract/tesseract.AppImage")
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr", engine_routes={"main": "tesseract"}
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="hybrid",
+                tesseract_cmd=tesseract_cmd,
+                engine_routes={"main": "paddle"},
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="hybrid",
+                tesseract_cmd=tesseract_cmd,
+                hybrid_contrast_threshold=1.5,
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="hybrid", tesseract_cmd=tesseract_cmd, easyocr_batch_size=8
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_text_prefilter(self):
+        config = FilterOpticalCharacterRecognitionConfig(
+            ocr_engine="easyocr",
+            output_json_path=self.output_file,
+            text_prefilter_threshold=0.08,
+        )
+        filter_app = FilterOpticalCharacterRecognition(config)
+        filter_app.setup(filter_app.normalize_config(config))
+
+        result = filter_app.process(self.create_test_frame("Prefilter Test", 1))
+        texts = " ".join(result["main"].data["meta"]["ocr_texts"]).lower()
+        self.assertIn("prefilter", texts)
+        self.assertEqual(filter_app.text_prefilter.skipped, 0)
+
+        # Blank topics get an empty result without an OCR pass
+        result = filter_app.process(self.create_test_frame(None, 2))
+        self.assertEqual(result["main"].data["meta"]["ocr_texts"], [])
+        self.assertEqual(filter_app.text_prefilter.skipped, 1)
+        self.assertEqual(filter_app.text_prefilter.passed, 1)
+        filter_app.shutdown()
+
+        with open(self.output_file, "r", encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+    def test_invalid_text_prefilter_threshold(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr", text_prefilter_threshold=0.8
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+        with self.assertRaises(TypeError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr", text_prefilter_threshold="high"
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
+    def test_invalid_ocr_executor(self):
+        with self.assertRaises(ValueError):
+            config = FilterOpticalCharacterRecognitionConfig(
+                ocr_engine="easyocr",
+                output_json_path=self.output_file,
+                ocr_executor="INVALID_EXECUTOR",
+            )
+            FilterOpticalCharacterRecognition.normalize_config(config)
+
     def test_invalid_ocr_engine(self):
         with self.assertRaises(ValueError):
             config = FilterOpticalCharacterRecognitionConfig(
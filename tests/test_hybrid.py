@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+
+import cv2
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.hybrid import (
+    EngineRouter,
+    contrast_score,
+    parse_engine_routes,
+)
+
+
+def text_crop(background: int = 255, ink: int = 0) -> np.ndarray:
+    image = np.full((60, 400, 3), background, dtype=np.uint8)
+    cv2.putText(image, "SCORE 12:34", (10, 45), 0, 1.4, (ink, ink, ink), 3)
+    return image
+
+
+def scene() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:480, 0:640]
+    gray = np.sin(x / 37) + np.cos(y / 23) + rng.normal(0, 0.5, x.shape)
+    gray = (gray * 40 + 120).clip(0, 255).astype(np.uint8)
+    image = cv2.merge([gray, np.roll(gray, 50, 1), gray // 2])
+    cv2.putText(image, "EXIT", (200, 240), 0, 2, (200, 200, 255), 4)
+    return image
+
+
+class TestContrastScore(unittest.TestCase):
+    def test_clean_text_scores_high(self):
+        self.assertGreater(contrast_score(text_crop()), 0.8)
+        # Light text on a dark background, and grayscale input
+        self.assertGreater(contrast_score(text_crop(20, 240)[:, :, 0]), 0.8)
+
+    def test_scene_scores_low(self):
+        self.assertLess(contrast_score(scene()), 0.8)
+
+    def test_flat_image(self):
+        self.assertEqual(contrast_score(np.full((50, 50), 128, dtype=np.uint8)), 0.0)
+
+    def test_strided_view(self):
+        image = text_crop()
+        self.assertAlmostEqual(
+            contrast_score(image[:, 5:300]),
+            contrast_score(np.ascontiguousarray(image[:, 5:300])),
+        )
+
+
+class TestParseEngineRoutes(unittest.TestCase):
+    def test_routes_in_order(self):
+        routes = parse_engine_routes({"^score": "Tesseract", "cam": "easyocr"})
+        self.assertEqual([regex.pattern for regex, _ in routes], ["^score", "cam"])
+        self.assertEqual([engine for _, engine in routes], ["tesseract", "easyocr"])
+
+    def test_invalid_routes(self):
+        with self.assertRaises(ValueError):
+            parse_engine_routes({"main": "paddle"})
+        with self.assertRaises(ValueError):
+            parse_engine_routes({"[": "easyocr"})
+        with self.assertRaises(TypeError):
+            parse_engine_routes({"main": 1})
+
+
+class TestEngineRouter(unittest.TestCase):
+    def test_route_wins_over_contrast(self):
+        router = EngineRouter(parse_engine_routes({r"\[plate\]": "easyocr"}))
+        self.assertEqual(router.engine("main[plate]", text_crop()), "easyocr")
+        self.assertEqual(router.engine("main[clock]", text_crop()), "tesseract")
+        self.assertEqual(router.engine("camera", scene()), "easyocr")
+        self.assertEqual(
+            router.stats(),
+            {"tesseract_jobs": 1, "easyocr_jobs": 2, "by_route": 1, "by_contrast": 2},
+        )
+
+    def test_threshold(self):
+        router = EngineRouter([], contrast_threshold=0.0)
+        self.assertEqual(router.engine("camera", scene()), "tesseract")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.metrics import (
+    PrometheusFileExporter,
+    RollingStats,
+    StageTimer,
+)
+
+
+class TestStageTimer(unittest.TestCase):
+    def test_stages_accumulate(self):
+        timer = StageTimer()
+        with timer.stage("ocr"):
+            time.sleep(0.01)
+        with timer.stage("ocr"):
+            time.sleep(0.01)
+        timer.add("output", 0.5)
+
+        self.assertGreaterEqual(timer.stages["ocr"], 0.02)
+        self.assertEqual(timer.stages["output"], 0.5)
+
+    def test_as_meta(self):
+        timer = StageTimer()
+        timer.add("routing", 0.0012345)
+        meta = timer.as_meta({"main": 0.25})
+
+        self.assertEqual(meta["routing_ms"], 1.234)
+        self.assertEqual(meta["ocr_topics_ms"], {"main": 250.0})
+        self.assertIn("total_ms", meta)
+        self.assertNotIn("ocr_topics_ms", StageTimer().as_meta())
+
+    def test_stage_recorded_on_error(self):
+        timer = StageTimer()
+        with self.assertRaises(RuntimeError):
+            with timer.stage("ocr"):
+                raise RuntimeError("engine failed")
+        self.assertIn("ocr", timer.stages)
+
+
+class TestRollingStats(unittest.TestCase):
+    def test_quantiles_use_window(self):
+        stats = RollingStats(window=100)
+        for value in range(1000):
+            stats.observe("ocr", float(value))
+
+        self.assertEqual(stats.counts["ocr"], 1000)
+        self.assertEqual(stats.sums["ocr"], sum(range(1000)))
+        quantiles = stats.quantiles("ocr")
+        # Only the last 100 samples, 900 to 999
+        self.assertAlmostEqual(quantiles[0.5], 949.5)
+        self.assertGreater(quantiles[0.99], 997)
+
+
+class TestPrometheusFileExporter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "metrics", "ocr.prom")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_write(self):
+        stats = RollingStats()
+        stats.observe("ocr", 0.5)
+        stats.observe("ocr", 1.5)
+        exporter = PrometheusFileExporter(self.path, interval=60.0)
+        self.assertFalse(exporter.due())
+
+        exporter.write(2, stats, {"result": 0.25}, {"dropped_records_total": 3})
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertIn("ocr_filter_frames_total 2", lines)
+        self.assertIn(
+            'ocr_filter_stage_seconds{stage="ocr",quantile="0.5"} 1.000000', lines
+        )
+        self.assertIn('ocr_filter_stage_seconds_sum{stage="ocr"} 2.000000', lines)
+        self.assertIn('ocr_filter_stage_seconds_count{stage="ocr"} 2', lines)
+        self.assertIn('ocr_filter_cache_hit_ratio{cache="result"} 0.250000', lines)
+        self.assertIn("ocr_filter_dropped_records_total 3", lines)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_due(self):
+        exporter = PrometheusFileExporter(self.path, interval=0.01)
+        time.sleep(0.02)
+        self.assertTrue(exporter.due())
+        exporter.write(0, RollingStats(), {}, {})
+        self.assertFalse(exporter.due())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.preprocessing import (
+    PreprocessPipeline,
+    PreprocessStep,
+)
+
+
+def color_image(height=400, width=800):
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+class TestPreprocessPipeline(unittest.TestCase):
+    def test_empty_pipeline(self):
+        image = color_image()
+        pipeline = PreprocessPipeline([])
+        self.assertFalse(pipeline)
+        result, scale = pipeline.apply(image)
+        self.assertIs(result, image)
+        self.assertEqual(scale, 1.0)
+
+    def test_grayscale_and_resize(self):
+        image = color_image()
+        result, scale = PreprocessPipeline(["grayscale", "resize=0.5"]).apply(image)
+        self.assertEqual(result.shape, (200, 400))
+        self.assertEqual(scale, 0.5)
+        # The input image is left untouched
+        self.assertEqual(image.shape, (400, 800, 3))
+
+    def test_max_side(self):
+        result, scale = PreprocessPipeline(["max_side=200"]).apply(color_image())
+        self.assertEqual(result.shape, (100, 200, 3))
+        self.assertEqual(scale, 0.25)
+
+        # Smaller images are not upscaled
+        small = color_image(50, 100)
+        result, scale = PreprocessPipeline(["max_side=200"]).apply(small)
+        self.assertIs(result, small)
+        self.assertEqual(scale, 1.0)
+
+    def test_resizes_combine(self):
+        _, scale = PreprocessPipeline(["resize=0.5", "max_side=200"]).apply(
+            color_image()
+        )
+        self.assertEqual(scale, 0.25)
+
+    def test_clahe_and_otsu(self):
+        result, _ = PreprocessPipeline(["clahe=3.0", "otsu"]).apply(color_image())
+        self.assertEqual(result.ndim, 2)
+        self.assertTrue(set(np.unique(result)) <= {0, 255})
+
+    def test_invalid_steps(self):
+        for steps in (
+            ["sharpen"],
+            ["resize"],
+            ["resize=0"],
+            ["max_side=big"],
+            ["otsu=1"],
+        ):
+            with self.assertRaises(ValueError, msg=steps):
+                PreprocessPipeline(steps)
+
+    def test_step_from_str(self):
+        self.assertEqual(
+            PreprocessStep.from_str(" Grayscale "), PreprocessStep.GRAYSCALE
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+import os
+import shlex
+import sys
+import unittest
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.profiles import (
+    EngineProfile,
+    ProfileRouter,
+    parse_profiles,
+)
+
+
+class TestEngineProfile(unittest.TestCase):
+    def test_tesseract_config(self):
+        profile = EngineProfile(psm=7, oem=1, allowlist="0123456789:")
+        self.assertEqual(
+            profile.tesseract_config(),
+            "--psm 7 --oem 1 -c tessedit_char_whitelist=0123456789:",
+        )
+        self.assertEqual(EngineProfile().tesseract_config(), "")
+
+    def test_allowlist_with_spaces_is_quoted(self):
+        config = EngineProfile(allowlist="A B").tesseract_config()
+        self.assertEqual(shlex.split(config), ["-c", "tessedit_char_whitelist=A B"])
+
+    def test_easyocr_kwargs(self):
+        profile = EngineProfile(psm=7, allowlist="0123", min_size=5, canvas_size=640)
+        self.assertEqual(
+            profile.easyocr_kwargs(),
+            {"allowlist": "0123", "min_size": 5, "canvas_size": 640},
+        )
+        self.assertEqual(EngineProfile().easyocr_kwargs(), {})
+
+
+class TestParseProfiles(unittest.TestCase):
+    def test_parse(self):
+        profiles = parse_profiles(
+            {"^score": {"psm": 7, "allowlist": "0123456789"}, "ticker": {"oem": 1}}
+        )
+        self.assertEqual([regex.pattern for regex, _ in profiles], ["^score", "ticker"])
+        self.assertEqual(profiles[0][1], EngineProfile(psm=7, allowlist="0123456789"))
+        self.assertEqual(profiles[1][1], EngineProfile(oem=1))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            parse_profiles({"[": {"psm": 7}})
+        with self.assertRaises(ValueError):
+            parse_profiles({"score": {"dpi": 300}})
+        with self.assertRaises(ValueError):
+            parse_profiles({"score": {"psm": 14}})
+        with self.assertRaises(ValueError):
+            parse_profiles({"score": {"canvas_size": 16}})
+        with self.assertRaises(TypeError):
+            parse_profiles({"score": {"psm": "7"}})
+        with self.assertRaises(TypeError):
+            parse_profiles({"score": {"allowlist": ""}})
+        with self.assertRaises(TypeError):
+            parse_profiles({"score": "psm=7"})
+
+
+class TestProfileRouter(unittest.TestCase):
+    def setUp(self):
+        self.router = ProfileRouter(
+            parse_profiles(
+                {
+                    r"\[clock\]$": {"psm": 7, "allowlist": "0123456789:"},
+                    "^score": {"psm": 7},
+                    "score": {"psm": 6},
+                }
+            )
+        )
+
+    def test_first_match_wins(self):
+        self.assertEqual(self.router.profile("scoreboard").psm, 7)
+        self.assertEqual(self.router.profile("main_score").psm, 6)
+        self.assertIsNone(self.router.profile("main"))
+
+    def test_roi_keys(self):
+        self.assertEqual(self.router.profile("main[clock]").allowlist, "0123456789:")
+        self.assertIsNone(self.router.profile("main[headline]"))
+
+    def test_empty(self):
+        router = ProfileRouter([])
+        self.assertFalse(router)
+        self.assertIsNone(router.profile("main"))
+
+
+if __name__ == "__main__":
+    unittest.main()
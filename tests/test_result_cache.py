@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+
+import cv2
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition import result_cache
+from filter_optical_character_recognition.result_cache import (
+    FingerprintMode,
+    OCRResultCache,
+    image_fingerprint,
+)
+
+
+class TestOCRResultCache(unittest.TestCase):
+    def create_image(self, text, offset=0):
+        """Helper method to create a white image with black text."""
+        image = np.ones((100, 300, 3), dtype=np.uint8) * 255
+        cv2.putText(
+            image,
+            text,
+            (10 + offset, 50),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            1,
+            (0, 0, 0),
+            2,
+            cv2.LINE_AA,
+        )
+        return image
+
+    def test_exact_fingerprint(self):
+        image = self.create_image("Hello")
+        self.assertEqual(
+            image_fingerprint(image, FingerprintMode.EXACT),
+            image_fingerprint(image.copy(), FingerprintMode.EXACT),
+        )
+        self.assertNotEqual(
+            image_fingerprint(image, FingerprintMode.EXACT),
+            image_fingerprint(self.create_image("World"), FingerprintMode.EXACT),
+        )
+        # Same content at a different size is a different key
+        self.assertNotEqual(
+            image_fingerprint(image, FingerprintMode.EXACT),
+            image_fingerprint(cv2.resize(image, (600, 200)), FingerprintMode.EXACT),
+        )
+
+    def test_hit_and_miss_counters(self):
+        cache = OCRResultCache(4)
+        image = self.create_image("Hello")
+        key = cache.fingerprint(image)
+
+        self.assertIsNone(cache.get("main", key))
+        cache.put("main", key, (["Hello"], [0.9]))
+        self.assertEqual(cache.get("main", key), (["Hello"], [0.9]))
+        # Results are kept per topic
+        self.assertIsNone(cache.get("region_0", key))
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertAlmostEqual(cache.hit_rate, 1 / 3)
+
+    def test_lru_eviction(self):
+        cache = OCRResultCache(2)
+        cache.put("main", b"a", (["a"], [1.0]))
+        cache.put("main", b"b", (["b"], [1.0]))
+        # Touch "a" so "b" becomes the least recently used entry
+        self.assertIsNotNone(cache.get("main", b"a"))
+        cache.put("main", b"c", (["c"], [1.0]))
+
+        self.assertIsNone(cache.get("main", b"b"))
+        self.assertIsNotNone(cache.get("main", b"a"))
+        self.assertIsNotNone(cache.get("main", b"c"))
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.stats()["entries"], 2)
+
+    def test_topics_are_bounded(self):
+        cache = OCRResultCache(2)
+        cache.put("main", b"a", (["a"], [1.0]))
+        for i in range(result_cache.MAX_CACHED_TOPICS + 10):
+            cache.put(f"main/roi_{i}", b"a", ([str(i)], [1.0]))
+            self.assertIsNotNone(cache.get("main", b"a"))
+        self.assertEqual(cache.stats()["entries"], result_cache.MAX_CACHED_TOPICS)
+        self.assertEqual(cache.evictions, 11)
+        self.assertIsNone(cache.get("main/roi_0", b"a"))
+
+    def test_phash_tolerance(self):
+        image = self.create_image("Hello")
+        noisy = image.copy()
+        noisy[0:2, 0:2] = 0
+
+        strict = OCRResultCache(4, FingerprintMode.PHASH, tolerance=0)
+        tolerant = OCRResultCache(4, FingerprintMode.PHASH, tolerance=6)
+        for cache in (strict, tolerant):
+            cache.put("main", cache.fingerprint(image), (["Hello"], [0.9]))
+
+        key = tolerant.fingerprint(noisy)
+        self.assertIsNotNone(tolerant.get("main", key))
+        self.assertIsNone(
+            tolerant.get("main", tolerant.fingerprint(self.create_image("Other text")))
+        )
+        if key != strict.fingerprint(image):
+            self.assertIsNone(strict.get("main", key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.rois import parse_rois, roi_job_key
+
+
+class TestParseRois(unittest.TestCase):
+    def test_plain_boxes_use_index_ids(self):
+        rois = parse_rois([[0, 0, 10, 10], [5, 5, 20, 30]], (100, 300, 3))
+        self.assertEqual(rois, [("0", (0, 0, 10, 10)), ("1", (5, 5, 20, 30))])
+
+    def test_dict_rois_keep_ids(self):
+        rois = parse_rois(
+            [{"id": "score", "box": [10.4, 20, 50, 40.6]}, {"box": [0, 0, 5, 5]}],
+            (100, 300, 3),
+        )
+        self.assertEqual(rois, [("score", (10, 20, 50, 41)), ("1", (0, 0, 5, 5))])
+
+    def test_boxes_are_clamped(self):
+        rois = parse_rois([[-10, -5, 400, 200]], (100, 300, 3))
+        self.assertEqual(rois, [("0", (0, 0, 300, 100))])
+
+    def test_malformed_rois_are_skipped(self):
+        rois = parse_rois(
+            [[0, 0, 10], {"id": "a"}, "box", [0, 0, 10, 10]], (100, 300, 3)
+        )
+        self.assertEqual(rois, [("3", (0, 0, 10, 10))])
+        self.assertEqual(parse_rois({"box": [0, 0, 1, 1]}, (100, 300, 3)), [])
+
+    def test_non_finite_and_empty_rois_are_skipped(self):
+        rois = parse_rois(
+            [
+                [0, 0, float("inf"), 10],
+                {"id": "big", "box": [0, 0, 1e400, 10]},
+                ["nan", 0, 10, 10],
+                [50, 10, 20, 40],
+                [0, 0, 0, 10],
+                [400, 0, 500, 10],
+                [0, 0, 10, 10],
+            ],
+            (100, 300, 3),
+        )
+        self.assertEqual(rois, [("6", (0, 0, 10, 10))])
+
+    def test_duplicate_ids_are_renamed(self):
+        rois = parse_rois(
+            [
+                {"id": "1", "box": [0, 0, 150, 100]},
+                [150, 0, 300, 100],
+                {"id": "1", "box": [0, 0, 10, 10]},
+            ],
+            (100, 300, 3),
+        )
+        self.assertEqual(
+            rois,
+            [
+                ("1", (0, 0, 150, 100)),
+                ("1#2", (150, 0, 300, 100)),
+                ("1#3", (0, 0, 10, 10)),
+            ],
+        )
+
+    def test_unnamed_box_does_not_take_a_later_explicit_id(self):
+        rois = parse_rois(
+            [[0, 0, 10, 10], {"id": "0", "box": [5, 5, 20, 20]}], (100, 300, 3)
+        )
+        self.assertEqual(rois, [("0#2", (0, 0, 10, 10)), ("0", (5, 5, 20, 20))])
+
+    def test_roi_job_key(self):
+        self.assertEqual(roi_job_key("main", "score"), "main[score]")
+
+
+if __name__ == "__main__":
+    unittest.main()
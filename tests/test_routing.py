@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition import routing
+from filter_optical_character_recognition.routing import TopicRouter
+
+
+class TestTopicRouter(unittest.TestCase):
+    def test_exclude_patterns(self):
+        router = TopicRouter(["face.*", "debug", "(unbalanced"])
+        self.assertTrue(router.selected("main"))
+        self.assertFalse(router.selected("face_1"))
+        self.assertFalse(router.selected("debug_view"))
+        # Exclude patterns are anchored at the start like re.match
+        self.assertTrue(router.selected("main_face"))
+        # Invalid regexes are exact topic names
+        self.assertFalse(router.selected("(unbalanced"))
+        self.assertTrue(router.selected("(unbalanced_2"))
+
+    def test_topic_pattern(self):
+        router = TopicRouter(["crop_3"], r"crop_\d")
+        self.assertFalse(router.selected("main"))
+        self.assertTrue(router.selected("crop_1"))
+        self.assertTrue(router.selected("left_crop_2"))
+        self.assertFalse(router.selected("crop_3"))
+
+    def test_decisions_are_cached(self):
+        router = TopicRouter(["face.*"], "main|crop")
+        calls = []
+        decide = router._decide
+        router._decide = lambda topic: calls.append(topic) or decide(topic)
+
+        for _ in range(100):
+            for topic in ("main", "face_1", "crop_1"):
+                router.selected(topic)
+        self.assertEqual(calls, ["main", "face_1", "crop_1"])
+
+        # New topics are decided when they first appear
+        self.assertTrue(router.selected("crop_2"))
+        self.assertEqual(calls[-1], "crop_2")
+
+    def test_cache_is_bounded(self):
+        router = TopicRouter([])
+        for i in range(routing.MAX_CACHED_TOPICS + 10):
+            self.assertTrue(router.selected(f"topic_{i}"))
+        self.assertLessEqual(len(router._decisions), routing.MAX_CACHED_TOPICS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+
+import gzip
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition import segments
+from filter_optical_character_recognition.segments import (
+    SegmentCompression,
+    SegmentedResultWriter,
+    find_records,
+    list_segments,
+    read_segment_index,
+)
+
+
+class TestSegmentedResultWriter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_path = os.path.join(self.temp_dir.name, "ocr_results")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_records(self, count, first=0):
+        return [
+            {
+                "topic": "main",
+                "frame_id": i,
+                "texts": [f"Frame {i}"],
+                "ocr_confidence": 0.9,
+                "timestamp": 1000.0 + i,
+            }
+            for i in range(first, first + count)
+        ]
+
+    def write_records(self, count, **kwargs):
+        writer = SegmentedResultWriter(self.base_path, **kwargs)
+        writer.open()
+        records = self.make_records(count)
+        for record in records:
+            writer.write(record)
+        writer.close()
+        return writer, records
+
+    def test_blocks_and_index(self):
+        writer, records = self.write_records(25, block_records=10)
+        self.assertEqual((writer.segments, writer.blocks, writer.records), (1, 3, 25))
+
+        [(seq, path)] = list_segments(self.base_path)
+        self.assertEqual(seq, 1)
+        self.assertTrue(path.endswith("ocr_results.000001.jsonl"))
+        index = read_segment_index(path)
+        self.assertEqual([entry["records"] for entry in index], [10, 10, 5])
+        self.assertEqual(index[1]["frame_ids"], [10, 19])
+        self.assertEqual(index[2]["timestamps"], [1020.0, 1024.0])
+
+        # Uncompressed segments stay plain JSON lines
+        with open(path, "r", encoding="utf-8") as f:
+            self.assertEqual([json.loads(line) for line in f], records)
+
+    def test_size_rotation(self):
+        writer, records = self.write_records(40, block_records=5, max_bytes=1)
+        self.assertEqual(writer.segments, 8)
+        segments = list_segments(self.base_path)
+        self.assertEqual([seq for seq, _ in segments], list(range(1, 9)))
+        self.assertEqual(list(find_records(self.base_path)), records)
+
+    def test_flush_writes_partial_block(self):
+        writer = SegmentedResultWriter(
+            self.base_path, compression=SegmentCompression.GZIP, block_records=10
+        )
+        writer.open()
+        self.addCleanup(writer.close)
+        records = self.make_records(3)
+        for record in records:
+            writer.write(record)
+        writer.flush()
+
+        # Readable before the block fills and without closing the writer
+        self.assertEqual(list(find_records(self.base_path)), records)
+        self.assertEqual(list(find_records(self.base_path, frame_id=1)), [records[1]])
+
+        # The next records start a new block of the same segment
+        more = self.make_records(2, first=3)
+        for record in more:
+            writer.write(record)
+        writer.flush()
+        [(_, path)] = list_segments(self.base_path)
+        self.assertEqual([e["records"] for e in read_segment_index(path)], [3, 2])
+        self.assertEqual(list(find_records(self.base_path)), records + more)
+
+    def test_time_rotation_on_flush(self):
+        now = [100.0]
+        with mock.patch.object(segments.time, "monotonic", lambda: now[0]):
+            writer = SegmentedResultWriter(self.base_path, max_seconds=60.0)
+            writer.open()
+            records = self.make_records(2)
+            for record in records:
+                writer.write(record)
+            writer.flush()
+            self.assertEqual(writer.segments, 1)
+
+            # No more records arrive, the next flush closes the expired segment
+            now[0] += 61.0
+            writer.flush()
+            self.assertEqual(writer.segments, 2)
+            writer.flush()
+            self.assertEqual(writer.segments, 2)
+
+            writer.close()
+        # The segment opened by the rotation held nothing and is removed
+        self.assertEqual([seq for seq, _ in list_segments(self.base_path)], [1])
+        self.assertEqual(writer.segments, 1)
+        self.assertEqual(list(find_records(self.base_path)), records)
+
+    def test_new_segment_on_restart(self):
+        self.write_records(3)
+        self.write_records(3)
+        self.assertEqual([seq for seq, _ in list_segments(self.base_path)], [1, 2])
+
+    def test_gzip_blocks(self):
+        _, records = self.write_records(
+            25, block_records=10, compression=SegmentCompression.GZIP
+        )
+        [(_, path)] = list_segments(self.base_path)
+        self.assertTrue(path.endswith(".jsonl.gz"))
+
+        # Blocks are gzip members, the segment is one valid gzip stream
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            self.assertEqual([json.loads(line) for line in f], records)
+
+        # A single block can be read on its own
+        entry = read_segment_index(path)[1]
+        with open(path, "rb") as f:
+            f.seek(entry["offset"])
+            block = gzip.decompress(f.read(entry["length"])).decode("utf-8")
+        self.assertEqual(len(block.splitlines()), 10)
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("zstandard"), "zstandard is not installed"
+    )
+    def test_zstd_blocks(self):
+        _, records = self.write_records(
+            25, block_records=10, compression=SegmentCompression.ZSTD
+        )
+        self.assertEqual(list(find_records(self.base_path)), records)
+
+    def test_find_records(self):
+        _, records = self.write_records(
+            50, block_records=10, compression=SegmentCompression.GZIP
+        )
+        self.assertEqual(list(find_records(self.base_path, frame_id=42)), [records[42]])
+        self.assertEqual(
+            list(find_records(self.base_path, start=1015.0, end=1024.5)),
+            records[15:25],
+        )
+        self.assertEqual(list(find_records(self.base_path, frame_id=999)), [])
+
+    def test_invalid_compression(self):
+        with self.assertRaises(ValueError):
+            SegmentCompression.from_str("lz4")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.sqlite_sink import (
+    SQLiteResultSink,
+    search_text,
+)
+from filter_optical_character_recognition.writers import BackgroundWriter
+
+
+class TestSQLiteResultSink(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "ocr_results.db")
+        self.sink = SQLiteResultSink(self.path)
+        self.sink.open()
+
+    def tearDown(self):
+        self.sink.close()
+        self.temp_dir.cleanup()
+
+    def write(self, topic, frame_id, texts, timestamp):
+        self.sink.write(
+            {
+                "topic": topic,
+                "frame_id": frame_id,
+                "texts": texts,
+                "ocr_confidence": 0.8,
+                "timestamp": timestamp,
+            }
+        )
+
+    def test_search(self):
+        self.write("main", 1, ["Breaking news", "Score 1 - 0"], 100.0)
+        self.write("main", 2, ["Weather"], 101.0)
+        self.write("ticker", 2, ["BREAKING: markets up"], 101.0)
+        self.write("main", 3, ["Goal! Score 2 - 0"], 102.0)
+
+        # Nothing is visible before the transaction is committed
+        self.assertEqual(search_text(self.path, "weather"), [])
+        self.sink.flush()
+        self.assertEqual(self.sink.records, 4)
+
+        rows = search_text(self.path, "breaking")
+        self.assertEqual(
+            [(r["topic"], r["frame_id"]) for r in rows], [("main", 1), ("ticker", 2)]
+        )
+        self.assertEqual(rows[0]["texts"], ["Breaking news", "Score 1 - 0"])
+        self.assertEqual(rows[0]["ocr_confidence"], 0.8)
+
+        self.assertEqual(len(search_text(self.path, "breaking", topic="ticker")), 1)
+        self.assertEqual(
+            [r["frame_id"] for r in search_text(self.path, "score", start=101.0)], [3]
+        )
+        # Phrases are matched as a whole, quotes do not break the query
+        self.assertEqual(search_text(self.path, "score news"), [])
+        self.assertEqual(search_text(self.path, 'say "hi"'), [])
+        self.assertEqual(len(search_text(self.path, "weather OR goal", raw=True)), 2)
+
+    def test_wal_mode(self):
+        conn = sqlite3.connect(self.path)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        conn.close()
+
+    def test_background_writer(self):
+        writer = BackgroundWriter(self.sink, batch_size=10, flush_interval=60.0)
+        writer.start()
+        for i in range(25):
+            writer.put(
+                {
+                    "topic": "main",
+                    "frame_id": i,
+                    "texts": [f"Frame {i}"],
+                    "ocr_confidence": 0.9,
+                    "timestamp": float(i),
+                }
+            )
+        writer.close()
+        self.assertEqual(self.sink.records, 25)
+        self.assertEqual(len(search_text(self.path, "frame", limit=1000)), 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+
+import importlib.machinery
+import multiprocessing
+import os
+import sys
+import threading
+import types
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition import tesseract_pool
+from filter_optical_character_recognition.tesseract_pool import (
+    TesseractWorkerPool,
+    _recognize,
+    _worker_main,
+)
+
+BLOCK, PARA, TEXTLINE, WORD = range(4)
+
+
+class WorkerKilled(BaseException):
+    """Ends a thread worker the way a crash ends a worker process."""
+
+
+class FakeWord:
+    """tesserocr iterator result at word level."""
+
+    def __init__(self, text, begins=(), bbox=(0, 0, 10, 10), conf=90.0):
+        self.text = text
+        self.begins = begins
+        self.bbox = bbox
+        self.conf = conf
+
+    def IsAtBeginningOf(self, level):
+        return level in self.begins
+
+    def BoundingBox(self, level):
+        return self.bbox
+
+    def Confidence(self, level):
+        return self.conf
+
+    def GetUTF8Text(self, level):
+        return self.text
+
+
+class FakeAPI:
+    """PyTessBaseAPI stand-in reporting the image and options it was given."""
+
+    fail_start = False
+
+    def __init__(self, lang="eng", path=None, words=None):
+        if FakeAPI.fail_start or lang == "missing":
+            raise RuntimeError(f"Failed loading language '{lang}'")
+        self.words = words
+        self.variables = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def SetImageBytes(self, data, width, height, bytes_per_pixel, bytes_per_line):
+        self.image = np.frombuffer(data, dtype=np.uint8)
+        self.layout = (width, height, bytes_per_pixel, bytes_per_line)
+
+    def SetPageSegMode(self, psm):
+        self.psm = psm
+
+    def SetVariable(self, name, value):
+        self.variables[name] = value
+
+    def Recognize(self):
+        if self.image[0] == 7:
+            raise ValueError("unreadable image")
+        if self.image[0] == 13:
+            raise WorkerKilled()
+
+    def GetIterator(self):
+        if self.words is not None:
+            return self.words
+        if not self.image.any():
+            return None
+        width, height, channels, _ = self.layout
+        return [
+            FakeWord(f"{width}x{height}x{channels}", (BLOCK, PARA, TEXTLINE)),
+            FakeWord(f"psm={self.psm}"),
+            FakeWord(self.variables["tessedit_char_whitelist"] or "all"),
+        ]
+
+
+def fake_tesserocr():
+    module = types.ModuleType("tesserocr")
+    module.__spec__ = importlib.machinery.ModuleSpec("tesserocr", None)
+    module.PyTessBaseAPI = FakeAPI
+    module.PSM = types.SimpleNamespace(AUTO=3)
+    module.RIL = types.SimpleNamespace(
+        BLOCK=BLOCK, PARA=PARA, TEXTLINE=TEXTLINE, WORD=WORD
+    )
+    module.iterate_level = lambda iterator, level: iter(iterator)
+    return module
+
+
+class ThreadProcess:
+    """The parts of a multiprocessing.Process that the pool uses, on a thread."""
+
+    def __init__(self, target, args, name):
+        self.name = name
+        self.thread = threading.Thread(target=target, args=args, daemon=True)
+        self.thread.start()
+
+    def join(self, timeout=None):
+        self.thread.join(timeout)
+
+    def is_alive(self):
+        return self.thread.is_alive()
+
+    def terminate(self):
+        pass
+
+
+class ThreadWorker(tesseract_pool._Worker):
+    """Pool worker running _worker_main on a thread of the test process."""
+
+    def __init__(self, ctx, lang, tessdata_dir, index):
+        self.conn, child_conn = multiprocessing.Pipe(duplex=True)
+        self.process = ThreadProcess(
+            self.serve, (child_conn, lang, tessdata_dir), f"tesseract-worker-{index}"
+        )
+
+    @staticmethod
+    def serve(conn, lang, tessdata_dir):
+        try:
+            _worker_main(conn, lang, tessdata_dir)
+        except WorkerKilled:
+            # Its end of the pipe closes with it
+            conn.close()
+
+
+class TestRecognize(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(sys.modules, {"tesserocr": fake_tesserocr()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_numbering_follows_tsv_output(self):
+        words = [
+            FakeWord("Open", (BLOCK, PARA, TEXTLINE)),
+            FakeWord("your"),
+            FakeWord("EYE", (TEXTLINE,)),
+            FakeWord("Second", (PARA, TEXTLINE)),
+            FakeWord("Other", (BLOCK, PARA, TEXTLINE), (5, 6, 25, 16), 40.0),
+        ]
+        data = _recognize(FakeAPI(words=words), np.ones((4, 4), dtype=np.uint8))
+
+        self.assertEqual(data["text"], ["Open", "your", "EYE", "Second", "Other"])
+        self.assertEqual(data["block_num"], [1, 1, 1, 1, 2])
+        self.assertEqual(data["par_num"], [1, 1, 1, 2, 1])
+        self.assertEqual(data["line_num"], [1, 1, 2, 1, 1])
+        self.assertEqual(data["word_num"], [1, 2, 1, 1, 1])
+        self.assertEqual(
+            (data["left"][4], data["top"][4], data["width"][4], data["height"][4]),
+            (5, 6, 20, 10),
+        )
+        self.assertEqual(data["conf"][4], 40.0)
+
+    def test_image_layout_and_options(self):
+        api = FakeAPI()
+        image = np.ones((20, 30, 3), dtype=np.uint8)[:, ::-1]
+        data = _recognize(api, image, psm=7, allowlist="0123456789")
+
+        self.assertEqual(api.layout, (30, 20, 3, 90))
+        self.assertEqual(data["text"], ["30x20x3", "psm=7", "0123456789"])
+
+        _recognize(api, np.ones((4, 4), dtype=np.uint8))
+        self.assertEqual(api.psm, 3)
+        self.assertEqual(api.variables["tessedit_char_whitelist"], "")
+
+    def test_no_text(self):
+        data = _recognize(FakeAPI(), np.zeros((4, 4), dtype=np.uint8))
+        self.assertEqual(set(data), set(tesseract_pool.DATA_KEYS))
+        self.assertFalse(any(data.values()))
+
+
+class TestWorkerMain(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(sys.modules, {"tesserocr": fake_tesserocr()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.conn, self.child_conn = multiprocessing.Pipe(duplex=True)
+        self.addCleanup(self.conn.close)
+
+    def start_worker(self, lang="eng"):
+        self.thread = threading.Thread(
+            target=_worker_main, args=(self.child_conn, lang, None), daemon=True
+        )
+        self.thread.start()
+
+    def request(self, image, psm=None, allowlist=None):
+        self.conn.send((image.shape, image.dtype.str, psm, allowlist))
+        self.conn.send_bytes(memoryview(np.ascontiguousarray(image)).cast("B"))
+        return self.conn.recv()
+
+    def test_pipe_protocol(self):
+        self.start_worker()
+        self.assertEqual(self.conn.recv(), ("ready", None))
+
+        status, data = self.request(np.ones((8, 12), dtype=np.uint8), 6, "AB")
+        self.assertEqual(status, "ok")
+        self.assertEqual(data["text"], ["12x8x1", "psm=6", "AB"])
+
+        # An engine error is reported and the worker keeps serving
+        status, message = self.request(np.full((4, 4), 7, dtype=np.uint8))
+        self.assertEqual((status, message), ("error", "ValueError: unreadable image"))
+        status, data = self.request(np.ones((2, 2, 3), dtype=np.uint8))
+        self.assertEqual(data["text"][0], "2x2x3")
+
+        self.conn.send(None)
+        self.thread.join(5)
+        self.assertFalse(self.thread.is_alive())
+        self.assertTrue(self.conn.poll(5))
+        with self.assertRaises(EOFError):
+            self.conn.recv()
+
+    def test_start_error(self):
+        self.start_worker("missing")
+        status, message = self.conn.recv()
+        self.assertEqual(status, "error")
+        self.assertIn("missing", message)
+        self.thread.join(5)
+
+
+class TestTesseractWorkerPool(unittest.TestCase):
+    def setUp(self):
+        patchers = [
+            mock.patch.dict(sys.modules, {"tesserocr": fake_tesserocr()}),
+            mock.patch.object(tesseract_pool, "_Worker", self.make_worker),
+            mock.patch.object(FakeAPI, "fail_start", False),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.spawned = 0
+        # Whether the pool lock was held when each worker was created
+        self.locked = []
+        self.pool = TesseractWorkerPool(2, "eng")
+        self.pool.start()
+        self.addCleanup(self.pool.close)
+
+    def make_worker(self, ctx, lang, tessdata_dir, index):
+        self.spawned += 1
+        self.locked.append(self.pool._lock.locked())
+        return ThreadWorker(ctx, lang, tessdata_dir, index)
+
+    def test_image_to_data(self):
+        data = self.pool.image_to_data(np.ones((10, 20), dtype=np.uint8), psm=7)
+        self.assertEqual(data["text"], ["20x10x1", "psm=7", "all"])
+
+    def test_not_started(self):
+        with self.assertRaises(RuntimeError):
+            TesseractWorkerPool(1, "eng").image_to_data(np.ones((4, 4), np.uint8))
+
+    def test_engine_error(self):
+        with self.assertRaisesRegex(RuntimeError, "unreadable image"):
+            self.pool.image_to_data(np.full((4, 4), 7, dtype=np.uint8))
+        self.assertEqual(self.spawned, 2)
+
+    def test_dead_worker_is_replaced(self):
+        workers = list(self.pool._workers)
+        with self.assertRaisesRegex(RuntimeError, "died"):
+            self.pool.image_to_data(np.full((4, 4), 13, dtype=np.uint8))
+
+        self.assertEqual(self.spawned, 3)
+        self.assertEqual(len(self.pool._workers), 2)
+        self.assertEqual(len(set(self.pool._workers) & set(workers)), 1)
+        # Spawned without holding the pool lock
+        self.assertEqual(self.locked, [False] * 3)
+        for _ in range(4):
+            data = self.pool.image_to_data(np.ones((4, 4), dtype=np.uint8))
+            self.assertEqual(data["text"][0], "4x4x1")
+
+    def test_failed_replacement_is_retried(self):
+        FakeAPI.fail_start = True
+        with self.assertRaises(RuntimeError):
+            self.pool.image_to_data(np.full((4, 4), 13, dtype=np.uint8))
+        # The dead worker stays in the pool until a replacement starts
+        self.assertEqual(len(self.pool._workers), 2)
+
+        FakeAPI.fail_start = False
+        for _ in range(4):
+            data = self.pool.image_to_data(np.ones((4, 4), dtype=np.uint8))
+            self.assertEqual(data["text"][0], "4x4x1")
+        self.assertEqual(self.spawned, 4)
+        self.assertTrue(all(w.process.is_alive() for w in self.pool._workers))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+
+import cv2
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.text_presence import (
+    TextPresenceFilter,
+    text_likelihood,
+)
+
+THRESHOLD = 0.08
+
+
+def camera_frame(height: int = 720, width: int = 1280) -> np.ndarray:
+    """Plain gray frame with sensor noise."""
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0, 6, (height, width, 3))
+    return (200 + noise).clip(0, 255).astype(np.uint8)
+
+
+class TestTextLikelihood(unittest.TestCase):
+    def test_text_scores_high(self):
+        image = np.full((100, 300, 3), 255, dtype=np.uint8)
+        cv2.putText(image, "Hello World", (10, 50), 0, 1, (0, 0, 0), 2)
+        self.assertGreater(text_likelihood(image), THRESHOLD)
+
+    def test_small_text_in_large_frame(self):
+        image = camera_frame(1080, 1920)
+        cv2.putText(image, "Exit", (900, 500), 0, 0.6, (30, 30, 30), 1)
+        self.assertGreater(text_likelihood(image), THRESHOLD)
+
+    def test_large_text(self):
+        image = camera_frame()
+        cv2.putText(image, "BIG", (100, 600), 0, 18, (0, 0, 0), 60)
+        self.assertGreater(text_likelihood(image), THRESHOLD)
+
+    def test_no_text_scores_low(self):
+        self.assertLess(text_likelihood(camera_frame()), THRESHOLD)
+        # A horizon and solid shapes have edges, but not stroke pairs
+        image = camera_frame()
+        image[:360] = 240
+        cv2.rectangle(image, (300, 400), (900, 700), (90, 60, 40), -1)
+        self.assertLess(text_likelihood(image), THRESHOLD)
+        gradient = np.tile(np.linspace(0, 255, 640).astype(np.uint8), (480, 1))
+        self.assertLess(text_likelihood(gradient), THRESHOLD)
+
+    def test_tiny_image(self):
+        self.assertEqual(text_likelihood(np.zeros((4, 4), dtype=np.uint8)), 0.0)
+
+
+class TestTextPresenceFilter(unittest.TestCase):
+    def test_counters(self):
+        text = np.full((100, 300), 255, dtype=np.uint8)
+        cv2.putText(text, "42", (10, 70), 0, 2, 0, 3)
+        prefilter = TextPresenceFilter(THRESHOLD)
+        self.assertTrue(prefilter.has_text(text))
+        self.assertFalse(prefilter.has_text(camera_frame()))
+        self.assertFalse(prefilter.has_text(camera_frame()))
+        self.assertEqual(
+            prefilter.stats(), {"passed": 1, "skipped": 2, "skip_rate": 0.6667}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
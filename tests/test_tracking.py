@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+
+import cv2
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition import tracking
+from filter_optical_character_recognition.tracking import TextTracker
+
+
+class CountingEngine:
+    """EasyOCREngine stand-in that finds dark text boxes and counts its calls."""
+
+    batch_size = 0
+
+    def __init__(self):
+        self.detect_calls = 0
+        self.recognized = 0
+
+    def detect(self, image):
+        self.detect_calls += 1
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        mask = (gray < 128).astype(np.uint8)
+        # Wide enough to join the words of a line, not the lines
+        mask = cv2.dilate(mask, np.ones((15, 41), np.uint8))
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        boxes = []
+        for contour in sorted(contours, key=lambda c: cv2.boundingRect(c)[1]):
+            x, y, w, h = cv2.boundingRect(contour)
+            boxes.append([x, x + w, y, y + h])
+        return gray, boxes, []
+
+    def crop_boxes(self, gray, horizontal_list, free_list):
+        x_min, x_max, y_min, y_max = horizontal_list[0]
+        return [(horizontal_list[0], gray[y_min:y_max, x_min:x_max])]
+
+    def recognize_crops(self, crops, batch_size=0):
+        self.recognized += len(crops)
+        return [(box, f"text@{int(crop.mean())}", 0.9) for box, crop in crops]
+
+    def collect(self, results):
+        return [t for _, t, _ in results], [c for _, _, c in results]
+
+
+class TestTextTracker(unittest.TestCase):
+    def create_image(self, texts, offset=0):
+        """Helper method to create an image with one text line per entry."""
+        image = np.ones((200, 400, 3), dtype=np.uint8) * 255
+        for i, text in enumerate(texts):
+            cv2.putText(
+                image,
+                text,
+                (20 + offset, 50 + i * 80),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (0, 0, 0),
+                2,
+            )
+        return image
+
+    def test_static_text_is_recognized_once(self):
+        engine = CountingEngine()
+        tracker = TextTracker(engine, detect_interval=5)
+        image = self.create_image(["Score 1 - 0", "Breaking news"])
+
+        results = [tracker.update("main", image) for _ in range(12)]
+
+        self.assertEqual(len(results[0][0]), 2)
+        self.assertTrue(all(result == results[0] for result in results))
+        # Detection every 5 frames, recognition only on the first frame
+        self.assertEqual(engine.detect_calls, 3)
+        self.assertEqual(engine.recognized, 2)
+
+    def test_scrolling_text_is_tracked(self):
+        engine = CountingEngine()
+        tracker = TextTracker(engine, detect_interval=10)
+
+        for offset in range(0, 12, 3):
+            texts, _ = tracker.update("main", self.create_image(["Ticker"], offset))
+            self.assertEqual(len(texts), 1)
+
+        self.assertEqual(engine.detect_calls, 1)
+        self.assertEqual(engine.recognized, 1)
+
+    def test_changed_text_is_recognized_again(self):
+        engine = CountingEngine()
+        tracker = TextTracker(engine, detect_interval=10, min_score=0.0)
+
+        tracker.update("main", self.create_image(["Score 1 - 0"]))
+        tracker.update("main", self.create_image(["Goal 2 - 0!"]))
+
+        self.assertEqual(engine.detect_calls, 1)
+        self.assertEqual(engine.recognized, 2)
+
+    def test_single_character_change_is_recognized_again(self):
+        for before, after in [
+            ("Score 1 - 0", "Score 1 - 1"),
+            ("Breaking news", "Breaking newt"),
+        ]:
+            engine = CountingEngine()
+            tracker = TextTracker(engine, detect_interval=10)
+
+            tracker.update("main", self.create_image([before]))
+            tracker.update("main", self.create_image([before]))
+            tracker.update("main", self.create_image([after]))
+
+            self.assertEqual(engine.detect_calls, 1, after)
+            self.assertEqual(engine.recognized, 2, after)
+
+    def test_keys_are_bounded(self):
+        engine = CountingEngine()
+        tracker = TextTracker(engine, detect_interval=1_000_000)
+        image = self.create_image(["Hi"])
+        tracker.update("main", image)
+        for i in range(tracking.MAX_CACHED_KEYS + 10):
+            tracker.update(f"main/roi_{i}", image)
+            tracker.update("main", image)
+        self.assertEqual(len(tracker._topics), tracking.MAX_CACHED_KEYS)
+        # "main" kept its tracks and was never detected again
+        self.assertEqual(engine.detect_calls, tracking.MAX_CACHED_KEYS + 11)
+
+    def test_lost_box_triggers_detection(self):
+        engine = CountingEngine()
+        tracker = TextTracker(engine, detect_interval=10)
+
+        tracker.update("main", self.create_image(["Caption"]))
+        texts, _ = tracker.update("main", self.create_image([]))
+
+        self.assertEqual(engine.detect_calls, 2)
+        self.assertEqual(texts, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
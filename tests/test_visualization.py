@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import time
+import unittest
+
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.visualization import (
+    VisualizationRenderer,
+    draw_texts,
+)
+
+
+class TestVisualizationRenderer(unittest.TestCase):
+    def setUp(self):
+        self.image = np.zeros((200, 400, 3), dtype=np.uint8)
+        self.image.flags.writeable = False
+
+    def wait_for_render(self, renderer):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            image = renderer.latest()
+            if image is not None:
+                return image
+            time.sleep(0.01)
+        self.fail("Nothing was rendered")
+
+    def test_resize_before_drawing(self):
+        renderer = VisualizationRenderer(resize_factor=0.5)
+        image = renderer.render(renderer.resize(self.image), ("HELLO",))
+        self.assertEqual(image.shape, (100, 200, 3))
+        green = np.all(image == (0, 255, 0), axis=2)
+        self.assertTrue(green.any())
+        # Text is drawn as a list from the top
+        self.assertFalse(green[60:].any())
+
+    def test_no_texts(self):
+        renderer = VisualizationRenderer()
+        image = renderer.render(renderer.resize(self.image), ())
+        self.assertFalse(image.any())
+
+    def test_overlay_reused_while_texts_unchanged(self):
+        renderer = VisualizationRenderer()
+        first = renderer.render(renderer.resize(self.image), ("A", "B"))
+        second = renderer.render(renderer.resize(self.image), ("A", "B"))
+        renderer.render(renderer.resize(self.image), ("C",))
+        np.testing.assert_array_equal(first, second)
+        self.assertEqual(renderer.overlay_hits, 1)
+        self.assertEqual(renderer.overlay_misses, 2)
+
+    def test_draw_texts_matches_renderer(self):
+        renderer = VisualizationRenderer(resize_factor=0.5, text_scale_factor=2.0)
+        expected = renderer.render(renderer.resize(self.image), ("A", "B"))
+        image = draw_texts(self.image, ["A", "B"], 0.5, 2.0)
+        np.testing.assert_array_equal(image, expected)
+        # Drawn on a copy, without starting a render thread
+        self.assertFalse(self.image.any())
+        self.assertEqual(renderer.stats()["submitted"], 0)
+
+    def test_background_rendering(self):
+        renderer = VisualizationRenderer()
+        renderer.start()
+        try:
+            self.assertIsNone(renderer.latest())
+            self.assertTrue(renderer.submit(1, self.image, ["HELLO"]))
+            image = self.wait_for_render(renderer)
+        finally:
+            renderer.close()
+        self.assertTrue(np.all(image == (0, 255, 0), axis=2).any())
+        # The source image is never drawn on
+        self.assertFalse(self.image.any())
+
+    def test_first_frame_is_drawn_at_once(self):
+        renderer = VisualizationRenderer(resize_factor=0.5)
+        try:
+            self.assertIsNone(renderer.latest())
+            # No render thread, the frame is still available right away
+            self.assertTrue(renderer.submit(1, self.image, ["HELLO"]))
+            image = renderer.latest()
+        finally:
+            renderer.close()
+        np.testing.assert_array_equal(image, draw_texts(self.image, ["HELLO"], 0.5))
+
+    def test_rate_limit(self):
+        renderer = VisualizationRenderer(max_fps=0.01)
+        renderer.start()
+        try:
+            self.assertTrue(renderer.submit(1, self.image, ["A"]))
+            self.assertFalse(renderer.submit(2, self.image, ["A"]))
+        finally:
+            renderer.close()
+        self.assertEqual(renderer.stats()["rate_limited"], 1)
+        self.assertEqual(renderer.stats()["submitted"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
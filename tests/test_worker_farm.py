@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import unittest
+
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.profiles import EngineProfile
+from filter_optical_character_recognition.worker_farm import (
+    OCRWorkerFarm,
+    affinity_sets,
+)
+
+
+class FakeEngine:
+    """Picklable engine reporting what each worker saw."""
+
+    def __init__(self):
+        self.started_in = None
+
+    def start(self):
+        self.started_in = os.getpid()
+
+    def warm_up(self):
+        pass
+
+    def recognize(self, image, profile=None, engine=None):
+        if image.size == 0:
+            raise ValueError("empty image")
+        if image.flat[0] == 13:
+            os.kill(os.getpid(), signal.SIGKILL)
+        texts = [f"{image.shape}", str(self.started_in)]
+        if profile:
+            texts.append(profile.tesseract_config())
+        if engine:
+            texts.append(engine)
+        return texts, [float(image.sum())]
+
+    def recognize_detail(self, image, profile=None, engine=None):
+        texts, confidences = self.recognize(image, profile, engine)
+        return texts, confidences, sorted(os.sched_getaffinity(0))
+
+    def close(self):
+        pass
+
+
+def wait_for_replacement(farm, pids, timeout=60.0):
+    """Wait until a worker restarted in the background has joined the farm."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        current = farm.pids()
+        if len(current) == len(pids) and current != pids:
+            return current
+        time.sleep(0.05)
+    raise AssertionError("OCR worker was not replaced")
+
+
+class TestAffinitySets(unittest.TestCase):
+    def test_split(self):
+        self.assertEqual(affinity_sets([0, 1, 2, 3], 2), [{0, 1}, {2, 3}])
+        self.assertEqual(affinity_sets([0, 1, 2], 2), [{0, 1}, {2}])
+        self.assertEqual(affinity_sets([4, 5], 3), [{4}, {5}, {4}])
+        self.assertEqual(affinity_sets([], 2), [set(), set()])
+
+
+class TestOCRWorkerFarm(unittest.TestCase):
+    def setUp(self):
+        self.farm = OCRWorkerFarm(FakeEngine(), 2)
+        self.farm.start()
+
+    def tearDown(self):
+        self.farm.close()
+
+    def test_results_in_order(self):
+        images = [np.full((10 + i, 20, 3), i, dtype=np.uint8) for i in range(5)]
+        results = self.farm.map(images)
+        self.assertEqual(len(results), 5)
+        for i, (texts, confidences) in enumerate(results):
+            self.assertEqual(texts[0], f"({10 + i}, 20, 3)")
+            self.assertEqual(confidences, [float(images[i].sum())])
+            # Started by the worker itself
+            self.assertIn(int(texts[1]), self.farm.pids())
+
+    def test_views_and_growing_slots(self):
+        frame = np.arange(2000 * 1500 * 3, dtype=np.uint32).reshape(2000, 1500, 3)
+        crop = frame[10:50, 20:90]
+        results = self.farm.map([crop, frame, crop])
+        self.assertEqual(results[0][1], [float(crop.sum())])
+        self.assertEqual(results[1][1], [float(frame.sum())])
+        self.assertEqual(results[2][1], [float(crop.sum())])
+
+    def test_detail_and_timed(self):
+        image = np.ones((8, 8), dtype=np.uint8)
+        ((result, seconds),) = self.farm.map([image], detail=True, timed=True)
+        self.assertEqual(len(result), 3)
+        self.assertGreaterEqual(seconds, 0.0)
+
+    def test_profiles(self):
+        images = [np.ones((4, 4), dtype=np.uint8)] * 2
+        results = self.farm.map(images, profiles=[EngineProfile(psm=7), None])
+        self.assertEqual(results[0][0][2], "--psm 7")
+        self.assertEqual(len(results[1][0]), 2)
+
+    def test_engines(self):
+        images = [np.ones((4, 4), dtype=np.uint8)] * 2
+        results = self.farm.map(
+            images,
+            profiles=[EngineProfile(psm=7), None],
+            engines=["tesseract", "easyocr"],
+        )
+        self.assertEqual(results[0][0][2:], ["--psm 7", "tesseract"])
+        self.assertEqual(results[1][0][2:], ["easyocr"])
+
+    def test_engine_error(self):
+        images = [np.ones((4, 4), dtype=np.uint8), np.ones((0, 4), dtype=np.uint8)]
+        with self.assertRaises(RuntimeError):
+            self.farm.map(images)
+        # Both workers are still usable
+        self.assertEqual(len(self.farm.map(images[:1] * 4)), 4)
+
+    def test_dead_worker_is_replaced(self):
+        pids = self.farm.pids()
+        image = np.ones((4, 4), dtype=np.uint8)
+        results = self.farm.map([np.full((4, 4), 13, dtype=np.uint8), image, image])
+        # Only the image that killed its worker fails
+        self.assertEqual(results[0], ([], []))
+        self.assertEqual(results[1][1], [16.0])
+        self.assertEqual(results[2][1], [16.0])
+
+        wait_for_replacement(self.farm, pids)
+        self.assertEqual(len(self.farm.map([image] * 3)), 3)
+
+    def test_map_does_not_wait_for_replacement(self):
+        farm = OCRWorkerFarm(FakeEngine(), 1)
+        farm.start()
+        try:
+            pids = farm.pids()
+            image = np.ones((4, 4), dtype=np.uint8)
+            ((result, seconds),) = farm.map(
+                [np.full((4, 4), 13, dtype=np.uint8)], timed=True
+            )
+            self.assertEqual((result, seconds), (([], []), 0.0))
+            # The only worker is still starting in the background
+            self.assertEqual(farm.map([image, image]), [([], []), ([], [])])
+
+            wait_for_replacement(farm, pids)
+            self.assertEqual(farm.map([image])[0][1], [16.0])
+        finally:
+            farm.close()
+
+    def test_not_started(self):
+        farm = OCRWorkerFarm(FakeEngine(), 1)
+        with self.assertRaises(RuntimeError):
+            farm.map([np.ones((4, 4), dtype=np.uint8)])
+
+
+@unittest.skipUnless(hasattr(os, "sched_setaffinity"), "CPU affinity not supported")
+class TestOCRWorkerFarmAffinity(unittest.TestCase):
+    def test_workers_are_pinned(self):
+        cpu = min(os.sched_getaffinity(0))
+        farm = OCRWorkerFarm(FakeEngine(), 2, cpus=[cpu], threads=1)
+        farm.start()
+        try:
+            results = farm.map([np.ones((4, 4), dtype=np.uint8)] * 2, detail=True)
+        finally:
+            farm.close()
+        self.assertEqual([result[2] for result in results], [[cpu], [cpu]])
+
+
+@unittest.skipUnless(
+    "fork" in multiprocessing.get_all_start_methods(), "fork is not available"
+)
+class TestOCRWorkerFarmFork(unittest.TestCase):
+    def test_engine_is_shared(self):
+        farm = OCRWorkerFarm(FakeEngine(), 2, share_models=True)
+        farm.start()
+        try:
+            results = farm.map([np.ones((4, 4), dtype=np.uint8)] * 2)
+            pids = farm.pids()
+        finally:
+            farm.close()
+        # Loaded once in the fork server, not in this process or the workers
+        server = pids[-1]
+        self.assertNotEqual(server, os.getpid())
+        self.assertEqual([texts[1] for texts, _ in results], [str(server)] * 2)
+
+    def test_dead_shared_worker_is_replaced(self):
+        farm = OCRWorkerFarm(FakeEngine(), 1, share_models=True)
+        farm.start()
+        try:
+            pids = farm.pids()
+            farm.map([np.full((4, 4), 13, dtype=np.uint8)])
+            wait_for_replacement(farm, pids)
+            ((texts, _),) = farm.map([np.ones((4, 4), dtype=np.uint8)])
+            self.assertNotEqual(farm.pids()[0], pids[0])
+            # Forked again from the same server
+            self.assertEqual(texts[1], str(pids[-1]))
+        finally:
+            farm.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
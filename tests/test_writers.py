@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from filter_optical_character_recognition.writers import (
+    BackgroundWriter,
+    FsyncPolicy,
+    SubjectDataFormat,
+    SubjectDataWriter,
+    read_subject_data,
+)
+
+
+class TestSubjectDataWriter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.records = [
+            {"meta": {"id": i, "ocr_texts": [f"Frame {i}", "ünïcode"]}}
+            for i in range(1, 4)
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, fmt, records, close=True):
+        path = os.path.join(self.temp_dir.name, f"subject_data.{fmt.value}")
+        writer = SubjectDataWriter(path, fmt)
+        writer.open()
+        for record in records:
+            writer.write(record)
+        if close:
+            writer.close()
+        return path, writer
+
+    def test_json_matches_json_dump(self):
+        for records in ([], self.records):
+            path, _ = self.write(SubjectDataFormat.JSON, records)
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertEqual(f.read(), json.dumps(records, indent=4))
+
+    def test_jsonl(self):
+        path, writer = self.write(SubjectDataFormat.JSONL, self.records)
+        self.assertEqual(writer.records, 3)
+        with open(path, "r", encoding="utf-8") as f:
+            self.assertEqual([json.loads(line) for line in f], self.records)
+
+    def test_records_are_on_disk_before_close(self):
+        for fmt in SubjectDataFormat:
+            path, writer = self.write(fmt, self.records, close=False)
+            self.assertEqual(read_subject_data(path), self.records)
+            writer.close()
+            self.assertEqual(read_subject_data(path), self.records)
+
+    def test_read_truncated_file(self):
+        path, _ = self.write(SubjectDataFormat.JSON, self.records)
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        # Crash in the middle of the last record
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text[: text.rindex('"Frame 3"')])
+        self.assertEqual(read_subject_data(path), self.records[:2])
+
+        path, _ = self.write(SubjectDataFormat.JSONL, self.records)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"meta": {"id"')
+        self.assertEqual(read_subject_data(path), self.records)
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            SubjectDataFormat.from_str("csv")
+
+
+class BlockingFile:
+    """File stand-in whose writes wait until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.lines = []
+        self.flushes = 0
+
+    def write(self, line):
+        self.release.wait(5)
+        self.lines.append(line)
+
+    def flush(self):
+        self.flushes += 1
+
+    def fileno(self):
+        raise AssertionError("fsync was not requested")
+
+
+class TestBackgroundWriter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "output.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_close_drains_queue(self):
+        for fsync in FsyncPolicy:
+            with open(self.path, "w", encoding="utf-8") as f:
+                writer = BackgroundWriter(f, batch_size=7, fsync=fsync)
+                writer.start()
+                for i in range(100):
+                    self.assertTrue(writer.put(f"{i}\n"))
+                writer.close()
+                self.assertEqual(writer.stats()["written"], 100)
+                self.assertEqual(writer.depth, 0)
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.assertEqual(f.read().split(), [str(i) for i in range(100)])
+
+    def test_full_queue_drops_records(self):
+        target = BlockingFile()
+        writer = BackgroundWriter(target, max_queue=2, batch_size=1)
+        writer.start()
+        results = [writer.put(f"{i}\n") for i in range(10)]
+        target.release.set()
+        writer.close()
+
+        # One record may already be held by the writer thread
+        accepted = [f"{i}\n" for i, queued in enumerate(results) if queued]
+        self.assertIn(len(accepted), (2, 3))
+        self.assertEqual(writer.dropped, 10 - len(accepted))
+        self.assertEqual(target.lines, accepted)
+        self.assertLessEqual(writer.max_depth, 2)
+
+    def test_flush_interval_batches_flushes(self):
+        target = BlockingFile()
+        target.release.set()
+        writer = BackgroundWriter(target, flush_interval=60.0)
+        writer.start()
+        for i in range(50):
+            writer.put(f"{i}\n")
+        writer.close()
+
+        self.assertEqual(len(target.lines), 50)
+        # Nothing is flushed before the interval, only the final flush on close
+        self.assertEqual(target.flushes, 1)
+
+    def test_subject_data_through_writer(self):
+        subject_writer = SubjectDataWriter(self.path, autoflush=False)
+        subject_writer.open()
+        writer = BackgroundWriter(subject_writer, flush_interval=0.0)
+        writer.start()
+        records = [{"meta": {"id": i}} for i in range(5)]
+        for record in records:
+            writer.put(record)
+        writer.close()
+        subject_writer.close()
+        self.assertEqual(read_subject_data(self.path), records)
+
+
+if __name__ == "__main__":
+    unittest.main()